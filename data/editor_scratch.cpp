@@ -0,0 +1 @@
+int main() {}
\ No newline at end of file
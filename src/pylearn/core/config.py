@@ -42,7 +42,7 @@ def _load_json(path: Path) -> dict[str, Any]:
             if isinstance(data, dict):
                 return data
         except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
-            logger.error(f"Corrupt config file {path}: {e} — using defaults")
+            logger.error("Corrupt config file %s: %s — using defaults", path, e)
     return {}
 
 
@@ -40,6 +40,11 @@ class Database:
         # if the app crashes mid-write, SQLite replays the WAL on next open.
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA foreign_keys=ON")
+        # The dialogs re-read the same tables on every open; a 64 MiB page
+        # cache and memory-mapped reads keep those repeat queries off disk.
+        self._conn.execute("PRAGMA cache_size=-65536")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
 
         self._init_db()
 
@@ -124,6 +129,18 @@ class Database:
             ).fetchall()
             return [dict(r) for r in rows]
 
+    def get_all_chapters(self, book_ids: list[str]) -> list[dict]:
+        """Fetch the chapters of several books in one query, ordered by book then chapter."""
+        if not book_ids:
+            return []
+        placeholders = ", ".join("?" * len(book_ids))
+        with self._transaction() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM chapters WHERE book_id IN ({placeholders}) ORDER BY book_id, chapter_num",
+                book_ids,
+            ).fetchall()
+            return [dict(r) for r in rows]
+
     # --- Reading Progress ---
 
     def get_reading_progress(self, book_id: str, chapter_num: int) -> dict | None:
@@ -226,6 +243,29 @@ class Database:
                 rows = conn.execute("SELECT * FROM bookmarks ORDER BY created_at DESC").fetchall()
             return [dict(r) for r in rows]
 
+    def get_bookmarks_by_chapter(self, book_id: str) -> list[dict]:
+        """Fetch a book's bookmarks in reading order: by chapter, then oldest first."""
+        with self._transaction() as conn:
+            rows = conn.execute(
+                """SELECT * FROM bookmarks WHERE book_id = ?
+                   ORDER BY chapter_num, created_at, bookmark_id""",
+                (book_id,),
+            ).fetchall()
+            return [dict(r) for r in rows]
+
+    def has_notes_or_bookmarks(self, book_id: str | None = None) -> bool:
+        """Return True if there is any note or bookmark, in *book_id* or in any book."""
+        with self._transaction() as conn:
+            if book_id:
+                row = conn.execute(
+                    """SELECT EXISTS(SELECT 1 FROM notes WHERE book_id = ?)
+                           OR EXISTS(SELECT 1 FROM bookmarks WHERE book_id = ?)""",
+                    (book_id, book_id),
+                ).fetchone()
+            else:
+                row = conn.execute("SELECT EXISTS(SELECT 1 FROM notes) OR EXISTS(SELECT 1 FROM bookmarks)").fetchone()
+            return bool(row[0])
+
     def delete_bookmark(self, bookmark_id: int) -> None:
         with self._transaction() as conn:
             conn.execute("DELETE FROM bookmarks WHERE bookmark_id = ?", (bookmark_id,))
@@ -265,6 +305,42 @@ class Database:
                 rows = conn.execute("SELECT * FROM notes ORDER BY created_at DESC").fetchall()
             return [dict(r) for r in rows]
 
+    def get_notes_by_chapter(self, book_id: str) -> list[dict]:
+        """Fetch a book's notes in reading order: by chapter, then oldest first."""
+        with self._transaction() as conn:
+            rows = conn.execute(
+                """SELECT * FROM notes WHERE book_id = ?
+                   ORDER BY chapter_num, created_at, note_id""",
+                (book_id,),
+            ).fetchall()
+            return [dict(r) for r in rows]
+
+    def get_notes_page(self, book_id: str | None, chapter_num: int | None, offset: int, limit: int) -> list[dict]:
+        """Fetch one page of notes, newest first, for incremental loading.
+
+        Filters like get_notes(). note_id breaks created_at ties so that
+        consecutive pages never overlap or skip rows.
+        """
+        with self._transaction() as conn:
+            if book_id and chapter_num is not None:
+                rows = conn.execute(
+                    """SELECT * FROM notes WHERE book_id = ? AND chapter_num = ?
+                       ORDER BY created_at DESC, note_id DESC LIMIT ? OFFSET ?""",
+                    (book_id, chapter_num, limit, offset),
+                ).fetchall()
+            elif book_id:
+                rows = conn.execute(
+                    """SELECT * FROM notes WHERE book_id = ?
+                       ORDER BY created_at DESC, note_id DESC LIMIT ? OFFSET ?""",
+                    (book_id, limit, offset),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM notes ORDER BY created_at DESC, note_id DESC LIMIT ? OFFSET ?",
+                    (limit, offset),
+                ).fetchall()
+            return [dict(r) for r in rows]
+
     def delete_note(self, note_id: int) -> None:
         with self._transaction() as conn:
             conn.execute("DELETE FROM notes WHERE note_id = ?", (note_id,))
@@ -332,16 +408,14 @@ class Database:
         with self._transaction() as conn:
             row = conn.execute(
                 """SELECT
-                       COUNT(*) AS total,
-                       SUM(CASE WHEN ep.completed = 1 THEN 1 ELSE 0 END) AS completed
+                       COUNT(*) FILTER (WHERE ep.completed = 1) AS completed,
+                       COUNT(*) AS total
                    FROM exercises e
-                   LEFT JOIN exercise_progress ep ON e.exercise_id = ep.exercise_id
+                   LEFT JOIN exercise_progress ep USING (exercise_id)
                    WHERE e.book_id = ?""",
                 (book_id,),
             ).fetchone()
-            total = row[0] if row else 0
-            completed = row[1] if row else 0
-            return (completed, total)
+            return (row["completed"], row["total"])
 
     def update_exercise_progress(self, exercise_id: str, completed: bool, user_code: str = "") -> None:
         now = datetime.now().isoformat()
@@ -685,8 +759,11 @@ CREATE TABLE IF NOT EXISTS project_progress (
 CREATE INDEX IF NOT EXISTS idx_quiz_progress_book ON quiz_progress(book_id, chapter_num);
 CREATE INDEX IF NOT EXISTS idx_challenge_progress_book ON challenge_progress(book_id, chapter_num);
 CREATE INDEX IF NOT EXISTS idx_project_progress_book ON project_progress(book_id);
-CREATE INDEX IF NOT EXISTS idx_bookmarks_book ON bookmarks(book_id);
-CREATE INDEX IF NOT EXISTS idx_notes_book ON notes(book_id, chapter_num);
+CREATE INDEX IF NOT EXISTS idx_bookmarks_book_chapter ON bookmarks(book_id, chapter_num, created_at);
+CREATE INDEX IF NOT EXISTS idx_notes_book_chapter_created ON notes(book_id, chapter_num, created_at);
+-- Superseded by the two indexes above, which start with the same columns
+DROP INDEX IF EXISTS idx_bookmarks_book;
+DROP INDEX IF EXISTS idx_notes_book;
 CREATE INDEX IF NOT EXISTS idx_exercises_book ON exercises(book_id, chapter_num);
 CREATE INDEX IF NOT EXISTS idx_exercise_progress_exercise ON exercise_progress(exercise_id);
 CREATE INDEX IF NOT EXISTS idx_saved_code_book ON saved_code(book_id, chapter_num);
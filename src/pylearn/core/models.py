@@ -59,9 +59,12 @@ class FontSpan:
     y1: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentBlock:
-    """A classified block of content (heading, body text, code, etc.)."""
+    """A classified block of content (heading, body text, code, etc.).
+
+    Uses ``__slots__`` since a parsed book holds many thousands of blocks.
+    """
 
     block_type: BlockType
     text: str
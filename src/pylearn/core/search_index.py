@@ -0,0 +1,151 @@
+# Copyright (c) 2026 Nate Tritle. Licensed under the MIT License.
+"""In-memory full-text index over the content blocks of loaded books."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+
+from pylearn.core.models import BlockType, Book
+
+# Joins block texts in the corpus. Queries never contain it, so a match
+# can never span two blocks.
+_SEP = "\0"
+
+
+def _char_mask(text: str) -> int:
+    """Return a 64-bit mask with one bit set per character bucket in *text*.
+
+    If any bit of a query's mask is missing from a text's mask, the query
+    can't occur in that text. Buckets are ``ord(c) & 63``, so distinct
+    characters may share a bit; the test can only pass falsely, never
+    reject a real match.
+    """
+    mask = 0
+    for c in set(text):
+        mask |= 1 << (ord(c) & 63)
+    return mask
+
+
+class SearchIndex:
+    """Case-insensitive substring search across many books.
+
+    Every block's case-folded text is joined into one corpus string when the
+    index is built, so a search is a series of C-level ``str.find`` calls
+    that jump from match to match instead of a Python loop over every block.
+
+    Block metadata is stored as parallel arrays indexed by block position
+    (``book_ids[i]``, ``texts[i]``, ...) rather than as per-block objects,
+    so a hit costs a few list lookups and no attribute access.
+    """
+
+    def __init__(self, books: list[Book]) -> None:
+        self.book_ids: list[str] = []
+        self.chapter_nums = array("i")
+        self.chapter_titles: list[str] = []
+        self.block_ids: list[str] = []
+        self.block_types: list[BlockType] = []
+        self.texts: list[str] = []  # original case, for snippets
+
+        # Corpus offset where each block's text starts, plus one past the end
+        self._starts: list[int] = []
+        # book_id -> (first corpus offset, end corpus offset) of its blocks
+        self._book_spans: dict[str, tuple[int, int]] = {}
+        # book_id -> _char_mask() of its case-folded text
+        self._book_masks: dict[str, int] = {}
+        # Blocks whose case-folded text differs in length from the original
+        # ("ß" -> "ss"), so corpus offsets into them need mapping back
+        self._resized: set[int] = set()
+        folded: list[str] = []
+        pos = 0
+        for book in books:
+            book_id = book.book_id
+            book_start = pos
+            for chapter in book.chapters:
+                for block in chapter.content_blocks:
+                    fold = block.text.casefold()
+                    if len(fold) != len(block.text):
+                        self._resized.add(len(self.texts))
+                    self.book_ids.append(book_id)
+                    self.chapter_nums.append(chapter.chapter_num)
+                    self.chapter_titles.append(chapter.title)
+                    self.block_ids.append(block.block_id)
+                    self.block_types.append(block.block_type)
+                    self.texts.append(block.text)
+                    self._starts.append(pos)
+                    folded.append(fold)
+                    pos += len(fold) + len(_SEP)
+            if pos > book_start:
+                self._book_spans[book_id] = (book_start, pos - len(_SEP))
+        self._starts.append(pos)
+        self._corpus = _SEP.join(folded)
+        for book_id, (start, end) in self._book_spans.items():
+            self._book_masks[book_id] = _char_mask(self._corpus[start:end])
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def scan(self, query: str, book_id: str | None = None, limit: int | None = None) -> list[tuple[int, int]]:
+        """Return ``(block_index, match_index)`` for each block containing *query*.
+
+        Matching is by ``str.casefold()``, so "STRASSE" also finds "Straße".
+        *match_index* is an offset into the original ``texts[block_index]``.
+        Only the first match per block is reported. Blocks come out in book
+        and chapter order. *book_id* restricts the search to one book and
+        *limit* caps the number of hits returned.
+
+        Books whose character mask rules the query out are skipped without
+        being scanned.
+        """
+        query = query.casefold()
+        if not query or _SEP in query:
+            return []
+        if limit is not None and limit <= 0:
+            return []
+        qmask = _char_mask(query)
+        if book_id is None:
+            spans = [span for bid, span in self._book_spans.items() if (self._book_masks[bid] & qmask) == qmask]
+        elif book_id in self._book_spans and (self._book_masks[book_id] & qmask) == qmask:
+            spans = [self._book_spans[book_id]]
+        else:
+            return []
+        if not spans:
+            return []
+
+        hits: list[tuple[int, int]] = []
+        for pos, end in spans:
+            hits += self._scan_corpus(query, pos, end, None if limit is None else limit - len(hits))
+            if len(hits) == limit:
+                break
+        return hits
+
+    def _scan_corpus(self, query: str, pos: int, end: int, limit: int | None) -> list[tuple[int, int]]:
+        """Linear scan of the corpus window [pos, end)."""
+        hits: list[tuple[int, int]] = []
+        # Everything per hit is a C call (find, bisect) or a local lookup
+        find = self._corpus.find
+        starts = self._starts
+        resized = self._resized
+        append = hits.append
+        while True:
+            pos = find(query, pos, end)
+            if pos < 0:
+                break
+            i = bisect_right(starts, pos) - 1
+            append((i, self._original_offset(i, pos - starts[i]) if i in resized else pos - starts[i]))
+            if len(hits) == limit:
+                break
+            pos = starts[i + 1]  # skip to the next block
+        return hits
+
+    def _original_offset(self, i: int, folded_offset: int) -> int:
+        """Map an offset into block *i*'s case-folded text back to its original text.
+
+        An offset inside a character's expansion maps to that character.
+        """
+        pos = 0
+        for k, c in enumerate(self.texts[i]):
+            pos += len(c.casefold())
+            if pos > folded_offset:
+                return k
+        return len(self.texts[i])
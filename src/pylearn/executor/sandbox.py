@@ -3,11 +3,13 @@
 
 from __future__ import annotations
 
+import atexit
 import glob as _glob_mod
 import logging
 import os
 import re
 import shutil
+import signal
 import subprocess
 import sys
 import tempfile
@@ -35,61 +37,212 @@ _SCRATCH_DIR = DATA_DIR / "scratch"
 _SCRATCH_DIR.mkdir(parents=True, exist_ok=True)
 
 # Environment variables to strip from child processes
-_SENSITIVE_ENV_VARS = {
-    "AWS_ACCESS_KEY_ID",
-    "AWS_SECRET_ACCESS_KEY",
-    "AWS_SESSION_TOKEN",
-    "AZURE_CLIENT_SECRET",
-    "GCP_SERVICE_ACCOUNT_KEY",
-    "DATABASE_URL",
-    "DB_PASSWORD",
-    "GITHUB_TOKEN",
-    "GH_TOKEN",
-    "OPENAI_API_KEY",
-    "ANTHROPIC_API_KEY",
-    "API_KEY",
-    "SECRET_KEY",
-    "PRIVATE_KEY",
-}
+_SENSITIVE_ENV_VARS = frozenset(
+    {
+        "AWS_ACCESS_KEY_ID",
+        "AWS_SECRET_ACCESS_KEY",
+        "AWS_SESSION_TOKEN",
+        "AZURE_CLIENT_SECRET",
+        "GCP_SERVICE_ACCOUNT_KEY",
+        "DATABASE_URL",
+        "DB_PASSWORD",
+        "GITHUB_TOKEN",
+        "GH_TOKEN",
+        "OPENAI_API_KEY",
+        "ANTHROPIC_API_KEY",
+        "API_KEY",
+        "SECRET_KEY",
+        "PRIVATE_KEY",
+    }
+)
 
 # Advisory warning patterns — NOT a security sandbox. User code runs with full privileges.
 # These patterns catch common dangerous operations to show a confirmation dialog.
 _DANGER_PATTERNS = [
-    (re.compile(r"\bos\.system\b"), "os.system()"),
-    (re.compile(r"\bos\.remove\b|\bos\.unlink\b"), "os.remove()/unlink()"),
-    (re.compile(r"\bshutil\.rmtree\b"), "shutil.rmtree()"),
-    (re.compile(r"\bsubprocess\.(call|run|Popen)\b"), "subprocess execution"),
-    (re.compile(r"\b__import__\b"), "__import__()"),
-    (re.compile(r"\bos\.rmdir\b"), "os.rmdir()"),
-    (re.compile(r"\bos\.rename\b"), "os.rename()"),
-    (re.compile(r"\bopen\s*\(.*['\"]w['\"]"), "file write via open()"),
-    (re.compile(r"\bpathlib\.Path.*\.unlink\b|\bPath.*\.unlink\b"), "Path.unlink()"),
-    (re.compile(r"\bsocket\b"), "socket (network access)"),
-    (re.compile(r"\bhttp\.client\b|\burllib\.request\b"), "HTTP network access"),
-    (re.compile(r"\beval\s*\("), "eval()"),
-    (re.compile(r"\bexec\s*\("), "exec()"),
-    (re.compile(r"\bctypes\b"), "ctypes (native code access)"),
-    (re.compile(r"\bimportlib\b"), "importlib (dynamic import)"),
-    (re.compile(r"getattr\s*\("), "getattr() (attribute access bypass)"),
-    (re.compile(r"__builtins__"), "__builtins__ (builtin access)"),
+    (r"\bos\.system\b", "os.system()"),
+    (r"\bos\.remove\b|\bos\.unlink\b", "os.remove()/unlink()"),
+    (r"\bshutil\.rmtree\b", "shutil.rmtree()"),
+    (r"\bsubprocess\.(?:call|run|Popen)\b", "subprocess execution"),
+    (r"\b__import__\b", "__import__()"),
+    (r"\bos\.rmdir\b", "os.rmdir()"),
+    (r"\bos\.rename\b", "os.rename()"),
+    (r"\bopen\s*\(.*['\"]w['\"]", "file write via open()"),
+    (r"\bpathlib\.Path.*\.unlink\b|\bPath.*\.unlink\b", "Path.unlink()"),
+    (r"\bsocket\b", "socket (network access)"),
+    (r"\bhttp\.client\b|\burllib\.request\b", "HTTP network access"),
+    (r"\beval\s*\(", "eval()"),
+    (r"\bexec\s*\(", "exec()"),
+    (r"\bctypes\b", "ctypes (native code access)"),
+    (r"\bimportlib\b", "importlib (dynamic import)"),
+    (r"getattr\s*\(", "getattr() (attribute access bypass)"),
+    (r"__builtins__", "__builtins__ (builtin access)"),
 ]
 
 
+def _alternatives(pattern: str) -> list[str]:
+    """Split *pattern* at its top-level ``|`` (not inside a group or class)."""
+    alternatives: list[str] = []
+    depth = 0
+    in_class = False
+    start = i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = c != "]"
+        elif c == "[":
+            in_class = True
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            alternatives.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    alternatives.append(pattern[start:])
+    return alternatives
+
+
+def _leading_literal(alternative: str) -> str:
+    """Return the literal text every match of *alternative* starts with.
+
+    A leading ``\\b`` is skipped.  Raises ValueError if the alternative doesn't
+    start with a literal, since the prefilters below rely on one.
+    """
+    i = 2 if alternative.startswith(r"\b") else 0
+    literal: list[str] = []
+    while i < len(alternative):
+        c = alternative[i]
+        if c == "\\" and i + 1 < len(alternative) and not alternative[i + 1].isalnum():
+            char, step = alternative[i + 1], 2  # escaped punctuation
+        elif c.isalnum() or c == "_":
+            char, step = c, 1
+        else:
+            break
+        quantifier = alternative[i + step : i + step + 1]
+        if quantifier in ("?", "*", "{"):
+            break  # this character is optional
+        literal.append(char)
+        if quantifier == "+":
+            break
+        i += step
+    if not literal:
+        raise ValueError(f"Danger pattern alternative has no leading literal: {alternative!r}")
+    return "".join(literal)
+
+
+_DANGER_TRIGGERS = {_leading_literal(alt) for pat, _desc in _DANGER_PATTERNS for alt in _alternatives(pat)}
+
+# All patterns in one regex so the code is scanned once.  Each alternative is a
+# zero-width lookahead, so a match never consumes text another pattern could
+# start in (no two patterns can match at the same position).  The leading class
+# lists every pattern's possible first character, letting most positions fail
+# without trying the alternatives.
+_DANGER_RE = re.compile(
+    "(?=["
+    + re.escape("".join(sorted({t[0] for t in _DANGER_TRIGGERS})))
+    + "])(?:"
+    + "|".join(f"(?=(?P<p{i}>{pat}))" for i, (pat, _desc) in enumerate(_DANGER_PATTERNS))
+    + ")"
+)
+
+# Every match contains one of these literals.  Substring tests run at memchr
+# speed, so code containing none of them (most code) skips the regex.  A literal
+# containing another is redundant and left out.
+_DANGER_LITERALS = tuple(sorted(t for t in _DANGER_TRIGGERS if not any(o != t and o in t for o in _DANGER_TRIGGERS)))
+
+
+# Last filtered environment, with a snapshot of the os.environ data it came from
+_safe_env_cache: tuple[dict, dict[str, str]] | None = None
+
+
 def get_safe_env() -> dict[str, str]:
     """Return a copy of os.environ with sensitive variables stripped."""
+    global _safe_env_cache
+    # Comparing os.environ's raw (undecoded) mapping is far cheaper than rebuilding
+    # the filtered copy, and the environment rarely changes between runs
+    raw = getattr(os.environ, "_data", None)
+    cached = _safe_env_cache
+    if raw is not None and cached is not None and cached[0] == raw:
+        return cached[1].copy()
     env = os.environ.copy()
     for var in _SENSITIVE_ENV_VARS:
         env.pop(var, None)
+    if raw is not None:
+        _safe_env_cache = (raw.copy(), env.copy())
     return env
 
 
+def _child_env() -> dict[str, str] | None:
+    """Environment to pass to Popen: None (inherit ours as is) when nothing needs stripping.
+
+    Inheriting spares Popen from encoding the whole environment for every spawn.
+    """
+    if any(var in os.environ for var in _SENSITIVE_ENV_VARS):
+        return get_safe_env()
+    return None
+
+
 def check_dangerous_code(code: str) -> list[str]:
     """Return list of warnings if code contains potentially dangerous patterns."""
-    warnings = []
-    for pattern, desc in _DANGER_PATTERNS:
-        if pattern.search(code):
-            warnings.append(desc)
-    return warnings
+    if not any(literal in code for literal in _DANGER_LITERALS):
+        return []
+    found = {m.lastgroup for m in _DANGER_RE.finditer(code)}
+    if not found:
+        return []
+    # Report in pattern order, each warning once
+    return [desc for i, (_pat, desc) in enumerate(_DANGER_PATTERNS) if f"p{i}" in found]
+
+
+def _child_map() -> dict[int, list[int]]:
+    """Map each parent pid to its child pids from one pass over /proc/<pid>/stat."""
+    children: dict[int, list[int]] = {}
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry.name}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            continue  # exited while we were scanning
+        # The command name is in parentheses and may itself contain spaces or ")"
+        fields = stat.rpartition(b")")[2].split()
+        if len(fields) > 1:
+            children.setdefault(int(fields[1]), []).append(int(entry.name))
+    return children
+
+
+def _descendant_pids(pid: int) -> list[int]:
+    """List every descendant of a process on Linux, parents before their children.
+
+    Uses /proc/<pid>/task/*/children where the kernel provides it, otherwise a
+    single scan of /proc.  Returns an empty list if /proc can't be read.
+    """
+    try:
+        use_children_files = os.path.exists(f"/proc/{pid}/task/{pid}/children")
+        child_map = None if use_children_files else _child_map()
+    except OSError:
+        return []
+    found: list[int] = []
+    pending = [pid]
+    while pending:
+        parent = pending.pop()
+        if child_map is not None:
+            kids = child_map.get(parent, [])
+        else:
+            kids = []
+            for path in _glob_mod.glob(f"/proc/{parent}/task/*/children"):
+                try:
+                    with open(path, "rb") as f:
+                        kids.extend(int(p) for p in f.read().split())
+                except (OSError, ValueError):
+                    continue
+        found.extend(kids)
+        pending.extend(kids)
+    return found
 
 
 def _kill_tree(proc: subprocess.Popen) -> None:
@@ -105,7 +258,14 @@ def _kill_tree(proc: subprocess.Popen) -> None:
                 creationflags=_CREATE_NO_WINDOW,
             )
         else:
+            # List the tree before killing its root: orphans get reparented
+            descendants = _descendant_pids(proc.pid) if sys.platform.startswith("linux") else []
             proc.kill()
+            for pid in descendants:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except OSError:
+                    pass  # already gone
     except Exception:
         try:
             proc.kill()
@@ -128,6 +288,96 @@ class ExecutionResult:
         return self.return_code == 0 and not self.timed_out and not self.killed
 
 
+# Script run by a standby interpreter.  It starts up ahead of time, waits for
+# the user's code on stdin, and then runs it as if it had been given with -c.
+_STANDBY_BOOTSTRAP = r"""
+import os, sys, types
+_code = sys.stdin.buffer.read().decode("utf-8")
+sys.stdin = open(os.devnull)
+sys.argv = ["-c"]
+# Run the code in a real __main__ module, so lookups through sys.modules
+# (pickle, multiprocessing, ...) find what it defines
+_main = types.ModuleType("__main__")
+_main.__builtins__ = __builtins__
+_bootstrap, sys.modules["__main__"] = sys.modules["__main__"], _main
+try:
+    exec(compile(_code, "<string>", "exec"), _main.__dict__)
+except SystemExit:
+    raise
+except BaseException as _exc:
+    import traceback
+    # Drop this bootstrap's frame so the traceback matches a plain -c run
+    traceback.print_exception(type(_exc), _exc, _exc.__traceback__.tb_next)
+    sys.exit(1)
+"""
+
+
+class _PythonStandby:
+    """One pre-started Python interpreter, so a run doesn't wait for interpreter startup.
+
+    Each standby runs a single piece of code and exits, so every run still gets a
+    fresh process; the next standby is started while the current code runs.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+        self._key: tuple[str, dict[str, str]] | None = None
+
+    def take(self, python: str, env: dict[str, str]) -> subprocess.Popen | None:
+        """Hand over the standby if it was started for this interpreter and environment."""
+        with self._lock:
+            proc, key = self._proc, self._key
+            self._proc = self._key = None
+        if proc is None:
+            return None
+        if key == (python, env) and proc.poll() is None:
+            return proc
+        _discard(proc)
+        return None
+
+    def refill(self, python: str, env: dict[str, str]) -> None:
+        """Start a standby for the next run if there isn't one already."""
+        with self._lock:
+            if self._proc is not None:
+                return
+            try:
+                self._proc = subprocess.Popen(
+                    [python, "-u", "-c", _STANDBY_BOOTSTRAP],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    cwd=str(_SCRATCH_DIR),
+                    env=env,
+                    creationflags=_CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+                )
+                self._key = (python, env)
+            except OSError as e:
+                logger.debug("Could not start standby interpreter: %s", e)
+
+    def close(self) -> None:
+        """Kill the standby, if any."""
+        with self._lock:
+            proc = self._proc
+            self._proc = self._key = None
+        if proc is not None:
+            _discard(proc)
+
+
+def _discard(proc: subprocess.Popen) -> None:
+    """Kill an unused standby interpreter and reap it."""
+    try:
+        proc.kill()
+        proc.communicate(timeout=5)
+    except Exception:
+        pass
+
+
+_python_standby = _PythonStandby()
+atexit.register(_python_standby.close)
+
+
 class Sandbox:
     """Execute code in a subprocess with timeout. Supports Python, C++, and HTML."""
 
@@ -155,25 +405,48 @@ class Sandbox:
                 stderr="No Python interpreter found. Install Python and add it to PATH.",
                 return_code=-1,
             )
+        env = get_safe_env()
         try:
             with self._process_lock:
-                self._process = subprocess.Popen(
-                    [python, "-u", "-c", code],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    cwd=str(_SCRATCH_DIR),
-                    env=get_safe_env(),
-                    creationflags=_CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-                )
-            return self._wait(self._process, timeout)
+                proc = self._start_on_standby(python, env, code)
+                if proc is None:
+                    proc = subprocess.Popen(
+                        [python, "-u", "-c", code],
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                        cwd=str(_SCRATCH_DIR),
+                        env=_child_env(),
+                        creationflags=_CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+                    )
+                self._process = proc
+            # Let the next interpreter start up while this code runs
+            _python_standby.refill(python, env)
+            return self._wait(proc, timeout)
         except Exception as e:
-            logger.error(f"Python execution error: {e}")
+            logger.error("Python execution error: %s", e)
             return ExecutionResult(stderr=str(e), return_code=-1)
         finally:
             with self._process_lock:
                 self._process = None
 
+    @staticmethod
+    def _start_on_standby(python: str, env: dict[str, str], code: str) -> subprocess.Popen | None:
+        """Send code to the standby interpreter; None if there is no usable standby."""
+        proc = _python_standby.take(python, env)
+        if proc is None or proc.stdin is None:
+            return None
+        try:
+            # Bytes, so any code reaches the child intact whatever the locale;
+            # communicate() closes stdin, which tells the standby to start
+            proc.stdin.buffer.write(code.encode("utf-8"))
+            proc.stdin.buffer.flush()
+        except (OSError, ValueError) as e:
+            logger.debug("Standby interpreter unusable: %s", e)
+            _discard(proc)
+            return None
+        return proc
+
     def _run_html(self, code: str, timeout: int | None = None) -> ExecutionResult:
         """Write HTML to a file and open it in the default browser."""
         try:
@@ -213,7 +486,7 @@ class Sandbox:
                 msg = f"Updated and refreshed: {preview_path}"
             return ExecutionResult(stdout=msg, return_code=0)
         except Exception as e:
-            logger.error(f"HTML preview error: {e}")
+            logger.error("HTML preview error: %s", e)
             return ExecutionResult(stderr=str(e), return_code=-1)
 
     def _run_cpp(self, code: str, timeout: int | None = None) -> ExecutionResult:
@@ -240,7 +513,7 @@ class Sandbox:
                 capture_output=True,
                 text=True,
                 timeout=30,
-                env=get_safe_env(),
+                env=_child_env(),
                 creationflags=_CREATE_NO_WINDOW if sys.platform == "win32" else 0,
             )
 
@@ -258,7 +531,7 @@ class Sandbox:
                     stderr=subprocess.PIPE,
                     text=True,
                     cwd=str(tmp_dir),
-                    env=get_safe_env(),
+                    env=_child_env(),
                     creationflags=_CREATE_NO_WINDOW if sys.platform == "win32" else 0,
                 )
             result = self._wait(self._process, timeout)
@@ -276,7 +549,7 @@ class Sandbox:
                 timed_out=True,
             )
         except Exception as e:
-            logger.error(f"C++ execution error: {e}")
+            logger.error("C++ execution error: %s", e)
             return ExecutionResult(stderr=str(e), return_code=-1)
         finally:
             with self._process_lock:
@@ -323,7 +596,7 @@ class Sandbox:
                     self._process.kill()
                     return True
                 except Exception as e:
-                    logger.error(f"Error killing process: {e}")
+                    logger.error("Error killing process: %s", e)
         return False
 
     @property
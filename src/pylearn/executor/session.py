@@ -9,13 +9,19 @@ replay needed.
 from __future__ import annotations
 
 import logging
+import queue
 import subprocess
 import sys
 import threading
+import time
 import uuid
+from typing import IO, TYPE_CHECKING
 
 from pylearn.core.constants import DATA_DIR, get_python_executable
-from pylearn.executor.sandbox import _CREATE_NO_WINDOW, ExecutionResult, _kill_tree, get_safe_env
+from pylearn.executor.sandbox import _CREATE_NO_WINDOW, ExecutionResult, _child_env, _kill_tree
+
+if TYPE_CHECKING:
+    from pylearn.executor.sandbox import Sandbox
 
 logger = logging.getLogger("pylearn.executor")
 
@@ -28,9 +34,66 @@ def _new_sentinel() -> str:
     return f"__PYLEARN_DONE_{uuid.uuid4().hex}__"
 
 
-# Script injected into the persistent subprocess.  It reads code blocks
-# from stdin delimited by the sentinel, exec()s them, and prints the
-# sentinel back so the parent knows when output is complete.
+# Marker a reader thread queues when the subprocess closes its end of the pipe
+_EOF = object()
+
+
+def _pump_lines(stream: IO[str], out: queue.SimpleQueue, sentinel: str) -> None:
+    """Forward lines from a subprocess pipe to a queue for the life of the process.
+
+    Each sentinel line is queued as None, marking the end of one run's output.
+    Lines past _MAX_OUTPUT_CHARS of one run's output are dropped here, since
+    _collect() would discard them anyway; that also bounds what piles up
+    while no run is collecting, e.g. from a background thread printing in a loop.
+    """
+    size = 0
+    try:
+        for line in stream:
+            if line.rstrip("\n") == sentinel:
+                size = 0
+                out.put(None)
+            elif size <= _MAX_OUTPUT_CHARS:
+                # The line that crosses the limit still goes through, so
+                # _collect() sees the overflow and adds its truncation note
+                size += len(line)
+                out.put(line)
+    except Exception as e:
+        logger.error("Error reading subprocess output: %s", e)
+    finally:
+        out.put(_EOF)
+
+
+def _collect(out: queue.SimpleQueue, deadline: float, truncated_note: str) -> tuple[str, bool, bool]:
+    """Take one run's output from a reader queue.
+
+    Returns the text, whether the sentinel or the end of the stream was reached
+    before the deadline, and whether it was the end of the stream.
+    """
+    lines: list[str] = []
+    size = 0
+    truncated = False
+    while True:
+        try:
+            line = out.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            return "".join(lines), False, False
+        if line is None or line is _EOF:
+            return "".join(lines), True, line is _EOF
+        if not truncated:
+            size += len(line)
+            if size > _MAX_OUTPUT_CHARS:
+                truncated = True
+                lines.append(truncated_note)
+            else:
+                lines.append(line)
+
+
+# Script injected into the persistent subprocess.  Each code block arrives
+# as a frame: its length in UTF-8 bytes on one line, then the code itself.
+# Frames are read from the binary stdin, so the child's locale encoding
+# can't throw the length off.
+# It exec()s the block and prints the sentinel back on both streams so the
+# parent knows when output is complete.
 _REPL_BOOTSTRAP = r"""
 import sys, traceback, io
 
@@ -38,18 +101,11 @@ _SENTINEL = {sentinel!r}
 _namespace = {{"__name__": "__main__", "__builtins__": __builtins__}}
 
 while True:
-    # Read lines until we see the sentinel
-    lines = []
-    for raw in sys.stdin:
-        line = raw.rstrip("\n")
-        if line == _SENTINEL:
-            break
-        lines.append(line)
-    else:
+    header = sys.stdin.buffer.readline()
+    if not header:
         # stdin closed — exit
         break
-
-    code = "\n".join(lines)
+    code = sys.stdin.buffer.read(int(header)).decode("utf-8")
     if not code.strip():
         # Empty code block — just echo sentinel
         print(_SENTINEL, flush=True)
@@ -84,32 +140,55 @@ class Session:
         self.language = language
         self._process: subprocess.Popen | None = None
         self._sentinel: str = ""
+        # Runs C/C++/HTML; created on first use and reused after that
+        self._sandbox: Sandbox | None = None
+        # A REPL already started up by reset(), taken over by the next run
+        self._standby: tuple[subprocess.Popen, str] | None = None
+        self._stdout_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._stderr_queue: queue.SimpleQueue = queue.SimpleQueue()
         self._process_lock = threading.Lock()
         self._scratch_dir = DATA_DIR / "scratch"
         self._scratch_dir.mkdir(parents=True, exist_ok=True)
 
+    def _spawn(self) -> tuple[subprocess.Popen, str] | None:
+        """Start a REPL subprocess; returns it with its sentinel."""
+        python = get_python_executable()
+        if not python:
+            return None
+        sentinel = _new_sentinel()
+        bootstrap = _REPL_BOOTSTRAP.format(sentinel=sentinel)
+        proc = subprocess.Popen(
+            [python, "-u", "-c", bootstrap],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            cwd=str(self._scratch_dir),
+            env=_child_env(),
+            creationflags=_CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+        )
+        return proc, sentinel
+
     def _ensure_process(self) -> subprocess.Popen | None:
         """Start the persistent subprocess if it isn't running."""
         with self._process_lock:
             if self._process is not None and self._process.poll() is None:
                 return self._process
-            # Start a new one
-            python = get_python_executable()
-            if not python:
-                return None
-            self._sentinel = _new_sentinel()
-            bootstrap = _REPL_BOOTSTRAP.format(sentinel=self._sentinel)
-            self._process = subprocess.Popen(
-                [python, "-u", "-c", bootstrap],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding="utf-8",
-                cwd=str(self._scratch_dir),
-                env=get_safe_env(),
-                creationflags=_CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-            )
+            # Take the standby left by reset() if it's still alive, else start a new one
+            spawned, self._standby = self._standby, None
+            if spawned is None or spawned[0].poll() is not None:
+                spawned = self._spawn()
+                if spawned is None:
+                    return None
+            self._process, self._sentinel = spawned
+            # One reader per pipe for the whole life of the process, rather than
+            # a fresh pair of threads for every run
+            self._stdout_queue = queue.SimpleQueue()
+            self._stderr_queue = queue.SimpleQueue()
+            for stream, out in ((self._process.stdout, self._stdout_queue), (self._process.stderr, self._stderr_queue)):
+                if stream is not None:
+                    threading.Thread(target=_pump_lines, args=(stream, out, self._sentinel), daemon=True).start()
             return self._process
 
     def run(self, code: str, language: str | None = None) -> ExecutionResult:
@@ -121,11 +200,19 @@ class Session:
 
         # C++/HTML don't support session persistence — delegate to Sandbox
         if lang in ("cpp", "c", "html"):
-            from pylearn.executor.sandbox import Sandbox
+            sandbox = self._sandbox
+            if sandbox is None:
+                from pylearn.executor.sandbox import Sandbox
 
-            sandbox = Sandbox(timeout=self.timeout)
+                sandbox = self._sandbox = Sandbox(timeout=self.timeout)
+            else:
+                sandbox.timeout = self.timeout
             return sandbox.run(code, language=lang)
 
+        # Nothing to execute — no need for a round trip through the REPL
+        if not code.strip():
+            return ExecutionResult()
+
         proc = self._ensure_process()
         if proc is None:
             return ExecutionResult(
@@ -134,85 +221,47 @@ class Session:
             )
 
         try:
-            # Send code + sentinel to the subprocess
+            # Send the code as one length-prefixed frame
             if proc.stdin is None:
                 self._kill_process()
                 return ExecutionResult(stderr="Session stdin unavailable", return_code=-1)
-            proc.stdin.write(code + "\n" + self._sentinel + "\n")
-            proc.stdin.flush()
+            data = code.encode("utf-8")
+            proc.stdin.buffer.write(b"%d\n%s" % (len(data), data))
+            proc.stdin.buffer.flush()
         except (OSError, BrokenPipeError) as e:
-            logger.error(f"Failed to send code to session: {e}")
+            logger.error("Failed to send code to session: %s", e)
             self._kill_process()
             return ExecutionResult(stderr=f"Session process died: {e}", return_code=-1)
 
         # Collect stdout and stderr until we see the sentinel on each
-        sentinel = self._sentinel
-        stdout_lines: list[str] = []
-        stderr_lines: list[str] = []
-        stdout_bytes = 0
-        stderr_bytes = 0
-        stdout_truncated = False
-        stderr_truncated = False
-
-        def _read_stdout() -> None:
-            nonlocal stdout_bytes, stdout_truncated
-            try:
-                if proc.stdout is None:
-                    return
-                for line in proc.stdout:
-                    if line.rstrip("\n") == sentinel:
-                        break
-                    if not stdout_truncated:
-                        stdout_bytes += len(line)
-                        if stdout_bytes > _MAX_OUTPUT_CHARS:
-                            stdout_truncated = True
-                            stdout_lines.append("\n[output truncated — exceeded 2 MB limit]\n")
-                        else:
-                            stdout_lines.append(line)
-            except Exception as e:
-                logger.error("Error reading subprocess stdout: %s", e)
-
-        def _read_stderr() -> None:
-            nonlocal stderr_bytes, stderr_truncated
-            try:
-                if proc.stderr is None:
-                    return
-                for line in proc.stderr:
-                    if line.rstrip("\n") == sentinel:
-                        break
-                    if not stderr_truncated:
-                        stderr_bytes += len(line)
-                        if stderr_bytes > _MAX_OUTPUT_CHARS:
-                            stderr_truncated = True
-                            stderr_lines.append("\n[stderr truncated — exceeded 2 MB limit]\n")
-                        else:
-                            stderr_lines.append(line)
-            except Exception as e:
-                logger.error("Error reading subprocess stderr: %s", e)
-
-        stdout_thread = threading.Thread(target=_read_stdout, daemon=True)
-        stderr_thread = threading.Thread(target=_read_stderr, daemon=True)
-        stdout_thread.start()
-        stderr_thread.start()
-
-        stdout_thread.join(timeout=self.timeout)
-        stderr_thread.join(timeout=max(1, self.timeout - 1))
-
-        if stdout_thread.is_alive() or stderr_thread.is_alive():
+        deadline = time.monotonic() + self.timeout
+        stdout, done, eof = _collect(self._stdout_queue, deadline, "\n[output truncated — exceeded 2 MB limit]\n")
+        stderr = ""
+        if done:
+            # The stderr sentinel trails the stdout one; allow it a moment past the deadline
+            stderr_deadline = max(deadline, time.monotonic() + 1)
+            stderr, done, stderr_eof = _collect(
+                self._stderr_queue, stderr_deadline, "\n[stderr truncated — exceeded 2 MB limit]\n"
+            )
+            eof = eof or stderr_eof
+
+        if not done:
             # Timed out — kill the process (it will be restarted on next run)
             self._kill_process()
             return ExecutionResult(
-                stdout="".join(stdout_lines),
+                stdout=stdout,
                 stderr=f"Execution timed out after {self.timeout} seconds",
                 return_code=-1,
                 timed_out=True,
             )
 
-        stdout = "".join(stdout_lines)
-        stderr = "".join(stderr_lines)
-
-        # Check if subprocess died
-        if proc.poll() is not None:
+        # Check if subprocess died; a closed pipe means it has exited or is about to
+        if eof:
+            try:
+                proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                pass
+        if eof or proc.poll() is not None:
             self._kill_process()
             return ExecutionResult(
                 stdout=stdout,
@@ -251,9 +300,29 @@ class Session:
     def reset(self) -> None:
         """Reset the session by killing the subprocess.
 
-        The next run() call will start a fresh process.
+        A fresh process is started in the background and the next run() call
+        picks it up, so that run doesn't wait for interpreter startup.
         """
         self._kill_process()
+        with self._process_lock:
+            if self._standby is None:
+                try:
+                    self._standby = self._spawn()
+                except OSError as e:
+                    logger.debug("Could not start standby session: %s", e)
+
+    def close(self) -> None:
+        """Kill the subprocess and any standby; use when the session is done with."""
+        self._kill_process()
+        with self._process_lock:
+            standby, self._standby = self._standby, None
+        if standby is not None:
+            proc = standby[0]
+            try:
+                proc.kill()
+                proc.communicate(timeout=5)
+            except Exception:
+                pass
 
     @property
     def history(self) -> list[str]:
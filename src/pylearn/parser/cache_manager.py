@@ -61,7 +61,7 @@ class CacheManager:
             tmp.replace(path)
         finally:
             tmp.unlink(missing_ok=True)
-        logger.info(f"Cached {book.book_id} to {path} ({path.stat().st_size / 1024:.0f} KB)")
+        logger.info("Cached %s to %s (%.0f KB)", book.book_id, path, path.stat().st_size / 1024)
 
     def load(self, book_id: str) -> Book | None:
         """Load parsed book from JSON cache.
@@ -71,7 +71,7 @@ class CacheManager:
         """
         path = self._cache_path(book_id)
         if not path.exists():
-            logger.info(f"No cache found for {book_id}")
+            logger.info("No cache found for %s", book_id)
             return None
 
         try:
@@ -89,17 +89,17 @@ class CacheManager:
                 try:
                     current_mtime = os.path.getmtime(pdf_path)
                     if abs(current_mtime - cached_mtime) > 1.0:
-                        logger.info(f"PDF changed since cache was written for {book_id}, invalidating")
+                        logger.info("PDF changed since cache was written for %s, invalidating", book_id)
                         path.unlink(missing_ok=True)
                         return None
                 except OSError:
                     pass  # PDF not found — load cache anyway, error will surface later
 
             book = Book.from_dict(data)
-            logger.info(f"Loaded {book_id} from cache ({len(book.chapters)} chapters)")
+            logger.info("Loaded %s from cache (%d chapters)", book_id, len(book.chapters))
             return book
         except Exception as e:
-            logger.error(f"Error loading cache for {book_id}: {e}", exc_info=True)
+            logger.error("Error loading cache for %s: %s", book_id, e, exc_info=True)
             return None
 
     def invalidate(self, book_id: str) -> None:
@@ -107,7 +107,7 @@ class CacheManager:
         path = self._cache_path(book_id)
         if path.exists():
             path.unlink()
-            logger.info(f"Invalidated cache for {book_id}")
+            logger.info("Invalidated cache for %s", book_id)
 
     def invalidate_all(self) -> None:
         """Delete all cached data."""
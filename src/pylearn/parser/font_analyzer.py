@@ -135,10 +135,16 @@ class FontAnalyzer:
         skip_start, skip_end = self._detect_skip_pages(doc)
 
         logger.info(
-            f"Auto-detect: body={body_size}, code={code_size}, "
-            f"h1>={h1_min}, h2>={h2_min}, h3>={h3_min}, "
-            f"margins=({margin_top:.0f}, {margin_bottom:.0f}), "
-            f"skip=({skip_start}, {skip_end})"
+            "Auto-detect: body=%s, code=%s, h1>=%s, h2>=%s, h3>=%s, margins=(%.0f, %.0f), skip=(%s, %s)",
+            body_size,
+            code_size,
+            h1_min,
+            h2_min,
+            h3_min,
+            margin_top,
+            margin_bottom,
+            skip_start,
+            skip_end,
         )
 
         return BookProfile(
@@ -197,7 +197,7 @@ class PDFParser:
                     }
                 )
             except Exception as e:
-                logger.debug(f"Skipping image xref={xref} on page {page_num}: {e}")
+                logger.debug("Skipping image xref=%d on page %d: %s", xref, page_num, e)
 
         return images
 
@@ -214,7 +214,7 @@ class PDFParser:
                 spans = self.extract_page_spans(page_num)
                 pages.append(spans)
             except Exception as e:
-                logger.warning(f"Error extracting page {page_num}: {e}")
+                logger.warning("Error extracting page %d: %s", page_num, e)
                 pages.append([])
         return pages
 
@@ -42,13 +42,16 @@ class StructureDetector:
             if abs(len(regex_starts) - len(font_starts)) <= 3:
                 chapter_starts = regex_starts
                 logger.info(
-                    f"Using regex detection ({len(regex_starts)} chapters) — similar to font-size ({len(font_starts)})"
+                    "Using regex detection (%d chapters) — similar to font-size (%d)",
+                    len(regex_starts),
+                    len(font_starts),
                 )
             else:
                 chapter_starts = font_starts
                 logger.info(
-                    f"Using font-size detection ({len(font_starts)} chapters) — "
-                    f"regex found {len(regex_starts)}, too different"
+                    "Using font-size detection (%d chapters) — regex found %d, too different",
+                    len(font_starts),
+                    len(regex_starts),
                 )
         elif regex_starts:
             chapter_starts = regex_starts
@@ -151,13 +154,16 @@ class StructureDetector:
                     chapter_size = s
                     break
             logger.info(
-                f"Using font size {chapter_size} as chapters "
-                f"({size_counts[sizes[0]]} parts at size {sizes[0]}, "
-                f"{size_counts[chapter_size]} chapters at size {chapter_size})"
+                "Using font size %s as chapters (%d parts at size %s, %d chapters at size %s)",
+                chapter_size,
+                size_counts[sizes[0]],
+                sizes[0],
+                size_counts[chapter_size],
+                chapter_size,
             )
         else:
             chapter_size = sizes[0]
-            logger.info(f"Using font size {chapter_size} as chapters ({size_counts[chapter_size]} found)")
+            logger.info("Using font size %s as chapters (%d found)", chapter_size, size_counts[chapter_size])
 
         starts = []
         chapter_num = 1
@@ -166,7 +172,7 @@ class StructureDetector:
                 starts.append((i, chapter_num, b.text.strip()))
                 chapter_num += 1
 
-        logger.info(f"Font-based detection found {len(starts)} chapters")
+        logger.info("Font-based detection found %d chapters", len(starts))
         return starts
 
     def _detect_sections(self, blocks: list[ContentBlock]) -> list[Section]:
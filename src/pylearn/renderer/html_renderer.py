@@ -10,6 +10,7 @@ Unsupported: border-bottom, border-radius, most CSS layout, flexbox, etc.
 from __future__ import annotations
 
 import html
+from collections.abc import Callable
 
 from pylearn.core.models import BlockType, ContentBlock
 from pylearn.renderer.code_highlighter import highlight_code
@@ -26,108 +27,135 @@ class HTMLRenderer:
         self.language = language
         self.image_dir = image_dir  # absolute path to image cache directory
         self.theme_name = theme_name  # app theme name for Pygments style selection
+        # Body-only welcome documents keyed by the theme colors they use
+        self._welcome_cache: dict[tuple[str, str, str], str] = {}
+        # Block type -> fragment renderer; anything not listed renders as body text
+        self._block_renderers: dict[BlockType, Callable[[ContentBlock], str]] = {
+            BlockType.HEADING1: self._render_heading1,
+            BlockType.HEADING2: self._render_heading2,
+            BlockType.HEADING3: self._render_heading3,
+            BlockType.CODE: self._render_code,
+            BlockType.CODE_REPL: self._render_code,
+            BlockType.NOTE: self._render_note,
+            BlockType.WARNING: self._render_warning,
+            BlockType.TIP: self._render_tip,
+            BlockType.FIGURE: self._render_figure,
+            BlockType.LIST_ITEM: self._render_list_item,
+            BlockType.EXERCISE: self._render_exercise,
+        }
 
     def render_blocks(self, blocks: list[ContentBlock]) -> str:
         """Render a list of content blocks to a full HTML document."""
-        body_parts = []
-        for block in blocks:
-            body_parts.append(self._render_block(block))
+        render = self.render_block
+        return self.wrap_html("\n".join([render(block) for block in blocks]))
 
-        return self._wrap_html("\n".join(body_parts))
+    def render_block(self, block: ContentBlock) -> str:
+        """Render a single content block to an HTML fragment.
 
-    def _render_block(self, block: ContentBlock) -> str:
-        """Render a single content block to HTML."""
+        The fragment depends on the theme colors, language, and image
+        directory, but not on the font size (sizes live in the wrapper CSS).
+        """
+        handler = self._block_renderers.get(block.block_type, self._render_body)
+        return handler(block)
+
+    # --- Per-type renderers (looked up in _block_renderers) ---
+
+    @staticmethod
+    def _anchor_tag(block: ContentBlock) -> str:
+        # Use <a name=""> anchors for headings so QTextDocument can discover them.
+        # The anchor goes inside the heading: QTextDocument drops an empty
+        # anchor that isn't followed by text in the same block, but attaches
+        # one placed here to the heading's first character.
+        return f'<a name="{html.escape(block.block_id)}"></a>' if block.block_id else ""
+
+    def _render_heading1(self, block: ContentBlock) -> str:
+        return (
+            f"<br><h1>{self._anchor_tag(block)}"
+            f'<font color="{self.theme.h1_color}" size="6">{html.escape(block.text)}</font></h1><hr>'
+        )
+
+    def _render_heading2(self, block: ContentBlock) -> str:
+        return (
+            f"<br><h2>{self._anchor_tag(block)}"
+            f'<font color="{self.theme.h2_color}" size="5">{html.escape(block.text)}</font></h2>'
+        )
+
+    def _render_heading3(self, block: ContentBlock) -> str:
+        return (
+            f"<h3>{self._anchor_tag(block)}"
+            f'<font color="{self.theme.h3_color}" size="4">{html.escape(block.text)}</font></h3>'
+        )
+
+    def _render_code(self, block: ContentBlock) -> str:
         t = self.theme
-        text = block.text
-        escaped = html.escape(text)
-        # Use <a name=""> anchors for headings so QTextDocument can discover them
-        anchor_tag = f'<a name="{html.escape(block.block_id)}"></a>' if block.block_id else ""
-
-        if block.block_type == BlockType.HEADING1:
-            return f'<br>{anchor_tag}<h1><font color="{t.h1_color}" size="6">{escaped}</font></h1><hr>'
-
-        if block.block_type == BlockType.HEADING2:
-            return f'<br>{anchor_tag}<h2><font color="{t.h2_color}" size="5">{escaped}</font></h2>'
-
-        if block.block_type == BlockType.HEADING3:
-            return f'{anchor_tag}<h3><font color="{t.h3_color}" size="4">{escaped}</font></h3>'
-
-        if block.block_type in (BlockType.CODE, BlockType.CODE_REPL):
-            is_repl = block.block_type == BlockType.CODE_REPL
-            highlighted = highlight_code(text, language=self.language, is_repl=is_repl, theme=self.theme_name)
-            block_id = html.escape(block.block_id) if block.block_id else ""
-            return (
-                f'<a name="{block_id}"></a>'
-                f'<table width="100%" cellpadding="8" cellspacing="0" border="0">'
-                f'<tr><td bgcolor="{t.code_bg}">'
-                f'<pre><font face="{t.code_font}" color="{t.code_text}">'
-                f"{highlighted}</font></pre>"
-                f"</td></tr></table>"
-                f'<p align="right">'
-                f'<a href="copy:{block_id}"><font size="2" color="{t.button_bg}">Copy</font></a>'
-                f"&nbsp;&nbsp;&nbsp;"
-                f'<a href="tryit:{block_id}"><font size="2" color="{t.button_bg}">Try in Editor</font></a>'
-                f"</p>"
-            )
-
-        if block.block_type == BlockType.NOTE:
-            return (
-                f'<table width="100%" cellpadding="8" cellspacing="0" border="0">'
-                f'<tr><td bgcolor="{t.note_bg}" width="4" style="background:{t.note_border};"></td>'
-                f'<td bgcolor="{t.note_bg}">'
-                f"<b>Note:</b> {escaped}</td></tr></table>"
-            )
-
-        if block.block_type == BlockType.WARNING:
-            return (
-                f'<table width="100%" cellpadding="8" cellspacing="0" border="0">'
-                f'<tr><td bgcolor="{t.warning_bg}" width="4" style="background:{t.warning_border};"></td>'
-                f'<td bgcolor="{t.warning_bg}">'
-                f"<b>Warning:</b> {escaped}</td></tr></table>"
-            )
-
-        if block.block_type == BlockType.TIP:
-            return (
-                f'<table width="100%" cellpadding="8" cellspacing="0" border="0">'
-                f'<tr><td bgcolor="{t.tip_bg}" width="4" style="background:{t.tip_border};"></td>'
-                f'<td bgcolor="{t.tip_bg}">'
-                f"<b>Tip:</b> {escaped}</td></tr></table>"
-            )
-
-        if block.block_type == BlockType.FIGURE:
-            if self.image_dir:
-                # Validate filename contains no path separators (prevent path traversal)
-                if ".." in text or "/" in text or "\\" in text:
-                    return ""  # skip suspect filename
-                # text field contains the image filename — escape for HTML attribute
-                safe_name = html.escape(text)
-                img_path = f"{self.image_dir}/{safe_name}".replace("\\", "/")
-                return f'<p align="center"><img src="file:///{img_path}" width="90%"></p>'
+        is_repl = block.block_type == BlockType.CODE_REPL
+        highlighted = highlight_code(block.text, language=self.language, is_repl=is_repl, theme=self.theme_name)
+        block_id = html.escape(block.block_id) if block.block_id else ""
+        return (
+            f'<a name="{block_id}"></a>'
+            f'<table width="100%" cellpadding="8" cellspacing="0" border="0">'
+            f'<tr><td bgcolor="{t.code_bg}">'
+            f'<pre><font face="{t.code_font}" color="{t.code_text}">'
+            f"{highlighted}</font></pre>"
+            f"</td></tr></table>"
+            f'<p align="right">'
+            f'<a href="copy:{block_id}"><font size="2" color="{t.button_bg}">Copy</font></a>'
+            f"&nbsp;&nbsp;&nbsp;"
+            f'<a href="tryit:{block_id}"><font size="2" color="{t.button_bg}">Try in Editor</font></a>'
+            f"</p>"
+        )
+
+    @staticmethod
+    def _callout(label: str, bg: str, border: str, text: str) -> str:
+        return (
+            f'<table width="100%" cellpadding="8" cellspacing="0" border="0">'
+            f'<tr><td bgcolor="{bg}" width="4" style="background:{border};"></td>'
+            f'<td bgcolor="{bg}">'
+            f"<b>{label}:</b> {html.escape(text)}</td></tr></table>"
+        )
+
+    def _render_note(self, block: ContentBlock) -> str:
+        return self._callout("Note", self.theme.note_bg, self.theme.note_border, block.text)
+
+    def _render_warning(self, block: ContentBlock) -> str:
+        return self._callout("Warning", self.theme.warning_bg, self.theme.warning_border, block.text)
+
+    def _render_tip(self, block: ContentBlock) -> str:
+        return self._callout("Tip", self.theme.tip_bg, self.theme.tip_border, block.text)
+
+    def _render_figure(self, block: ContentBlock) -> str:
+        if not self.image_dir:
             return ""  # no image dir configured, skip
+        text = block.text
+        # Validate filename contains no path separators (prevent path traversal)
+        if ".." in text or "/" in text or "\\" in text:
+            return ""  # skip suspect filename
+        # text field contains the image filename — escape for HTML attribute
+        safe_name = html.escape(text)
+        img_path = f"{self.image_dir}/{safe_name}".replace("\\", "/")
+        return f'<p align="center"><img src="file:///{img_path}" width="90%"></p>'
 
-        if block.block_type == BlockType.LIST_ITEM:
-            return f"<p>&nbsp;&nbsp;&nbsp;&bull;&nbsp;{escaped}</p>"
+    def _render_list_item(self, block: ContentBlock) -> str:
+        return f"<p>&nbsp;&nbsp;&nbsp;&bull;&nbsp;{html.escape(block.text)}</p>"
 
-        if block.block_type == BlockType.EXERCISE:
-            return (
-                f'<table width="100%" cellpadding="10" cellspacing="0" border="1"'
-                f' bordercolor="{t.tip_border}">'
-                f'<tr><td bgcolor="{t.tip_bg}">'
-                f'<b><font color="{t.tip_border}">Exercise:</font></b><br>'
-                f"{escaped}</td></tr></table>"
-            )
+    def _render_exercise(self, block: ContentBlock) -> str:
+        t = self.theme
+        return (
+            f'<table width="100%" cellpadding="10" cellspacing="0" border="1"'
+            f' bordercolor="{t.tip_border}">'
+            f'<tr><td bgcolor="{t.tip_bg}">'
+            f'<b><font color="{t.tip_border}">Exercise:</font></b><br>'
+            f"{html.escape(block.text)}</td></tr></table>"
+        )
 
+    def _render_body(self, block: ContentBlock) -> str:
         # Default: body text
-        return f"<p>{escaped}</p>"
+        return f"<p>{html.escape(block.text)}</p>"
 
-    def _wrap_html(self, body: str) -> str:
-        """Wrap content in a full HTML document with base styles."""
+    def get_stylesheet(self) -> str:
+        """Return the base CSS for the current theme and font sizes."""
         t = self.theme
-        return f"""<!DOCTYPE html>
-<html>
-<head>
-<style>
-body {{
+        return f"""body {{
     background-color: {t.bg_color};
     color: {t.text_color};
     font-family: {t.body_font};
@@ -170,17 +198,54 @@ p {{
     margin-top: 4px;
     margin-bottom: 4px;
 }}
-</style>
+"""
+
+    def wrap_html(self, body: str) -> str:
+        """Wrap content in a full HTML document with base styles."""
+        return f"""<!DOCTYPE html>
+<html>
+<head>
+<style>
+{self.get_stylesheet()}</style>
 </head>
 <body>
 {body}
 </body>
+</html>"""
+
+    def wrap_body(self, body: str) -> str:
+        """Wrap content in an HTML document without the <style> block.
+
+        For documents whose CSS is supplied separately through
+        ``QTextDocument.setDefaultStyleSheet(get_stylesheet())``.
+        """
+        return f"""<!DOCTYPE html>
+<html>
+<body>
+{body}
+</body>
 </html>"""
 
     def render_welcome(self) -> str:
         """Render the welcome screen HTML."""
+        return self.wrap_html(self._welcome_body())
+
+    def wrap_welcome(self) -> str:
+        """Return the welcome screen as a body-only document (see wrap_body).
+
+        The result only depends on the theme colors, so it is built once per
+        theme and reused on every later call.
+        """
+        t = self.theme
+        key = (t.button_bg, t.text_color, t.text_muted)
+        doc = self._welcome_cache.get(key)
+        if doc is None:
+            doc = self._welcome_cache[key] = self.wrap_body(self._welcome_body())
+        return doc
+
+    def _welcome_body(self) -> str:
         t = self.theme
-        return self._wrap_html(f"""
+        return f"""
             <div style="text-align:center; margin-top:80px;">
                 <h1 style="color:{t.button_bg}; font-size:36px; margin-bottom:10px;">
                     PyLearn
@@ -193,7 +258,7 @@ p {{
                     or add books via Book &gt; Manage Library.
                 </p>
             </div>
-        """)
+        """
 
     def update_theme(self, theme_name: str) -> None:
         """Switch the rendering theme."""
@@ -207,3 +272,8 @@ p {{
         self.theme.h1_font_size = size + 12
         self.theme.h2_font_size = size + 6
         self.theme.h3_font_size = size + 2
+
+    def font_sizes(self) -> tuple[int, int, int, int, int]:
+        """Return the (body, code, h1, h2, h3) pixel sizes used by the stylesheet."""
+        t = self.theme
+        return (t.body_font_size, t.code_font_size, t.h1_font_size, t.h2_font_size, t.h3_font_size)
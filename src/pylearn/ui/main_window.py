@@ -9,7 +9,7 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-from PyQt6.QtCore import QProcess, Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtCore import QEventLoop, QProcess, Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction, QCloseEvent, QKeySequence
 from PyQt6.QtWidgets import (
     QApplication,
@@ -52,11 +52,54 @@ from pylearn.ui.styles import get_stylesheet
 from pylearn.ui.toc_panel import TOCPanel
 from pylearn.ui.toolbar import MainToolBar
 from pylearn.utils.error_handler import safe_slot
-from pylearn.utils.export import export_progress_to_markdown, export_to_markdown
-from pylearn.utils.text_utils import detect_repl_code, strip_repl_prompts
+from pylearn.utils.export import export_progress_to_markdown, export_to_markdown_stream
+from pylearn.utils.text_utils import classify_and_strip_repl
 
 logger = logging.getLogger("pylearn.ui")
 
+_SHORTCUTS_HTML = """
+<h2>Keyboard Shortcuts</h2>
+<table cellpadding="4" cellspacing="0" style="border-collapse:collapse;">
+<tr><td colspan="2"><b>Navigation</b></td></tr>
+<tr><td><code>Alt+Left</code></td><td>Previous chapter</td></tr>
+<tr><td><code>Alt+Right</code></td><td>Next chapter</td></tr>
+<tr><td><code>Ctrl+M</code></td><td>Mark chapter complete</td></tr>
+<tr><td><code>Ctrl+T</code></td><td>Toggle TOC panel</td></tr>
+<tr><td colspan="2"><b>Search</b></td></tr>
+<tr><td><code>Ctrl+F</code></td><td>Find in current chapter</td></tr>
+<tr><td><code>Ctrl+Shift+F</code></td><td>Search all books</td></tr>
+<tr><td colspan="2"><b>Code</b></td></tr>
+<tr><td><code>F5</code></td><td>Run code</td></tr>
+<tr><td><code>Shift+F5</code></td><td>Stop execution</td></tr>
+<tr><td><code>Ctrl+S</code></td><td>Save code to file</td></tr>
+<tr><td><code>Ctrl+O</code></td><td>Load code from file</td></tr>
+<tr><td><code>Ctrl+E</code></td><td>Open in external editor</td></tr>
+<tr><td colspan="2"><b>View</b></td></tr>
+<tr><td><code>Ctrl+=</code></td><td>Increase font size</td></tr>
+<tr><td><code>Ctrl+-</code></td><td>Decrease font size</td></tr>
+<tr><td><code>Ctrl+1</code></td><td>Focus TOC panel</td></tr>
+<tr><td><code>Ctrl+2</code></td><td>Focus reader panel</td></tr>
+<tr><td><code>Ctrl+3</code></td><td>Focus code editor</td></tr>
+<tr><td colspan="2"><b>Notes &amp; Bookmarks</b></td></tr>
+<tr><td><code>Ctrl+B</code></td><td>Add bookmark</td></tr>
+<tr><td><code>Ctrl+N</code></td><td>Add note</td></tr>
+<tr><td><code>Ctrl+Q</code></td><td>Take quiz for current chapter</td></tr>
+<tr><td><code>Ctrl+Shift+Q</code></td><td>Code challenge for current chapter</td></tr>
+<tr><td><code>Ctrl+P</code></td><td>Open book project</td></tr>
+<tr><td colspan="2"><b>Other</b></td></tr>
+<tr><td><code>Ctrl+/</code></td><td>Show this dialog</td></tr>
+</table>
+"""
+
+_ABOUT_TITLE = f"About {APP_NAME}"
+_ABOUT_HTML = (
+    f"<h2>{APP_NAME} v{APP_VERSION}</h2>"
+    "<p>Interactive Python Learning Desktop App</p>"
+    "<p>Read O'Reilly Python books with an integrated "
+    "code editor and execution console.</p>"
+    "<p>Built with PyQt6, QScintilla, PyMuPDF, and Pygments.</p>"
+)
+
 
 class ParseProcess:
     """Run book parsing in a separate process via QProcess.
@@ -402,7 +445,7 @@ class MainWindow(QMainWindow):
         self._book.chapter_status_changed.connect(self._toc.update_chapter_status)
         self._book.parse_requested.connect(self._on_parse_requested)
         self._book.scroll_to_position.connect(
-            lambda pos: QTimer.singleShot(0, lambda: self._reader.verticalScrollBar().setValue(pos))
+            lambda pos: QTimer.singleShot(0, lambda: self._reader.set_scroll_position(pos))
         )
 
         # Reader
@@ -608,8 +651,7 @@ class MainWindow(QMainWindow):
         if block:
             code = block.text
             # Strip REPL prompts if present
-            if detect_repl_code(code):
-                code = strip_repl_prompts(code)
+            _, code = classify_and_strip_repl(code)
             self._editor.append_code(code)
             self._status_state.setText("Code loaded into editor")
 
@@ -740,8 +782,7 @@ class MainWindow(QMainWindow):
             else:
                 return
 
-        result = export_to_markdown(self._db, book_id)
-        if result is None:
+        if not self._db.has_notes_or_bookmarks(book_id):
             QMessageBox.information(self, "Nothing to Export", "No notes or bookmarks found.")
             return
 
@@ -750,7 +791,9 @@ class MainWindow(QMainWindow):
         )
         if path:
             try:
-                Path(path).write_text(result, encoding="utf-8")
+                # Written straight to the file rather than built up as one string
+                with Path(path).open("w", encoding="utf-8") as f:
+                    export_to_markdown_stream(self._db, f, book_id)
                 self._status_state.setText(f"Exported to {Path(path).name}")
             except OSError as e:
                 QMessageBox.warning(self, "Export Failed", f"Could not save file:\n{e}")
@@ -822,7 +865,7 @@ class MainWindow(QMainWindow):
             self._library.select_book(book_id)
         self._book.navigate_to_chapter(chapter_num)
         # Defer scroll so the new chapter's HTML has time to render
-        QTimer.singleShot(50, lambda: self._reader.verticalScrollBar().setValue(scroll_pos))
+        QTimer.singleShot(50, lambda: self._reader.set_scroll_position(scroll_pos))
 
     @safe_slot
     def _add_note(self) -> None:
@@ -996,6 +1039,8 @@ class MainWindow(QMainWindow):
         )
         dialog.navigate_requested.connect(self._search_navigate)
         dialog.exec()
+        # Parented to the window, so it would otherwise keep its index alive
+        dialog.deleteLater()
 
     @safe_slot
     def _search_navigate(self, book_id: str, chapter_num: int, block_id: str) -> None:
@@ -1017,66 +1062,47 @@ class MainWindow(QMainWindow):
     @safe_slot
     def _show_shortcuts(self) -> None:
         """Show keyboard shortcuts reference."""
-        shortcuts_html = """
-        <h2>Keyboard Shortcuts</h2>
-        <table cellpadding="4" cellspacing="0" style="border-collapse:collapse;">
-        <tr><td colspan="2"><b>Navigation</b></td></tr>
-        <tr><td><code>Alt+Left</code></td><td>Previous chapter</td></tr>
-        <tr><td><code>Alt+Right</code></td><td>Next chapter</td></tr>
-        <tr><td><code>Ctrl+M</code></td><td>Mark chapter complete</td></tr>
-        <tr><td><code>Ctrl+T</code></td><td>Toggle TOC panel</td></tr>
-        <tr><td colspan="2"><b>Search</b></td></tr>
-        <tr><td><code>Ctrl+F</code></td><td>Find in current chapter</td></tr>
-        <tr><td><code>Ctrl+Shift+F</code></td><td>Search all books</td></tr>
-        <tr><td colspan="2"><b>Code</b></td></tr>
-        <tr><td><code>F5</code></td><td>Run code</td></tr>
-        <tr><td><code>Shift+F5</code></td><td>Stop execution</td></tr>
-        <tr><td><code>Ctrl+S</code></td><td>Save code to file</td></tr>
-        <tr><td><code>Ctrl+O</code></td><td>Load code from file</td></tr>
-        <tr><td><code>Ctrl+E</code></td><td>Open in external editor</td></tr>
-        <tr><td colspan="2"><b>View</b></td></tr>
-        <tr><td><code>Ctrl+=</code></td><td>Increase font size</td></tr>
-        <tr><td><code>Ctrl+-</code></td><td>Decrease font size</td></tr>
-        <tr><td><code>Ctrl+1</code></td><td>Focus TOC panel</td></tr>
-        <tr><td><code>Ctrl+2</code></td><td>Focus reader panel</td></tr>
-        <tr><td><code>Ctrl+3</code></td><td>Focus code editor</td></tr>
-        <tr><td colspan="2"><b>Notes &amp; Bookmarks</b></td></tr>
-        <tr><td><code>Ctrl+B</code></td><td>Add bookmark</td></tr>
-        <tr><td><code>Ctrl+N</code></td><td>Add note</td></tr>
-        <tr><td><code>Ctrl+Q</code></td><td>Take quiz for current chapter</td></tr>
-        <tr><td><code>Ctrl+Shift+Q</code></td><td>Code challenge for current chapter</td></tr>
-        <tr><td><code>Ctrl+P</code></td><td>Open book project</td></tr>
-        <tr><td colspan="2"><b>Other</b></td></tr>
-        <tr><td><code>Ctrl+/</code></td><td>Show this dialog</td></tr>
-        </table>
-        """
-        QMessageBox.information(self, "Keyboard Shortcuts", shortcuts_html)
+        QMessageBox.information(self, "Keyboard Shortcuts", _SHORTCUTS_HTML)
 
     @safe_slot
     def _show_about(self) -> None:
-        QMessageBox.about(
-            self,
-            f"About {APP_NAME}",
-            f"<h2>{APP_NAME} v{APP_VERSION}</h2>"
-            f"<p>Interactive Python Learning Desktop App</p>"
-            f"<p>Read O'Reilly Python books with an integrated "
-            f"code editor and execution console.</p>"
-            f"<p>Built with PyQt6, QScintilla, PyMuPDF, and Pygments.</p>",
-        )
+        QMessageBox.about(self, _ABOUT_TITLE, _ABOUT_HTML)
 
     # --- Lifecycle ---
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """Save state on close."""
         self._save_state()
-        # Clean up external editor temp files
-        self._external_editor.cleanup()
-        # Kill session subprocess and wait for it to be reaped
-        self._session.reset()
+        # Signal subprocesses to die first so they wind down in parallel
+        # with the rest of the cleanup
+        self._session.close()
         if self._parse_process and self._parse_process.is_running():
             self._parse_process.stop()
+        # Clean up external editor temp files
+        self._external_editor.cleanup()
         if self._exec_worker and self._exec_worker.isRunning():
             self._session.stop()  # ensure subprocess is dead so thread can exit
-            if not self._exec_worker.wait(5000):
+            if not self._wait_for_thread(self._exec_worker, 5000):
                 self._exec_worker.terminate()
         super().closeEvent(event)
+
+    @staticmethod
+    def _wait_for_thread(thread: QThread, timeout_ms: int) -> bool:
+        """Wait for *thread* to finish while keeping the event loop running.
+
+        Unlike QThread.wait(), the window keeps repainting while a worker
+        winds down. Returns True if the thread finished within the timeout.
+        """
+        loop = QEventLoop()
+        thread.finished.connect(loop.quit)
+        deadline = QTimer()
+        deadline.setSingleShot(True)
+        deadline.timeout.connect(loop.quit)
+
+        deadline.start(timeout_ms)
+        # Checked after connecting, so a thread finishing in between still quits the loop
+        if thread.isRunning():
+            loop.exec()
+        deadline.stop()
+        thread.finished.disconnect(loop.quit)
+        return not thread.isRunning()
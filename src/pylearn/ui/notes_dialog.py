@@ -4,8 +4,10 @@
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import Callable
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, Qt
 from PyQt6.QtWidgets import (
     QDialog,
     QHBoxLayout,
@@ -14,8 +16,7 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QSplitter,
     QTextEdit,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
@@ -24,6 +25,96 @@ from pylearn.core.database import Database
 
 logger = logging.getLogger("pylearn.ui.notes_dialog")
 
+# Flattens note content onto a single line for the preview column
+_PREVIEW_TRANS = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+# Notes fetched per database round trip; more are loaded as the list scrolls
+_NOTES_PAGE_SIZE = 100
+
+_HEADERS = ("Section", "Preview")
+
+# Shown in the Section column for notes saved without a section title
+_GENERAL = sys.intern("General")
+
+
+class NotesModel(QAbstractItemModel):
+    """Flat two-column model over note rows, fetched a page at a time.
+
+    Rows are the dicts returned by the database. The view calls
+    canFetchMore()/fetchMore() as it scrolls towards the end, so only the
+    pages the user actually reaches are queried.
+    """
+
+    def __init__(self, fetch_page: Callable[[int, int], list[dict]], parent=None) -> None:
+        super().__init__(parent)
+        self._fetch_page = fetch_page
+        self._notes: list[dict] = []
+        self._has_more = False
+        # Notes share a handful of section titles; keep one string per title
+        self._titles: dict[str, str] = {}
+
+    def reset(self) -> None:
+        """Drop all rows and load the first page again."""
+        self.beginResetModel()
+        self._notes = []
+        self._has_more = True
+        self.endResetModel()
+        self.fetchMore()
+
+    def note(self, row: int) -> dict | None:
+        return self._notes[row] if 0 <= row < len(self._notes) else None
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if parent.isValid() or not (0 <= row < len(self._notes) and 0 <= column < len(_HEADERS)):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        return QModelIndex()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._notes)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        note = self.note(index.row()) if index.isValid() else None
+        if note is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == 0:
+                return note.get("section_title") or _GENERAL
+            return note.get("content", "")[:50].translate(_PREVIEW_TRANS)
+        if role == Qt.ItemDataRole.UserRole:
+            return note
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return _HEADERS[section] if 0 <= section < len(_HEADERS) else None
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid() or not self._has_more:
+            return
+        notes = self._fetch_page(len(self._notes), _NOTES_PAGE_SIZE)
+        self._has_more = len(notes) == _NOTES_PAGE_SIZE
+        if not notes:
+            return
+        titles = self._titles
+        for note in notes:
+            title = note.get("section_title")
+            if title:
+                note["section_title"] = titles.setdefault(title, title)
+        start = len(self._notes)
+        self.beginInsertRows(QModelIndex(), start, start + len(notes) - 1)
+        self._notes.extend(notes)
+        self.endInsertRows()
+
 
 class NotesDialog(QDialog):
     """Dialog for viewing and editing notes."""
@@ -55,10 +146,13 @@ class NotesDialog(QDialog):
         splitter = QSplitter(Qt.Orientation.Horizontal)
 
         # Note list
-        self._tree = QTreeWidget()
-        self._tree.setHeaderLabels(["Section", "Preview"])
+        self._model = NotesModel(self._fetch_notes_page, self)
+        self._tree = QTreeView()
+        self._tree.setModel(self._model)
+        self._tree.setRootIsDecorated(False)
+        self._tree.setUniformRowHeights(True)
         self._tree.setColumnWidth(0, 150)
-        self._tree.itemClicked.connect(self._on_note_selected)
+        self._tree.clicked.connect(self._on_note_selected)
         splitter.addWidget(self._tree)
 
         # Note editor
@@ -103,21 +197,16 @@ class NotesDialog(QDialog):
         self._load_notes()
 
     def _load_notes(self) -> None:
-        self._tree.clear()
-        logger.debug("_load_notes: querying db for book=%s chapter=%s", self._book_id, self._chapter_num)
-        notes = self._db.get_notes(self._book_id, self._chapter_num)
-        logger.debug("_load_notes: got %d notes", len(notes))
+        """Reset the note list and load its first page."""
+        logger.debug("_load_notes: book=%s chapter=%s", self._book_id, self._chapter_num)
+        self._model.reset()
+        logger.debug("_load_notes: %d notes loaded", self._model.rowCount())
 
-        for note in notes:
-            item = QTreeWidgetItem(self._tree)
-            item.setText(0, note.get("section_title", "General"))
-            preview = note["content"][:50].replace("\n", " ")
-            item.setText(1, preview)
-            item.setData(0, Qt.ItemDataRole.UserRole, note)
-        logger.debug("_load_notes: tree populated")
-
-    def _on_note_selected(self, item: QTreeWidgetItem, column: int) -> None:
-        note = item.data(0, Qt.ItemDataRole.UserRole)
+    def _fetch_notes_page(self, offset: int, limit: int) -> list[dict]:
+        return self._db.get_notes_page(self._book_id, self._chapter_num, offset, limit)
+
+    def _on_note_selected(self, index: QModelIndex) -> None:
+        note = index.data(Qt.ItemDataRole.UserRole)
         if note:
             self._current_note_id = note["note_id"]
             self._editor.setText(note["content"])
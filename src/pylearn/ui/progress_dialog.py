@@ -3,21 +3,124 @@
 
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, Qt
+from PyQt6.QtGui import QColor, QFont, QPalette
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
     QDialog,
-    QGridLayout,
-    QGroupBox,
     QHBoxLayout,
     QLabel,
-    QProgressBar,
+    QListView,
     QPushButton,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionProgressBar,
     QVBoxLayout,
 )
 
 from pylearn.core.database import Database
 from pylearn.utils.export import compute_overall_grade
 
+# Row geometry for the custom delegate (pixels)
+_PADDING = 8
+_BAR_HEIGHT = 28
+_LINE_SPACING = 4
+
+# Color of the right-hand notes on stat lines ("40% of grade")
+_NOTE_COLOR = QColor("gray")
+
+
+class BookProgressModel(QAbstractListModel):
+    """List model with one progress summary row per book.
+
+    Each row is a plain dict built once from the database; the view only
+    asks for the rows that are actually on screen.
+    """
+
+    def __init__(self, rows: list[dict] | None = None, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: list[dict] = rows or []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row["title"]
+        if role == Qt.ItemDataRole.UserRole:
+            return row
+        return None
+
+
+class BookProgressDelegate(QStyledItemDelegate):
+    """Paints a book's title, grade bar, and stat lines without child widgets."""
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        row = index.data(Qt.ItemDataRole.UserRole)
+        line_h = option.fontMetrics.height() + _LINE_SPACING
+        n_lines = 1 + (len(row["lines"]) if row else 0)  # title + stat lines
+        return QSize(option.rect.width(), 2 * _PADDING + _BAR_HEIGHT + _LINE_SPACING + n_lines * line_h)
+
+    def paint(self, painter, option, index: QModelIndex) -> None:
+        row = index.data(Qt.ItemDataRole.UserRole)
+        if not row:
+            return
+        style = option.widget.style() if option.widget else QApplication.style()
+        fm = option.fontMetrics
+        line_h = fm.height() + _LINE_SPACING
+        rect = option.rect.adjusted(_PADDING, _PADDING, -_PADDING, -_PADDING)
+
+        painter.save()
+
+        # Separator between books
+        painter.setPen(option.palette.color(QPalette.ColorRole.Mid))
+        painter.drawLine(option.rect.bottomLeft(), option.rect.bottomRight())
+
+        # Title
+        title_font = QFont(option.font)
+        title_font.setBold(True)
+        painter.setFont(title_font)
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        y = rect.top()
+        painter.drawText(QRect(rect.left(), y, rect.width(), line_h), Qt.AlignmentFlag.AlignVCenter, row["title"])
+        y += line_h
+
+        # Overall grade bar
+        bar = QStyleOptionProgressBar()
+        bar.rect = QRect(rect.left(), y, rect.width(), _BAR_HEIGHT)
+        bar.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Horizontal
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = row["grade"]
+        bar.text = f"Overall: {row['grade']}% ({row['label']})"
+        bar.textVisible = True
+        bar.textAlignment = Qt.AlignmentFlag.AlignCenter
+        bar.fontMetrics = fm
+        bar_palette = QPalette(option.palette)
+        bar_palette.setColor(QPalette.ColorRole.Highlight, QColor(ProgressDialog._grade_color(row["grade"])))
+        bar.palette = bar_palette
+        painter.setFont(title_font)
+        style.drawControl(QStyle.ControlElement.CE_ProgressBar, bar, painter, option.widget)
+        y += _BAR_HEIGHT + _LINE_SPACING
+
+        # Stat lines: left-aligned text with an optional gray right-hand note
+        painter.setFont(option.font)
+        text_color = option.palette.color(QPalette.ColorRole.Text)
+        for text, note in row["lines"]:
+            line_rect = QRect(rect.left(), y, rect.width(), line_h)
+            painter.setPen(text_color)
+            painter.drawText(line_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+            if note:
+                painter.setPen(_NOTE_COLOR)
+                painter.drawText(line_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, note)
+            y += line_h
+
+        painter.restore()
+
 
 class ProgressDialog(QDialog):
     """Dialog showing reading progress across all books."""
@@ -35,73 +138,23 @@ class ProgressDialog(QDialog):
         header.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 12px;")
         layout.addWidget(header)
 
-        # Load stats for each book
+        # One model row per book -- the list view only paints visible rows,
+        # so the dialog opens quickly even for large libraries.
         books = self._db.get_books()
-        for book in books:
-            book_id = book["book_id"]
-            stats = self._db.get_completion_stats(book_id)
-
-            group = QGroupBox(book["title"])
-            group.setStyleSheet("QGroupBox { font-weight: bold; font-size: 13px; }")
-            group_layout = QGridLayout(group)
-
-            # Overall grade
-            grade_data = compute_overall_grade(self._db, book_id)
-            grade = grade_data["grade"]
-            label = grade_data["label"]
-
-            grade_bar = QProgressBar()
-            grade_bar.setMinimum(0)
-            grade_bar.setMaximum(100)
-            grade_bar.setValue(grade)
-            grade_bar.setFormat(f"Overall: {grade}% ({label})")
-            grade_bar.setMinimumHeight(28)
-            grade_bar.setStyleSheet(self._grade_bar_style(grade))
-            group_layout.addWidget(grade_bar, 0, 0, 1, 2)
-
-            # Breakdown
-            breakdown = grade_data["breakdown"]
-            row = 1
-            for cat, info in breakdown.items():
-                cat_label = _CATEGORY_LABELS.get(cat, cat.title())
-                text = f"{cat_label}: {info['numerator']}/{info['denominator']} ({info['score']}%)"
-                group_layout.addWidget(QLabel(text), row, 0)
-                weight_label = QLabel(f"{info['weight']}% of grade")
-                weight_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-                weight_label.setStyleSheet("color: gray; font-size: 11px;")
-                group_layout.addWidget(weight_label, row, 1)
-                row += 1
-
-            # Reading detail
-            group_layout.addWidget(
-                QLabel(
-                    f"Chapters: {stats['completed']} done, {stats['in_progress']} in progress, "
-                    f"{stats['not_started']} not started"
-                ),
-                row,
-                0,
-                1,
-                2,
-            )
-            row += 1
-
-            # Exercise stats
-            completed_ex, total_ex = self._db.get_exercise_completion_count(book_id)
-            if total_ex:
-                group_layout.addWidget(
-                    QLabel(f"Exercises: {completed_ex} / {total_ex} completed"),
-                    row,
-                    0,
-                    1,
-                    2,
-                )
+        self._model = BookProgressModel([self._book_row(book) for book in books], self)
 
-            layout.addWidget(group)
+        self._view = QListView()
+        self._view.setModel(self._model)
+        self._view.setItemDelegate(BookProgressDelegate(self._view))
+        self._view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self._view.setUniformItemSizes(False)
+        self._view.setVisible(bool(books))
+        layout.addWidget(self._view)
 
         if not books:
             layout.addWidget(QLabel("No books registered yet.\nAdd books via Book > Manage Library."))
-
-        layout.addStretch()
+            layout.addStretch()
 
         # Close
         close_layout = QHBoxLayout()
@@ -111,21 +164,52 @@ class ProgressDialog(QDialog):
         close_layout.addWidget(close_btn)
         layout.addLayout(close_layout)
 
+    def _book_row(self, book: dict) -> dict:
+        """Collect the display data for one book into a model row."""
+        book_id = book["book_id"]
+        stats = self._db.get_completion_stats(book_id)
+        grade_data = compute_overall_grade(self._db, book_id)
+
+        lines: list[tuple[str, str]] = []
+        for cat, info in grade_data["breakdown"].items():
+            cat_label = _CATEGORY_LABELS.get(cat, cat.title())
+            lines.append(
+                (
+                    f"{cat_label}: {info['numerator']}/{info['denominator']} ({info['score']}%)",
+                    f"{info['weight']}% of grade",
+                )
+            )
+
+        lines.append(
+            (
+                f"Chapters: {stats['completed']} done, {stats['in_progress']} in progress, "
+                f"{stats['not_started']} not started",
+                "",
+            )
+        )
+
+        completed_ex, total_ex = self._db.get_exercise_completion_count(book_id)
+        if total_ex:
+            lines.append((f"Exercises: {completed_ex} / {total_ex} completed", ""))
+
+        return {
+            "book_id": book_id,
+            "title": book["title"],
+            "grade": grade_data["grade"],
+            "label": grade_data["label"],
+            "lines": lines,
+        }
+
     @staticmethod
-    def _grade_bar_style(grade: int) -> str:
-        """Return a QSS snippet that colors the progress bar by grade."""
+    def _grade_color(grade: int) -> str:
+        """Return the progress bar color for a grade."""
         if grade >= 90:
-            color = "#27ae60"  # green
-        elif grade >= 70:
-            color = "#2980b9"  # blue
-        elif grade >= 50:
-            color = "#f39c12"  # orange
-        else:
-            color = "#c0392b"  # red
-        return (
-            f"QProgressBar::chunk {{ background-color: {color}; border-radius: 3px; }}"
-            f"QProgressBar {{ text-align: center; font-weight: bold; }}"
-        )
+            return "#27ae60"  # green
+        if grade >= 70:
+            return "#2980b9"  # blue
+        if grade >= 50:
+            return "#f39c12"  # orange
+        return "#c0392b"  # red
 
 
 _CATEGORY_LABELS = {
@@ -3,8 +3,23 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Callable
+
 from PyQt6.QtCore import Qt, QTimer, QUrl, pyqtSignal
-from PyQt6.QtGui import QColor, QDesktopServices, QKeySequence, QPalette, QShortcut, QTextDocument
+from PyQt6.QtGui import (
+    QColor,
+    QDesktopServices,
+    QKeySequence,
+    QPalette,
+    QShortcut,
+    QTextBlockFormat,
+    QTextCharFormat,
+    QTextCursor,
+    QTextDocument,
+    QTextFormat,
+)
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -18,6 +33,16 @@ from PyQt6.QtWidgets import (
 from pylearn.core.models import BlockType, ContentBlock
 from pylearn.renderer.html_renderer import HTMLRenderer
 
+# Blocks rendered per chunk when streaming a chapter into the document.
+# The first chunk goes in synchronously so the top of the chapter shows at once.
+_STREAM_CHUNK_BLOCKS = 32
+
+# Applied to the document text before find-in-chapter matching. Keeps one
+# character per document position: non-breaking spaces match a typed space,
+# and U+0130 (the only character whose lower() is two characters) is
+# folded ahead of lower().
+_FIND_TRANS = str.maketrans({"\u00a0": " ", "\u0130": "i"})
+
 
 class FindBar(QWidget):
     """Inline find bar for searching within the current chapter."""
@@ -41,6 +66,13 @@ class FindBar(QWidget):
         self._input.textChanged.connect(self._on_text_changed)
         layout.addWidget(self._input, 1)
 
+        # Throttle find-as-you-type: while typing, search at most once per
+        # 150ms for the latest text, however fast the keystrokes arrive
+        self._find_timer = QTimer(self)
+        self._find_timer.setInterval(150)
+        self._find_timer.timeout.connect(self._fire_find)
+        self._pending_text = ""
+
         self._status = QLabel("")
         self._status.setStyleSheet("color: #888; font-size: 11px; min-width: 60px;")
         layout.addWidget(self._status)
@@ -69,6 +101,7 @@ class FindBar(QWidget):
         self._input.selectAll()
 
     def hide_bar(self) -> None:
+        self._cancel_pending_find()
         self.setVisible(False)
         self._status.setText("")
         self.closed.emit()
@@ -80,21 +113,38 @@ class FindBar(QWidget):
         return self._input.text()
 
     def _on_next(self) -> None:
+        self._cancel_pending_find()
         text = self._input.text()
         if text:
             self.find_next.emit(text, False)
 
     def _on_prev(self) -> None:
+        self._cancel_pending_find()
         text = self._input.text()
         if text:
             self.find_prev.emit(text, False)
 
     def _on_text_changed(self, text: str) -> None:
         if text:
-            self.find_next.emit(text, False)
+            self._pending_text = text
+            if not self._find_timer.isActive():
+                self._find_timer.start()
         else:
+            self._cancel_pending_find()
             self._status.setText("")
 
+    def _fire_find(self) -> None:
+        """Search for the latest typed text; stop ticking once typing has paused."""
+        text, self._pending_text = self._pending_text, ""
+        if text:
+            self.find_next.emit(text, False)
+        else:
+            self._find_timer.stop()
+
+    def _cancel_pending_find(self) -> None:
+        self._find_timer.stop()
+        self._pending_text = ""
+
     def keyPressEvent(self, event) -> None:
         if event.key() == Qt.Key.Key_Escape:
             self.hide_bar()
@@ -117,11 +167,33 @@ class ReaderPanel(QWidget):
         self._current_blocks: list[ContentBlock] = []
         self._block_map: dict[str, ContentBlock] = {}
         self._showing_welcome: bool = False
-
-        # Heading scroll tracking: [(doc_y_position, block_index)]
-        self._heading_positions: list[tuple[float, int]] = []
+        # Rendered HTML per block of the current chapter, keyed by id(block).
+        # Font-size changes reuse it; theme/language/image changes clear it.
+        self._block_html_cache: dict[int, str] = {}
+        # Last applied theme/font size, so repeated calls can skip re-rendering
+        self._current_theme: str | None = None
+        self._current_font_size: int | None = None
+        # Blocks of the current chapter not yet inserted into the document,
+        # and a scroll action to run once they all have been
+        self._pending_blocks: deque[ContentBlock] = deque()
+        self._after_display: Callable[[], None] | None = None
+
+        # Heading scroll tracking: document y-positions of the headings, sorted,
+        # and the block index of the heading at the same position
+        self._heading_y: list[float] = []
+        self._heading_block_idx: list[int] = []
         self._last_heading_index: int = -1
 
+        # Find-in-chapter: document positions of every match of _find_key
+        # (text, case_sensitive); cleared whenever the document changes
+        self._find_key: tuple[str, bool] | None = None
+        self._find_matches: list[int] = []
+        # Index into _find_matches of the match last selected by find, or -1
+        self._match_index = -1
+        # Document text prepared for matching, keyed by case_sensitive;
+        # shared by every query until the document changes
+        self._find_haystacks: dict[bool, str] = {}
+
         # Layout: find bar on top, browser below
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -137,7 +209,9 @@ class ReaderPanel(QWidget):
         self._browser.setOpenLinks(False)
         self._browser.setOpenExternalLinks(False)
         self._browser.anchorClicked.connect(self._handle_link)
+        self._browser.document().contentsChanged.connect(self._invalidate_find)
         layout.addWidget(self._browser)
+        self._apply_stylesheet()
 
         # Debounce scroll events (150ms) to avoid excessive processing
         self._scroll_timer = QTimer()
@@ -147,6 +221,12 @@ class ReaderPanel(QWidget):
 
         self._browser.verticalScrollBar().valueChanged.connect(self._on_scroll)
 
+        # Streams the remaining chapter blocks into the document, one chunk per tick
+        self._stream_timer = QTimer()
+        self._stream_timer.setSingleShot(True)
+        self._stream_timer.setInterval(0)
+        self._stream_timer.timeout.connect(self._drain_blocks)
+
         # Keyboard shortcut for Ctrl+F
         shortcut = QShortcut(QKeySequence("Ctrl+F"), self)
         shortcut.activated.connect(self.show_find_bar)
@@ -157,25 +237,112 @@ class ReaderPanel(QWidget):
         return self._browser.verticalScrollBar()
 
     def display_blocks(self, blocks: list[ContentBlock]) -> None:
-        """Render and display a list of content blocks."""
+        """Render and display a list of content blocks.
+
+        Only the first chunk is parsed before returning; the rest of the
+        chapter is appended from the event loop so long chapters don't
+        block the UI. Scroll requests made meanwhile are deferred until the
+        whole chapter is in place.
+        """
         self._showing_welcome = False
+        if blocks is not self._current_blocks:
+            self._block_html_cache.clear()
         self._current_blocks = blocks
+        # Only code and heading blocks carry IDs; body text is never looked up
         self._block_map = {b.block_id: b for b in blocks if b.block_id}
         self._last_heading_index = -1
-        html_content = self._renderer.render_blocks(blocks)
-        self._browser.setHtml(html_content)
+        self._heading_y.clear()
+        self._heading_block_idx.clear()
+        self._after_display = None
+
+        self._pending_blocks = deque(blocks[_STREAM_CHUNK_BLOCKS:])
+        first = blocks[:_STREAM_CHUNK_BLOCKS]
+        self._browser.setHtml(self._renderer.wrap_body(self._render_body(first)))
+        if self._pending_blocks:
+            self._stream_timer.start()
+        else:
+            self._stream_timer.stop()
+            self._on_blocks_displayed()
+
+    def _drain_blocks(self) -> None:
+        """Append the next chunk of pending blocks to the document."""
+        pending = self._pending_blocks
+        chunk = [pending.popleft() for _ in range(min(len(pending), _STREAM_CHUNK_BLOCKS))]
+        if chunk:
+            doc = self._browser.document()
+            undo_enabled = doc.isUndoRedoEnabled()
+            doc.setUndoRedoEnabled(False)
+            try:
+                cursor = QTextCursor(doc)
+                cursor.movePosition(QTextCursor.MoveOperation.End)
+                # insertHtml() merges the chunk's first paragraph into the block
+                # at the cursor, keeping that block's format. Start a new block
+                # that already has the format the paragraph would get on its own.
+                # The chunk is wrapped in <body> so it picks up the body CSS.
+                cursor.insertBlock(self._leading_block_format(chunk[0]))
+                lead = cursor.position()
+                cursor.insertHtml(self._renderer.wrap_body(self._render_body(chunk)))
+                if doc.findBlock(lead).length() == 1:
+                    # Chunk opened with a table (e.g. a code block), which can't
+                    # merge into a paragraph; drop the empty block left behind.
+                    cursor.setPosition(lead)
+                    cursor.deletePreviousChar()
+            finally:
+                doc.setUndoRedoEnabled(undo_enabled)
+        if pending:
+            self._stream_timer.start()
+        else:
+            self._on_blocks_displayed()
+
+    def _leading_block_format(self, block: ContentBlock) -> QTextBlockFormat:
+        """Return the block format of the first paragraph *block* renders to."""
+        scratch = QTextDocument()
+        scratch.setDefaultStyleSheet(self._browser.document().defaultStyleSheet())
+        scratch.setHtml(self._renderer.wrap_body(self._render_body([block])))
+        return scratch.begin().blockFormat()
+
+    def _on_blocks_displayed(self) -> None:
+        """Finish a chapter display once every block is in the document."""
         # Build heading position map after layout completes
         QTimer.singleShot(0, self._build_heading_map)
+        action, self._after_display = self._after_display, None
+        if action is not None:
+            action()
+
+    def _when_displayed(self, action: Callable[[], None]) -> None:
+        """Run *action* now, or once the current chapter has finished streaming."""
+        if self._pending_blocks:
+            self._after_display = action
+        else:
+            action()
+
+    def _cancel_streaming(self) -> None:
+        self._stream_timer.stop()
+        self._pending_blocks.clear()
+        self._after_display = None
+
+    def _render_body(self, blocks: list[ContentBlock]) -> str:
+        """Join the HTML fragments for *blocks*, rendering only uncached ones."""
+        cache = self._block_html_cache
+        render = self._renderer.render_block
+        parts = []
+        for block in blocks:
+            fragment = cache.get(id(block))
+            if fragment is None:
+                fragment = cache[id(block)] = render(block)
+            parts.append(fragment)
+        return "\n".join(parts)
 
     def display_html(self, html_content: str) -> None:
         """Display raw HTML content."""
+        self._cancel_streaming()
         self._browser.setHtml(html_content)
 
     def display_welcome(self) -> None:
         """Show a welcome message when no book is loaded."""
         self._showing_welcome = True
-        html = self._renderer.render_welcome()
-        self._browser.setHtml(html)
+        self._cancel_streaming()
+        self._browser.setHtml(self._renderer.wrap_welcome())
 
     def get_block(self, block_id: str) -> ContentBlock | None:
         """Get a content block by its ID."""
@@ -183,11 +350,22 @@ class ReaderPanel(QWidget):
 
     def scroll_to_block(self, block_id: str) -> None:
         """Scroll to a specific content block."""
-        self._browser.scrollToAnchor(block_id)
+        self._when_displayed(lambda: self._browser.scrollToAnchor(block_id))
+
+    def set_scroll_position(self, value: int) -> None:
+        """Set the vertical scroll position of the current chapter."""
+        self._when_displayed(lambda: self._browser.verticalScrollBar().setValue(value))
 
     def set_theme(self, theme_name: str) -> None:
         """Update the rendering theme."""
+        if theme_name == self._current_theme:
+            return
+        self._current_theme = theme_name
         self._renderer.update_theme(theme_name)
+        if self._current_font_size is not None:
+            # update_theme() starts from the theme's default sizes
+            self._renderer.update_font_size(self._current_font_size)
+        self._block_html_cache.clear()  # token colors depend on the theme
         # Set palette link color so QTextBrowser doesn't default to system blue
         from pylearn.ui.theme_registry import get_palette
 
@@ -196,28 +374,116 @@ class ReaderPanel(QWidget):
         palette.setColor(QPalette.ColorRole.Link, accent)
         palette.setColor(QPalette.ColorRole.LinkVisited, accent)
         self._browser.setPalette(palette)
+        self._apply_stylesheet()
         if self._current_blocks:
-            pos = self._browser.verticalScrollBar().value()
-            self.display_blocks(self._current_blocks)
-            self._browser.verticalScrollBar().setValue(pos)
+            self._redisplay_current()
         elif self._showing_welcome:
             self.display_welcome()
 
     def set_font_size(self, size: int) -> None:
         """Update the reader font size."""
+        if size == self._current_font_size:
+            return
+        old_sizes = self._renderer.font_sizes()
+        self._current_font_size = size
         self._renderer.update_font_size(size)
-        if self._current_blocks:
-            pos = self._browser.verticalScrollBar().value()
-            self.display_blocks(self._current_blocks)
-            self._browser.verticalScrollBar().setValue(pos)
+        self._apply_stylesheet()
+        if not self._current_blocks:
+            return
+        # Sizes only come from the stylesheet, so a fully displayed chapter
+        # can be resized in place. Sizes shared by two roles can't be told
+        # apart in the document; re-display the chapter then.
+        if self._pending_blocks or len(set(old_sizes)) < len(old_sizes):
+            self._redisplay_current()
+        else:
+            self._resize_fonts(dict(zip(old_sizes, self._renderer.font_sizes(), strict=True)))
+
+    def _apply_stylesheet(self) -> None:
+        """Install the renderer's CSS as the document's default stylesheet."""
+        self._browser.document().setDefaultStyleSheet(self._renderer.get_stylesheet())
+
+    def _redisplay_current(self) -> None:
+        """Re-display the current chapter from cached block HTML, keeping the reading position."""
+        restore_scroll = self._scroll_restorer()
+        self.display_blocks(self._current_blocks)
+        self._when_displayed(restore_scroll)
+
+    def _scroll_restorer(self) -> Callable[[], None]:
+        """Return an action that scrolls back to the current reading position.
+
+        Pixel offsets go stale when the layout changes, so the position is
+        the heading at the top of the viewport, restored by anchor. Before
+        any heading has been tracked it falls back to the fraction of the
+        document height.
+        """
+        if 0 <= self._last_heading_index < len(self._current_blocks):
+            anchor = self._current_blocks[self._last_heading_index].block_id
+            return lambda: self._browser.scrollToAnchor(anchor)
+        bar = self._browser.verticalScrollBar()
+        ratio = bar.value() / bar.maximum() if bar.maximum() > 0 else 0.0
+        return lambda: bar.setValue(round(ratio * bar.maximum()))
+
+    def _resize_fonts(self, sizes: dict[int, int]) -> None:
+        """Swap pixel font sizes in the displayed chapter (old size -> new size).
+
+        Only character formats change, so Qt re-lays the document out
+        without re-parsing the chapter HTML.
+        """
+        restore_scroll = self._scroll_restorer()
+        doc = self._browser.document()
+        pixel_size = QTextFormat.Property.FontPixelSize
+
+        # Collect the ranges first: merging formats can coalesce the
+        # fragments a block iterator is walking. Empty blocks have no
+        # fragments; their block char format sets the line height.
+        ranges: list[tuple[int, int, int]] = []  # (position, length, new size)
+        block = doc.begin()
+        while block.isValid():
+            if block.length() == 1:
+                new = sizes.get(block.charFormat().intProperty(pixel_size))
+                if new is not None:
+                    ranges.append((block.position(), 0, new))
+            it = block.begin()
+            while not it.atEnd():
+                fragment = it.fragment()
+                new = sizes.get(fragment.charFormat().intProperty(pixel_size))
+                if new is not None:
+                    ranges.append((fragment.position(), fragment.length(), new))
+                it += 1
+            block = block.next()
+
+        undo_enabled = doc.isUndoRedoEnabled()
+        doc.setUndoRedoEnabled(False)
+        try:
+            cursor = QTextCursor(doc)
+            cursor.beginEditBlock()
+            for position, length, new in ranges:
+                fmt = QTextCharFormat()
+                fmt.setProperty(pixel_size, new)
+                cursor.setPosition(position)
+                if length:
+                    cursor.setPosition(position + length, QTextCursor.MoveMode.KeepAnchor)
+                    cursor.mergeCharFormat(fmt)
+                else:
+                    cursor.mergeBlockCharFormat(fmt)
+            cursor.endEditBlock()
+        finally:
+            doc.setUndoRedoEnabled(undo_enabled)
+
+        restore_scroll()
+        # Heading y-positions moved with the new sizes
+        self._last_heading_index = -1
+        QTimer.singleShot(0, self._build_heading_map)
 
     def set_image_dir(self, image_dir: str) -> None:
         """Set the directory containing cached images for the current book."""
         self._renderer.image_dir = image_dir
+        self._block_html_cache.clear()
 
     def set_language(self, language: str) -> None:
         """Set the language for syntax highlighting in code blocks."""
         self._renderer.language = language
+        self._block_html_cache.clear()
 
     # --- Find bar ---
 
@@ -226,38 +492,106 @@ class ReaderPanel(QWidget):
         self._find_bar.show_bar()
 
     def _find_next(self, text: str, case_sensitive: bool) -> None:
-        """Find the next occurrence of text in the browser."""
-        flags = QTextDocument.FindFlag(0)
-        if case_sensitive:
-            flags |= QTextDocument.FindFlag.FindCaseSensitively
-        found = self._browser.find(text, flags)
-        if not found:
-            # Wrap around: move cursor to start and try again
+        """Select the next occurrence of text, wrapping to the top."""
+        new_query = (text, case_sensitive) != self._find_key
+        matches = self._match_positions(text, case_sensitive)
+        if not matches:
+            self._update_find_status(text)
+            return
+        if not new_query and self._on_current_match(len(text)):
+            i = (self._match_index + 1) % len(matches)
+        else:
             cursor = self._browser.textCursor()
-            cursor.movePosition(cursor.MoveOperation.Start)
-            self._browser.setTextCursor(cursor)
-            found = self._browser.find(text, flags)
-        self._update_find_status(text, found)
+            # A changed query may match where the old selection starts
+            # (typing "pri" -> "prin"), so search from there.
+            start = cursor.selectionStart() if new_query else cursor.selectionEnd()
+            i = bisect_left(matches, start)
+            if i == len(matches):
+                i = 0
+        self._select_match(i, len(text))
+        self._update_find_status(text)
 
     def _find_prev(self, text: str, case_sensitive: bool) -> None:
-        """Find the previous occurrence of text in the browser."""
-        flags = QTextDocument.FindFlag.FindBackward
-        if case_sensitive:
-            flags |= QTextDocument.FindFlag.FindCaseSensitively
-        found = self._browser.find(text, flags)
-        if not found:
-            # Wrap around: move cursor to end and try again
-            cursor = self._browser.textCursor()
-            cursor.movePosition(cursor.MoveOperation.End)
-            self._browser.setTextCursor(cursor)
-            found = self._browser.find(text, flags)
-        self._update_find_status(text, found)
+        """Select the previous occurrence of text, wrapping to the bottom."""
+        new_query = (text, case_sensitive) != self._find_key
+        matches = self._match_positions(text, case_sensitive)
+        if not matches:
+            self._update_find_status(text)
+            return
+        if not new_query and self._on_current_match(len(text)):
+            i = self._match_index - 1
+        else:
+            i = bisect_left(matches, self._browser.textCursor().selectionStart()) - 1
+        self._select_match(i % len(matches), len(text))  # -1 wraps to the last
+        self._update_find_status(text)
+
+    def _on_current_match(self, length: int) -> bool:
+        """Return True if the selection is still the match last selected by find.
+
+        Next/Prev then just step the match index; if the user has moved the
+        cursor since, the caller bisects from the cursor instead.
+        """
+        if self._match_index < 0:
+            return False
+        cursor = self._browser.textCursor()
+        position = self._find_matches[self._match_index]
+        return cursor.selectionStart() == position and cursor.selectionEnd() == position + length
+
+    def _match_positions(self, text: str, case_sensitive: bool) -> list[int]:
+        """Return the sorted document positions where *text* occurs.
+
+        The document is scanned once per query with ``str.find``; stepping
+        through matches afterwards is a bisect instead of another
+        ``QTextBrowser.find`` pass over the chapter.
+        """
+        key = (text, case_sensitive)
+        if key != self._find_key:
+            haystack = self._find_haystack(case_sensitive)
+            needle = text.translate(_FIND_TRANS)
+            if not case_sensitive:
+                needle = needle.lower()
+            matches: list[int] = []
+            find = haystack.find
+            pos = find(needle)
+            while pos >= 0:
+                matches.append(pos)
+                pos = find(needle, pos + 1)
+            self._find_key = key
+            self._find_matches = matches
+            self._match_index = -1
+        return self._find_matches
+
+    def _find_haystack(self, case_sensitive: bool) -> str:
+        """Return the document text to match against, building it once per document."""
+        haystack = self._find_haystacks.get(case_sensitive)
+        if haystack is None:
+            # toRawText() has exactly one character per cursor position
+            haystack = self._browser.document().toRawText().translate(_FIND_TRANS)
+            if not case_sensitive:
+                haystack = haystack.lower()
+            self._find_haystacks[case_sensitive] = haystack
+        return haystack
+
+    def _select_match(self, index: int, length: int) -> None:
+        self._match_index = index
+        position = self._find_matches[index]
+        cursor = self._browser.textCursor()
+        cursor.setPosition(position)
+        cursor.setPosition(position + length, QTextCursor.MoveMode.KeepAnchor)
+        self._browser.setTextCursor(cursor)
+        self._browser.ensureCursorVisible()
 
-    def _update_find_status(self, text: str, found: bool) -> None:
+    def _invalidate_find(self) -> None:
+        self._find_key = None
+        self._find_matches = []
+        self._match_index = -1
+        self._find_haystacks.clear()
+
+    def _update_find_status(self, text: str) -> None:
         if not text:
             self._find_bar.set_status("")
-        elif found:
-            self._find_bar.set_status("Found")
+        elif self._find_matches:
+            self._find_bar.set_status(f"{self._match_index + 1} / {len(self._find_matches)}")
         else:
             self._find_bar.set_status("Not found")
 
@@ -271,7 +605,8 @@ class ReaderPanel(QWidget):
 
     def _build_heading_map(self) -> None:
         """Record y-positions of heading anchors in the rendered document."""
-        self._heading_positions.clear()
+        self._heading_y.clear()
+        self._heading_block_idx.clear()
         doc = self._browser.document()
         layout = doc.documentLayout()
 
@@ -285,24 +620,23 @@ class ReaderPanel(QWidget):
         if not heading_ids:
             return
 
-        # Iterate document fragments to find <a name="heading_N"> anchors
+        # Only heading paragraphs can carry a heading anchor, and the renderer
+        # puts it on their first character. Check that one fragment per
+        # heading instead of walking every fragment of every block.
+        positions: list[tuple[float, int]] = []
         text_block = doc.begin()
         while text_block.isValid():
-            it = text_block.begin()
-            while not it.atEnd():
-                frag = it.fragment()
-                if frag.isValid():
-                    fmt = frag.charFormat()
-                    if fmt.isAnchor():
-                        for name in fmt.anchorNames():
-                            if name in heading_ids:
-                                rect = layout.blockBoundingRect(text_block)
-                                self._heading_positions.append((rect.y(), heading_ids[name]))
-                it += 1
+            if text_block.blockFormat().headingLevel():
+                for name in text_block.begin().fragment().charFormat().anchorNames():
+                    if name in heading_ids:
+                        rect = layout.blockBoundingRect(text_block)
+                        positions.append((rect.y(), heading_ids[name]))
             text_block = text_block.next()
 
         # Sort by y-position (should already be in order, but ensure it)
-        self._heading_positions.sort(key=lambda x: x[0])
+        positions.sort(key=lambda x: x[0])
+        self._heading_y = [y for y, _ in positions]
+        self._heading_block_idx = [i for _, i in positions]
 
     def _on_scroll(self, _value: int) -> None:
         """Debounce scroll events."""
@@ -310,20 +644,18 @@ class ReaderPanel(QWidget):
 
     def _update_visible_heading(self) -> None:
         """Find which heading is at the top of the viewport and emit signal."""
-        if not self._heading_positions:
+        if not self._heading_y:
             return
 
         scroll_y = self._browser.verticalScrollBar().value()
 
         # Find the last heading at or above the current scroll position
-        current_index = -1
-        for y_pos, block_index in self._heading_positions:
-            if y_pos <= scroll_y + 30:  # small offset for visual alignment
-                current_index = block_index
-            else:
-                break
-
-        if current_index >= 0 and current_index != self._last_heading_index:
+        i = bisect_right(self._heading_y, scroll_y + 30)  # small offset for visual alignment
+        if i == 0:
+            return
+        current_index = self._heading_block_idx[i - 1]
+
+        if current_index != self._last_heading_index:
             self._last_heading_index = current_index
             self.visible_heading_changed.emit(current_index)
 
@@ -331,14 +663,12 @@ class ReaderPanel(QWidget):
 
     def _handle_link(self, url: QUrl) -> None:
         """Handle clicks on internal links (copy, try in editor)."""
-        scheme = url.scheme()
-        block_id = url.path() if url.path() else url.host()
-        # QUrl may parse "copy:code_0" as scheme=copy, path=code_0
-        # or as scheme=copy, host=code_0 depending on format
-
-        if scheme == "copy":
-            self.code_copy_requested.emit(block_id)
-        elif scheme == "tryit":
-            self.code_tryit_requested.emit(block_id)
-        elif scheme in ("http", "https"):
+        # Dispatch on the raw string: QUrl may parse "copy:code_0" with the
+        # block ID in either path() or host(), but toString() is unambiguous.
+        link = url.toString()
+        if link.startswith("copy:"):
+            self.code_copy_requested.emit(link[5:])
+        elif link.startswith("tryit:"):
+            self.code_tryit_requested.emit(link[6:])
+        elif link.startswith(("http:", "https:")):
             QDesktopServices.openUrl(url)
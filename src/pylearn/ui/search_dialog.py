@@ -4,9 +4,13 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from itertools import groupby
 
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, QRectF, QSize, Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QAbstractTextDocumentLayout, QFont, QPalette, QTextDocument
 from PyQt6.QtWidgets import (
+    QApplication,
     QComboBox,
     QDialog,
     QHBoxLayout,
@@ -14,98 +18,327 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QProgressBar,
     QPushButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QTreeView,
     QVBoxLayout,
 )
 
 from pylearn.core.models import BlockType, Book
+from pylearn.core.search_index import SearchIndex
 from pylearn.parser.cache_manager import CacheManager
 from pylearn.ui.theme_registry import get_palette
 
 logger = logging.getLogger("pylearn.ui")
 
 
+# Results per results_batch emission; each one is a queued cross-thread call
+_RESULT_BATCH_SIZE = 20
+
+# Cap on results per search
+_MAX_RESULTS = 200
+
+# Pause in typing (ms) before an as-you-type search starts
+_SEARCH_DEBOUNCE_MS = 250
+
+# Item data role holding a match row's highlighted snippet HTML
+_SNIPPET_ROLE = Qt.ItemDataRole.UserRole + 1
+
+_HEADERS = ("Location", "Type", "Match")
+
+# (book_id, chapter_num, chapter_title, snippet, block_id, block_type_label)
+SearchResult = tuple[str, int, str, str, str, str]
+
+
+# Human-readable label per block type; types not listed show as "Body"
+_BLOCK_TYPE_LABELS: dict[BlockType, str] = {
+    BlockType.HEADING1: "Heading",
+    BlockType.HEADING2: "Heading",
+    BlockType.HEADING3: "Heading",
+    BlockType.BODY: "Body",
+    BlockType.CODE: "Code",
+    BlockType.CODE_REPL: "Code",
+    BlockType.NOTE: "Note",
+    BlockType.WARNING: "Warning",
+    BlockType.TIP: "Tip",
+    BlockType.EXERCISE: "Exercise",
+    BlockType.EXERCISE_ANSWER: "Exercise",
+    BlockType.TABLE: "Table",
+    BlockType.LIST_ITEM: "List",
+    BlockType.FIGURE: "Figure",
+    BlockType.FIGURE_CAPTION: "Figure",
+    BlockType.PAGE_HEADER: "Header",
+    BlockType.PAGE_FOOTER: "Footer",
+}
+
+
 def _block_type_label(block_type: BlockType) -> str:
     """Return a human-readable label for a block type."""
-    labels: dict[BlockType, str] = {
-        BlockType.HEADING1: "Heading",
-        BlockType.HEADING2: "Heading",
-        BlockType.HEADING3: "Heading",
-        BlockType.BODY: "Body",
-        BlockType.CODE: "Code",
-        BlockType.CODE_REPL: "Code",
-        BlockType.NOTE: "Note",
-        BlockType.WARNING: "Warning",
-        BlockType.TIP: "Tip",
-        BlockType.EXERCISE: "Exercise",
-        BlockType.EXERCISE_ANSWER: "Exercise",
-        BlockType.TABLE: "Table",
-        BlockType.LIST_ITEM: "List",
-        BlockType.FIGURE: "Figure",
-        BlockType.FIGURE_CAPTION: "Figure",
-        BlockType.PAGE_HEADER: "Header",
-        BlockType.PAGE_FOOTER: "Footer",
-    }
-    return labels.get(block_type, "Body")
+    return _BLOCK_TYPE_LABELS.get(block_type, "Body")
 
 
 class SearchWorker(QThread):
     """Background thread for searching book content."""
 
-    # book_id, chapter_num, title, snippet, block_id, block_type_label
-    result_found = pyqtSignal(str, int, str, str, str, str)
+    results_batch = pyqtSignal(list)  # list[SearchResult]
     finished = pyqtSignal(int)  # total results
 
-    def __init__(self, query: str, books: list[Book]) -> None:
+    def __init__(self, query: str, index: SearchIndex, book_id: str | None = None) -> None:
         super().__init__()
-        self.query = query.lower()
-        self.books = books
+        self.query = query.casefold()
+        self.index = index
+        self.book_id = book_id
         self._stop = False
 
     def run(self) -> None:
         total = 0
+        query = self.query
+        qlen = len(query)
+        index = self.index
+        # Hot loop: keep the index's parallel arrays in locals
+        book_ids = index.book_ids
+        chapter_nums = index.chapter_nums
+        chapter_titles = index.chapter_titles
+        block_ids = index.block_ids
+        block_types = index.block_types
+        texts = index.texts
+        batch: list[SearchResult] = []
         try:
-            for book in self.books:
+            for i, idx in index.scan(query, self.book_id, _MAX_RESULTS):
                 if self._stop:
                     break
 
-                book_id = book.book_id
-                for chapter in book.chapters:
-                    if self._stop:
-                        break
-                    for block in chapter.content_blocks:
-                        if self.query in block.text.lower():
-                            # Create a snippet around the match
-                            idx = block.text.lower().index(self.query)
-                            start = max(0, idx - 40)
-                            end = min(len(block.text), idx + len(self.query) + 40)
-                            snippet = block.text[start:end]
-                            if start > 0:
-                                snippet = "..." + snippet
-                            if end < len(block.text):
-                                snippet = snippet + "..."
-
-                            self.result_found.emit(
-                                book_id,
-                                chapter.chapter_num,
-                                chapter.title,
-                                snippet,
-                                block.block_id,
-                                _block_type_label(block.block_type),
-                            )
-                            total += 1
-                            if total >= 200:  # cap results
-                                return
+                # Create a snippet around the match, built as one f-string
+                text = texts[i]
+                start = idx - 40 if idx > 40 else 0
+                end = idx + qlen + 40
+                snippet = f"{'...' if start else ''}{text[start:end]}{'...' if end < len(text) else ''}"
+
+                batch.append(
+                    (
+                        book_ids[i],
+                        chapter_nums[i],
+                        chapter_titles[i],
+                        snippet,
+                        block_ids[i],
+                        _block_type_label(block_types[i]),
+                    )
+                )
+                total += 1
+                if len(batch) >= _RESULT_BATCH_SIZE:
+                    self.results_batch.emit(batch)
+                    batch = []
         except Exception:
             logger.exception("SearchWorker encountered an error")
         finally:
+            if batch:
+                self.results_batch.emit(batch)
             self.finished.emit(total)
 
     def stop(self) -> None:
         self._stop = True
 
 
+class BookLoadWorker(QThread):
+    """Background thread that loads cached books and indexes them for search."""
+
+    book_loaded = pyqtSignal(object)  # Book
+    index_ready = pyqtSignal(object)  # SearchIndex over every loaded book
+
+    def __init__(self, cache_manager: CacheManager, book_ids: list[str]) -> None:
+        super().__init__()
+        self._cache = cache_manager
+        self._book_ids = book_ids
+        self._stop = False
+
+    def run(self) -> None:
+        books: list[Book] = []
+        try:
+            for bid in self._book_ids:
+                if self._stop:
+                    return
+                book = self._cache.load(bid)
+                if book:
+                    books.append(book)
+                    self.book_loaded.emit(book)
+        except Exception:
+            logger.exception("BookLoadWorker encountered an error")
+        if not self._stop:
+            # Casefold and join every block once here, not once per search
+            self.index_ready.emit(SearchIndex(books))
+
+    def stop(self) -> None:
+        self._stop = True
+
+
+class _ChapterGroup:
+    """A chapter row of SearchResultsModel and the matches listed under it."""
+
+    __slots__ = ("label", "results", "row", "snippets")
+
+    def __init__(self, label: str, row: int) -> None:
+        self.label = label
+        self.row = row
+        self.results: list[SearchResult] = []
+        # Highlighted snippet HTML per match, built the first time it's shown
+        self.snippets: list[str | None] = []
+
+
+class SearchResultsModel(QAbstractItemModel):
+    """Two-level model of search hits: chapter rows with their matches as children.
+
+    Matches are kept as the tuples SearchWorker emits. The view only asks
+    for the rows on screen, so a match's snippet HTML is built by
+    *highlight* on first display rather than when the match arrives.
+    Child indexes carry their _ChapterGroup as the internal pointer;
+    chapter indexes carry none.
+    """
+
+    def __init__(self, highlight: Callable[[str], str], parent=None) -> None:
+        super().__init__(parent)
+        self._highlight = highlight
+        self._groups: list[_ChapterGroup] = []
+        self._group_by_chapter: dict[tuple[str, int], _ChapterGroup] = {}
+        self._bold = QFont()
+        self._bold.setBold(True)
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._groups = []
+        self._group_by_chapter = {}
+        self.endResetModel()
+
+    def add_results(self, results: list[SearchResult]) -> None:
+        """Append matches, creating chapter rows as needed.
+
+        Hits arrive in book and chapter order, so each run of matches from
+        one chapter is inserted with a single beginInsertRows().
+        """
+        for (book_id, chapter_num), run in groupby(results, key=lambda r: (r[0], r[1])):
+            matches = list(run)
+            group = self._group_by_chapter.get((book_id, chapter_num))
+            if group is None:
+                row = len(self._groups)
+                self.beginInsertRows(QModelIndex(), row, row)
+                group = _ChapterGroup(f"[{book_id}] Ch {chapter_num}: {matches[0][2]}", row)
+                self._groups.append(group)
+                self._group_by_chapter[book_id, chapter_num] = group
+                self.endInsertRows()
+            first = len(group.results)
+            self.beginInsertRows(self.createIndex(group.row, 0), first, first + len(matches) - 1)
+            group.results.extend(matches)
+            group.snippets.extend([None] * len(matches))
+            self.endInsertRows()
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not 0 <= column < len(_HEADERS):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column) if 0 <= row < len(self._groups) else QModelIndex()
+        if parent.internalPointer() is not None:
+            return QModelIndex()  # matches have no children
+        group = self._groups[parent.row()]
+        return self.createIndex(row, column, group) if 0 <= row < len(group.results) else QModelIndex()
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        group = index.internalPointer() if index.isValid() else None
+        return self.createIndex(group.row, 0) if group is not None else QModelIndex()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._groups)
+        if parent.internalPointer() is None and parent.column() == 0:
+            return len(self._groups[parent.row()].results)
+        return 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        group = index.internalPointer()
+        if group is None:
+            # Chapter row: a bold label, no UserRole data since it isn't navigable
+            if index.column() == 0:
+                if role == Qt.ItemDataRole.DisplayRole:
+                    return self._groups[index.row()].label
+                if role == Qt.ItemDataRole.FontRole:
+                    return self._bold
+            return None
+        row = index.row()
+        result = group.results[row]
+        if role == Qt.ItemDataRole.UserRole:
+            return (result[0], result[1], result[4])
+        if role == Qt.ItemDataRole.DisplayRole and index.column() == 1:
+            return result[5]
+        if role == _SNIPPET_ROLE and index.column() == 2:
+            html = group.snippets[row]
+            if html is None:
+                html = group.snippets[row] = self._highlight(result[3])
+            return html
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return _HEADERS[section] if 0 <= section < len(_HEADERS) else None
+        return None
+
+
+class SnippetDelegate(QStyledItemDelegate):
+    """Paints the rich-text snippet stored under _SNIPPET_ROLE.
+
+    Snippets are laid out only when a row is painted or measured, through
+    one shared QTextDocument, instead of keeping a QLabel per result.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._doc = QTextDocument(self)
+        self._doc.setDocumentMargin(2)
+
+    def _layout(self, html: str, option: QStyleOptionViewItem, width: int) -> QTextDocument:
+        doc = self._doc
+        doc.setDefaultFont(option.font)
+        doc.setHtml(html)
+        doc.setTextWidth(width)
+        return doc
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        html = index.data(_SNIPPET_ROLE)
+        if not html:
+            return super().sizeHint(option, index)
+        view = option.widget
+        width = view.columnWidth(index.column()) if isinstance(view, QTreeView) else option.rect.width()
+        doc = self._layout(html, option, width)
+        return QSize(width, int(doc.size().height()))
+
+    def paint(self, painter, option, index: QModelIndex) -> None:
+        html = index.data(_SNIPPET_ROLE)
+        if not html:
+            super().paint(painter, option, index)
+            return
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        # Background and selection only; the snippet is drawn on top
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        doc = self._layout(html, opt, opt.rect.width())
+        context = QAbstractTextDocumentLayout.PaintContext()
+        selected = opt.state & QStyle.StateFlag.State_Selected
+        role = QPalette.ColorRole.HighlightedText if selected else QPalette.ColorRole.Text
+        context.palette.setColor(QPalette.ColorRole.Text, opt.palette.color(role))
+        context.clip = QRectF(0, 0, opt.rect.width(), opt.rect.height())
+
+        painter.save()
+        painter.translate(opt.rect.topLeft())
+        painter.setClipRect(context.clip)
+        doc.documentLayout().draw(painter, context)
+        painter.restore()
+
+
 class SearchDialog(QDialog):
     """Dialog for searching across book content with block-level navigation."""
 
@@ -127,15 +360,9 @@ class SearchDialog(QDialog):
         self._worker: SearchWorker | None = None
         self._query: str = ""
 
-        # Pre-load all books once instead of re-parsing JSON per search
-        self._books: list[Book] = []
-        for bid in book_ids:
-            book = cache_manager.load(bid)
-            if book:
-                self._books.append(book)
-
-        # Track chapter parent items for grouping
-        self._chapter_items: dict[str, QTreeWidgetItem] = {}
+        # Books are loaded once, off the UI thread, instead of re-parsing JSON
+        # per search. Searching waits for the index; see _on_index_ready().
+        self._index: SearchIndex | None = None
 
         self.setWindowTitle("Search Books")
         self.setMinimumSize(700, 550)
@@ -155,9 +382,17 @@ class SearchDialog(QDialog):
         self._input = QLineEdit()
         self._input.setPlaceholderText("Search book content...")
         self._input.returnPressed.connect(self._search)
+        self._input.textChanged.connect(self._on_text_changed)
         search_layout.addWidget(self._input)
 
+        # Search as you type, once typing pauses for _SEARCH_DEBOUNCE_MS
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._search)
+
         self._search_btn = QPushButton("Search")
+        self._search_btn.setEnabled(False)
         self._search_btn.clicked.connect(self._search)
         search_layout.addWidget(self._search_btn)
 
@@ -173,11 +408,15 @@ class SearchDialog(QDialog):
         self._status = QLabel("")
         layout.addWidget(self._status)
 
-        self._results = QTreeWidget()
-        self._results.setHeaderLabels(["Location", "Type", "Match"])
+        # Results grouped by chapter; only the rows on screen are ever laid out
+        self._model = SearchResultsModel(self._highlight, self)
+        self._model.rowsInserted.connect(self._expand_new_chapters)
+        self._results = QTreeView()
+        self._results.setModel(self._model)
         self._results.setColumnWidth(0, 220)
         self._results.setColumnWidth(1, 60)
-        self._results.itemDoubleClicked.connect(self._on_result_clicked)
+        self._results.setItemDelegateForColumn(2, SnippetDelegate(self._results))
+        self._results.doubleClicked.connect(self._on_result_clicked)
         layout.addWidget(self._results)
 
         # Close
@@ -190,20 +429,44 @@ class SearchDialog(QDialog):
 
         self._input.setFocus()
 
-    def _get_scoped_books(self) -> list[Book]:
-        """Return books filtered by the current scope selection."""
+        self._progress.setMaximum(len(book_ids))
+        self._progress.setValue(0)
+        self._progress.show()
+        self._status.setText("Loading books...")
+        self._loader = BookLoadWorker(cache_manager, book_ids)
+        self._loader.book_loaded.connect(self._on_book_loaded)
+        self._loader.index_ready.connect(self._on_index_ready)
+        self._loader.start()
+
+    def _on_book_loaded(self, _book: Book) -> None:
+        self._progress.setValue(self._progress.value() + 1)
+
+    def _on_index_ready(self, index: SearchIndex) -> None:
+        self._index = index
+        self._progress.hide()
+        self._progress.setMaximum(0)  # busy indicator while searching
+        self._status.setText("")
+        self._search_btn.setEnabled(True)
+        if self._input.text().strip():
+            self._search()  # run the query typed while loading
+
+    def _get_scoped_book_id(self) -> str | None:
+        """Return the book to restrict the search to, or None for all books."""
         if self._scope.currentText() == "Current Book" and self._current_book_id:
-            return [b for b in self._books if b.book_id == self._current_book_id]
-        return list(self._books)
+            return self._current_book_id
+        return None
+
+    def _on_text_changed(self, _text: str) -> None:
+        self._search_timer.start()
 
     def _search(self) -> None:
+        self._search_timer.stop()
         query = self._input.text().strip()
-        if not query or len(query) < 2:
+        if not query or len(query) < 2 or self._index is None:
             return
 
         self._query = query
-        self._results.clear()
-        self._chapter_items.clear()
+        self._model.clear()
         self._progress.show()
         self._status.setText("Searching...")
 
@@ -211,42 +474,21 @@ class SearchDialog(QDialog):
             self._worker.stop()
             self._worker.wait()
 
-        scoped_books = self._get_scoped_books()
-        self._worker = SearchWorker(query, scoped_books)
-        self._worker.result_found.connect(self._add_result)
+        self._worker = SearchWorker(query, self._index, self._get_scoped_book_id())
+        self._worker.results_batch.connect(self._add_result_batch)
         self._worker.finished.connect(self._search_done)
         self._worker.start()
 
-    def _add_result(
-        self, book_id: str, chapter_num: int, title: str, snippet: str, block_id: str, block_type: str
-    ) -> None:
-        # Create or reuse a chapter-level parent item
-        chapter_key = f"{book_id}:{chapter_num}"
-        if chapter_key not in self._chapter_items:
-            parent = QTreeWidgetItem(self._results)
-            chapter_label = f"[{book_id}] Ch {chapter_num}: {title}"
-            parent.setText(0, chapter_label)
-            bold_font = parent.font(0)
-            bold_font.setBold(True)
-            parent.setFont(0, bold_font)
-            # No UserRole data on chapter items — they aren't navigable
-            parent.setExpanded(True)
-            self._chapter_items[chapter_key] = parent
-
-        parent_item = self._chapter_items[chapter_key]
-
-        # Create the child match item
-        child = QTreeWidgetItem(parent_item)
-        child.setText(1, block_type)
-        child.setData(0, Qt.ItemDataRole.UserRole, (book_id, chapter_num, block_id))
-
-        # Highlighted snippet as widget
-        palette = get_palette(self._theme_name)
-        highlighted = self._highlight_snippet(snippet, self._query, palette.accent)
-        label = QLabel(highlighted)
-        label.setTextFormat(Qt.TextFormat.RichText)
-        label.setWordWrap(True)
-        self._results.setItemWidget(child, 2, label)
+    def _add_result_batch(self, results: list[SearchResult]) -> None:
+        self._model.add_results(results)
+
+    def _expand_new_chapters(self, parent: QModelIndex, first: int, last: int) -> None:
+        if not parent.isValid():
+            for row in range(first, last + 1):
+                self._results.expand(self._model.index(row, 0))
+
+    def _highlight(self, snippet: str) -> str:
+        return self._highlight_snippet(snippet, self._query, get_palette(self._theme_name).accent)
 
     @staticmethod
     def _highlight_snippet(snippet: str, query: str, accent_color: str) -> str:
@@ -254,11 +496,14 @@ class SearchDialog(QDialog):
         import html as html_mod
 
         escaped = html_mod.escape(snippet)
-        query_lower = query.lower()
-
-        # Find match position in escaped text (case-insensitive)
-        lower_escaped = escaped.lower()
-        idx = lower_escaped.find(query_lower)
+        # Find match position in escaped text (case-insensitive). Case folding
+        # can change the length ("ß" -> "ss"); fall back to lower() then so
+        # the index still lines up with the escaped text.
+        folded = escaped.casefold()
+        if len(folded) == len(escaped):
+            idx = folded.find(query.casefold())
+        else:
+            idx = escaped.lower().find(query.lower())
         if idx == -1:
             return escaped
 
@@ -272,14 +517,25 @@ class SearchDialog(QDialog):
         self._progress.hide()
         self._status.setText(f"Found {total} results")
 
-    def _on_result_clicked(self, item: QTreeWidgetItem, column: int) -> None:
-        data = item.data(0, Qt.ItemDataRole.UserRole)
+    def _on_result_clicked(self, index: QModelIndex) -> None:
+        data = index.data(Qt.ItemDataRole.UserRole)
         if data:
             self.navigate_requested.emit(data[0], data[1], data[2])
             self.close()
 
-    def closeEvent(self, event: object) -> None:
+    def _stop_threads(self) -> None:
+        self._loader.stop()
+        self._loader.wait()
         if self._worker:
             self._worker.stop()
             self._worker.wait()
+
+    def done(self, result: int) -> None:
+        # Esc, accept() and reject() end here without a closeEvent
+        self._stop_threads()
+        super().done(result)
+
+    def closeEvent(self, event: object) -> None:
+        # close() on a dialog that was never shown skips done()
+        self._stop_threads()
         super().closeEvent(event)
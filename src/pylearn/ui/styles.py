@@ -1,31 +1,29 @@
 # Copyright (c) 2026 Nate Tritle. Licensed under the MIT License.
 """QSS themes for the application, generated from the centralized palette."""
 
-from pylearn.ui.theme_registry import ThemePalette, get_palette
+from pylearn.ui.theme_registry import PALETTES, ThemePalette
 
-
-def _generate_qss(p: ThemePalette) -> str:
-    """Generate a complete QSS stylesheet from a theme palette."""
-    return f"""
+# str.format template: {field} placeholders name ThemePalette fields, {{ }} are literal braces
+_QSS_TEMPLATE = """
 QMainWindow {{
-    background-color: {p.bg_alt};
-    color: {p.text};
+    background-color: {bg_alt};
+    color: {text};
 }}
 QWidget {{
-    color: {p.text};
+    color: {text};
 }}
 QSplitter::handle {{
-    background-color: {p.border};
+    background-color: {border};
     width: 3px;
     height: 3px;
 }}
 QSplitter::handle:hover {{
-    background-color: {p.accent};
+    background-color: {accent};
 }}
 QTreeWidget {{
-    background-color: {p.bg};
-    color: {p.text};
-    border: 1px solid {p.border};
+    background-color: {bg};
+    color: {text};
+    border: 1px solid {border};
     font-size: 13px;
     padding: 4px;
 }}
@@ -34,124 +32,135 @@ QTreeWidget::item {{
     border-radius: 3px;
 }}
 QTreeWidget::item:selected {{
-    background-color: {p.accent};
-    color: {p.accent_text};
+    background-color: {accent};
+    color: {accent_text};
 }}
 QTreeWidget::item:hover {{
-    background-color: {p.bg_alt};
+    background-color: {bg_alt};
 }}
 QTextBrowser {{
-    background-color: {p.bg};
-    color: {p.text};
-    border: 1px solid {p.border};
+    background-color: {bg};
+    color: {text};
+    border: 1px solid {border};
 }}
 QMenuBar {{
-    background-color: {p.bg_alt if p.name != "light" else p.bg};
-    color: {p.text};
-    border-bottom: 1px solid {p.border};
+    background-color: {bar_bg};
+    color: {text};
+    border-bottom: 1px solid {border};
     padding: 2px;
 }}
 QMenuBar::item:selected {{
-    background-color: {p.accent};
-    color: {p.accent_text};
+    background-color: {accent};
+    color: {accent_text};
     border-radius: 4px;
 }}
 QMenu {{
-    background-color: {p.bg};
-    color: {p.text};
-    border: 1px solid {p.border};
+    background-color: {bg};
+    color: {text};
+    border: 1px solid {border};
     padding: 4px;
 }}
 QMenu::item:selected {{
-    background-color: {p.accent};
-    color: {p.accent_text};
+    background-color: {accent};
+    color: {accent_text};
     border-radius: 3px;
 }}
 QToolBar {{
-    background-color: {p.bg_alt if p.name != "light" else p.bg};
-    border-bottom: 1px solid {p.border};
+    background-color: {bar_bg};
+    border-bottom: 1px solid {border};
     spacing: 6px;
     padding: 3px;
 }}
 QToolButton {{
-    color: {p.text};
+    color: {text};
     border: 1px solid transparent;
     border-radius: 4px;
     padding: 4px 8px;
     font-size: 13px;
 }}
 QToolButton:hover {{
-    background-color: {p.bg_alt};
-    border-color: {p.accent};
+    background-color: {bg_alt};
+    border-color: {accent};
 }}
 QToolButton:pressed {{
-    background-color: {p.accent};
-    color: {p.accent_text};
+    background-color: {accent};
+    color: {accent_text};
 }}
 QStatusBar {{
-    background-color: {p.bg_alt if p.name != "light" else p.bg};
-    color: {p.text_muted};
-    border-top: 1px solid {p.border};
+    background-color: {bar_bg};
+    color: {text_muted};
+    border-top: 1px solid {border};
     font-size: 12px;
 }}
 QComboBox {{
-    border: 1px solid {p.border};
+    border: 1px solid {border};
     border-radius: 4px;
     padding: 4px 8px;
-    background-color: {p.bg};
-    color: {p.text};
+    background-color: {bg};
+    color: {text};
     min-width: 120px;
 }}
 QComboBox:hover {{
-    border-color: {p.accent};
+    border-color: {accent};
 }}
 QComboBox::drop-down {{
     border: none;
     padding-right: 8px;
 }}
 QComboBox QAbstractItemView {{
-    background-color: {p.bg};
-    color: {p.text};
-    border: 1px solid {p.border};
-    selection-background-color: {p.accent};
-    selection-color: {p.accent_text};
+    background-color: {bg};
+    color: {text};
+    border: 1px solid {border};
+    selection-background-color: {accent};
+    selection-color: {accent_text};
 }}
 QPushButton {{
-    border: 1px solid {p.border};
+    border: 1px solid {border};
     border-radius: 4px;
     padding: 6px 16px;
-    background-color: {p.bg};
-    color: {p.text};
+    background-color: {bg};
+    color: {text};
     font-size: 13px;
 }}
 QPushButton:hover {{
-    background-color: {p.bg_alt};
-    border-color: {p.accent};
+    background-color: {bg_alt};
+    border-color: {accent};
 }}
 QPushButton:pressed {{
-    background-color: {p.accent};
-    color: {p.accent_text};
+    background-color: {accent};
+    color: {accent_text};
 }}
 QDialog {{
-    background-color: {p.bg_alt};
-    color: {p.text};
+    background-color: {bg_alt};
+    color: {text};
 }}
 QLabel {{
-    color: {p.text};
+    color: {text};
 }}
 QLineEdit, QTextEdit {{
-    border: 1px solid {p.border};
+    border: 1px solid {border};
     border-radius: 4px;
     padding: 6px;
-    background-color: {p.bg_alt if p.name != "light" else p.bg};
-    color: {p.text};
+    background-color: {input_bg};
+    color: {text};
 }}
 QLineEdit:focus, QTextEdit:focus {{
-    border-color: {p.accent};
+    border-color: {accent};
 }}
 """
 
 
+def _generate_qss(p: ThemePalette) -> str:
+    """Generate a complete QSS stylesheet from a theme palette."""
+    return _QSS_TEMPLATE.format_map(vars(p))
+
+
+_STYLESHEETS: dict[str, str] = {name: _generate_qss(p) for name, p in PALETTES.items()}
+
+
 def get_stylesheet(theme_name: str) -> str:
-    """Get QSS stylesheet for a theme, generated from the centralized palette."""
-    return _generate_qss(get_palette(theme_name))
+    """Get QSS stylesheet for a theme, generated from the centralized palette.
+
+    The palettes are fixed, so every stylesheet is built once at import.
+    """
+    return _STYLESHEETS.get(theme_name, _STYLESHEETS["light"])
@@ -3,12 +3,20 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+
 from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem
 
 from pylearn.core.constants import STATUS_COMPLETED, STATUS_IN_PROGRESS, STATUS_NOT_STARTED
 from pylearn.core.models import Chapter, Section
 
+_STATUS_ICONS: dict[str, str] = {
+    STATUS_COMPLETED: "[done]",
+    STATUS_IN_PROGRESS: "[>>]",
+}
+
 
 class TOCPanel(QTreeWidget):
     """Collapsible table of contents tree for book navigation."""
@@ -22,58 +30,94 @@ class TOCPanel(QTreeWidget):
         self.setIndentation(16)
         self.setAnimated(True)
         self.setMinimumWidth(180)
+        # A double-click already delivers itemClicked, so that is the only
+        # navigation signal we listen to
         self.itemClicked.connect(self._on_item_clicked)
-        self.itemDoubleClicked.connect(self._on_item_double_clicked)
 
         self._chapter_items: dict[int, QTreeWidgetItem] = {}
+        # Per chapter: section block indices in ascending order, and the
+        # matching tree items (parallel lists, for bisecting in highlight_section)
+        self._section_starts: dict[int, list[int]] = {}
+        self._section_items: dict[int, list[QTreeWidgetItem]] = {}
+        # Navigation payload per item, keyed by id(item). The dicts above hold
+        # every item, which keeps the wrappers (and so their ids) alive.
+        self._item_payload: dict[int, tuple[str, int] | tuple[str, int, int]] = {}
+        self._font_regular = QFont(self.font())
+        self._font_bold = QFont(self.font())
+        self._font_bold.setBold(True)
 
     def load_chapters(self, chapters: list[Chapter], progress: dict[int, str] | None = None) -> None:
-        """Populate the TOC tree from chapter data."""
-        self.clear()
-        self._chapter_items.clear()
+        """Populate the TOC tree from chapter data.
+
+        Chapter items are built detached from the tree and inserted with a
+        single ``addTopLevelItems`` call, with repaints and signals suspended
+        so the view only relayouts once.
+        """
         progress = progress or {}
+        self.setUpdatesEnabled(False)
+        was_blocked = self.blockSignals(True)
+        try:
+            self.clear()
+            self._chapter_items.clear()
+            self._section_starts.clear()
+            self._section_items.clear()
+            self._item_payload.clear()
+
+            items: list[QTreeWidgetItem] = []
+            for chapter in chapters:
+                status = progress.get(chapter.chapter_num, STATUS_NOT_STARTED)
+                icon = self._status_icon(status)
+
+                item = QTreeWidgetItem()
+                item.setText(0, f"{icon} Ch {chapter.chapter_num}: {chapter.title}")
+                self._item_payload[id(item)] = ("chapter", chapter.chapter_num)
+                item.setData(
+                    0,
+                    Qt.ItemDataRole.UserRole + 1,
+                    {
+                        "status": status,
+                        "chapter_num": chapter.chapter_num,
+                        "title": chapter.title,
+                    },
+                )
+
+                item.setFont(0, self._chapter_font(status))
+
+                self._chapter_items[chapter.chapter_num] = item
+                items.append(item)
+
+                self._add_section_items(item, chapter.sections, chapter.chapter_num)
+
+            self.addTopLevelItems(items)
+        finally:
+            self.blockSignals(was_blocked)
+            self.setUpdatesEnabled(True)
+
+    def _add_section_items(self, chapter_item: QTreeWidgetItem, sections: list[Section], chapter_num: int) -> None:
+        """Add a chapter's sections (and their children) to the tree.
+
+        Walks the section tree with an explicit stack rather than recursion;
+        children are pushed in reverse so siblings keep their original order.
+        Also records the chapter's section lookup used by highlight_section.
+        """
+        payload = self._item_payload
+        entries: list[tuple[int, QTreeWidgetItem]] = []
+        stack = [(chapter_item, section) for section in reversed(sections)]
+        while stack:
+            parent, section = stack.pop()
+            item = QTreeWidgetItem(parent)
 
-        for chapter in chapters:
-            status = progress.get(chapter.chapter_num, STATUS_NOT_STARTED)
-            icon = self._status_icon(status)
+            # Truncate long titles
+            title = section.title
+            item.setText(0, title if len(title) <= 50 else title[:47] + "...")
+            payload[id(item)] = ("section", chapter_num, section.block_index)
+            entries.append((section.block_index, item))
 
-            item = QTreeWidgetItem(self)
-            item.setText(0, f"{icon} Ch {chapter.chapter_num}: {chapter.title}")
-            item.setData(0, Qt.ItemDataRole.UserRole, ("chapter", chapter.chapter_num))
-            item.setData(
-                0,
-                Qt.ItemDataRole.UserRole + 1,
-                {
-                    "status": status,
-                    "chapter_num": chapter.chapter_num,
-                    "title": chapter.title,
-                },
-            )
-
-            font = item.font(0)
-            if status == STATUS_IN_PROGRESS:
-                font.setBold(True)
-            item.setFont(0, font)
-
-            self._chapter_items[chapter.chapter_num] = item
-
-            # Add sections
-            for section in chapter.sections:
-                self._add_section_item(item, section, chapter.chapter_num)
-
-    def _add_section_item(self, parent: QTreeWidgetItem, section: Section, chapter_num: int) -> None:
-        """Add a section (and its children) to the tree."""
-        item = QTreeWidgetItem(parent)
-
-        # Truncate long titles
-        title = section.title
-        if len(title) > 50:
-            title = title[:47] + "..."
-        item.setText(0, title)
-        item.setData(0, Qt.ItemDataRole.UserRole, ("section", chapter_num, section.block_index))
-
-        for child in section.children:
-            self._add_section_item(item, child, chapter_num)
+            stack.extend((item, child) for child in reversed(section.children))
+
+        entries.sort(key=lambda entry: entry[0])
+        self._section_starts[chapter_num] = [start for start, _ in entries]
+        self._section_items[chapter_num] = [item for _, item in entries]
 
     def update_chapter_status(self, chapter_num: int, status: str) -> None:
         """Update the icon/style for a chapter."""
@@ -81,6 +125,8 @@ class TOCPanel(QTreeWidget):
         if item:
             # Read stored metadata and rebuild text cleanly
             meta = item.data(0, Qt.ItemDataRole.UserRole + 1) or {}
+            if meta.get("status") == status:
+                return
             meta["status"] = status
             item.setData(0, Qt.ItemDataRole.UserRole + 1, meta)
 
@@ -89,9 +135,7 @@ class TOCPanel(QTreeWidget):
             ch_num = meta.get("chapter_num", chapter_num)
             item.setText(0, f"{icon} Ch {ch_num}: {title}")
 
-            font = item.font(0)
-            font.setBold(status == STATUS_IN_PROGRESS)
-            item.setFont(0, font)
+            item.setFont(0, self._chapter_font(status))
 
     def highlight_chapter(self, chapter_num: int) -> None:
         """Highlight the current chapter in the tree."""
@@ -111,31 +155,25 @@ class TOCPanel(QTreeWidget):
         if not chapter_item:
             return
 
-        best_item: QTreeWidgetItem | None = None
-
-        def _search(parent: QTreeWidgetItem) -> None:
-            nonlocal best_item
-            for i in range(parent.childCount()):
-                child = parent.child(i)
-                data = child.data(0, Qt.ItemDataRole.UserRole)
-                if data and data[0] == "section":
-                    if data[2] <= block_index:
-                        best_item = child
-                        _search(child)
+        target = chapter_item
+        starts = self._section_starts.get(chapter_num)
+        if starts:
+            i = bisect_right(starts, block_index) - 1
+            if i >= 0:
+                target = self._section_items[chapter_num][i]
 
-        _search(chapter_item)
-
-        target = best_item or chapter_item
         if target != self.currentItem():
             # Avoid triggering navigation signals — this is just visual tracking
             self.blockSignals(True)
             self.setCurrentItem(target)
-            self.scrollToItem(target)
+            # scrollToItem forces a viewport layout pass; skip it when the item is already fully on screen
+            if not self.viewport().rect().contains(self.visualItemRect(target)):
+                self.scrollToItem(target)
             self.blockSignals(False)
 
     def _on_item_clicked(self, item: QTreeWidgetItem, column: int) -> None:
-        """Handle tree item single-clicks — navigate to chapters and sections."""
-        data = item.data(0, Qt.ItemDataRole.UserRole)
+        """Handle tree item clicks — navigate to chapters and sections."""
+        data = self._item_payload.get(id(item))
         if not data:
             return
 
@@ -144,21 +182,9 @@ class TOCPanel(QTreeWidget):
         elif data[0] == "section":
             self.section_selected.emit(data[1], data[2])
 
-    def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int) -> None:
-        """Handle tree item double-clicks — scroll to sections."""
-        data = item.data(0, Qt.ItemDataRole.UserRole)
-        if not data:
-            return
-
-        if data[0] == "chapter":
-            self.chapter_selected.emit(data[1])
-        elif data[0] == "section":
-            self.section_selected.emit(data[1], data[2])
+    def _chapter_font(self, status: str) -> QFont:
+        return self._font_bold if status == STATUS_IN_PROGRESS else self._font_regular
 
     @staticmethod
     def _status_icon(status: str) -> str:
-        if status == STATUS_COMPLETED:
-            return "[done]"
-        elif status == STATUS_IN_PROGRESS:
-            return "[>>]"
-        return "[  ]"
+        return _STATUS_ICONS.get(status, "[  ]")
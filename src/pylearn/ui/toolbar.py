@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QSignalBlocker, pyqtSignal
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (
     QComboBox,
@@ -82,12 +82,16 @@ class MainToolBar(QToolBar):
         theme_layout.addWidget(QLabel("Theme:"))
 
         self._theme_combo = QComboBox()
-        self._theme_combo.addItems(["Light", "Dark", "Sepia"])
-        self._theme_combo.currentTextChanged.connect(lambda text: self.theme_changed.emit(text.lower()))
+        for theme in ("light", "dark", "sepia"):
+            self._theme_combo.addItem(theme.capitalize(), theme)
+        self._theme_combo.currentIndexChanged.connect(self._on_theme_index_changed)
         theme_layout.addWidget(self._theme_combo)
 
         self.addWidget(theme_widget)
 
+    def _on_theme_index_changed(self, index: int) -> None:
+        self.theme_changed.emit(self._theme_combo.itemData(index))
+
     def set_running(self, running: bool) -> None:
         """Update toolbar state based on execution status."""
         self._run_action.setEnabled(not running)
@@ -95,12 +99,10 @@ class MainToolBar(QToolBar):
 
     def set_font_size(self, size: int) -> None:
         """Set the font size spinner value."""
-        self._font_spin.blockSignals(True)
-        self._font_spin.setValue(size)
-        self._font_spin.blockSignals(False)
+        with QSignalBlocker(self._font_spin):
+            self._font_spin.setValue(size)
 
     def set_theme(self, theme: str) -> None:
         """Set the theme combo value."""
-        self._theme_combo.blockSignals(True)
-        self._theme_combo.setCurrentText(theme.capitalize())
-        self._theme_combo.blockSignals(False)
+        with QSignalBlocker(self._theme_combo):
+            self._theme_combo.setCurrentText(theme.capitalize())
@@ -3,11 +3,14 @@
 
 from __future__ import annotations
 
+import atexit
 import functools
 import logging
+import queue
 import sys
 import traceback
 from collections.abc import Callable
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from types import TracebackType
 from typing import Any, TypeVar
 
@@ -40,32 +43,66 @@ class ExecutionTimeoutError(ExecutionError):
     """Code execution exceeded timeout."""
 
 
+class _AmortizedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that checks the file size every ``check_every`` records.
+
+    The stock ``shouldRollover`` seeks and tells on every emit, although a
+    multi-megabyte limit is only crossed after thousands of lines.
+    """
+
+    check_every = 100
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._unchecked = 0
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        self._unchecked += 1
+        if self._unchecked < self.check_every:
+            return False
+        self._unchecked = 0
+        return bool(super().shouldRollover(record))
+
+
 def setup_logging(debug: bool = False) -> logging.Logger:
-    """Configure application logging."""
+    """Configure application logging.
+
+    Log with %-style arguments (``logger.debug("page %d", n)``) rather than
+    f-strings so disabled levels never pay for the formatting.
+
+    The logger itself only has a QueueHandler; a background QueueListener
+    owns the console and file handlers, so callers on the UI thread never
+    block on terminal or disk writes. File output is buffered in a
+    MemoryHandler and flushed every 200 records, on ERROR, and at exit.
+    """
     logger = logging.getLogger("pylearn")
     # Guard against duplicate handlers on repeated calls
     if logger.handlers:
         return logger
 
     logger.setLevel(logging.DEBUG if debug else logging.INFO)
+    # Nothing we format uses thread/process fields; skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # Our handlers are complete; don't re-emit records through the root logger
+    logger.propagate = False
 
     # Console handler
     console = logging.StreamHandler(sys.stdout)
-    console.setLevel(logging.DEBUG if debug else logging.INFO)
+    # Keep the terminal quiet outside debug mode; INFO still goes to the log file
+    console.setLevel(logging.DEBUG if debug else logging.WARNING)
     console.setFormatter(
         logging.Formatter(
             "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
             datefmt="%H:%M:%S",
         )
     )
-    logger.addHandler(console)
 
     # File handler with rotation (5 MB max, 3 backups)
-    from logging.handlers import RotatingFileHandler
-
     log_dir = DATA_DIR
     log_dir.mkdir(parents=True, exist_ok=True)
-    file_handler = RotatingFileHandler(
+    file_handler = _AmortizedRotatingFileHandler(
         log_dir / "pylearn.log",
         maxBytes=5 * 1024 * 1024,
         backupCount=3,
@@ -77,11 +114,35 @@ def setup_logging(debug: bool = False) -> logging.Logger:
             "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         )
     )
-    logger.addHandler(file_handler)
+
+    # Batch file writes; anything at ERROR or above is written out immediately
+    buffered_file = MemoryHandler(capacity=200, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True)
+    buffered_file.setLevel(logging.DEBUG)
+
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(records)
+    queue_handler.listener = QueueListener(records, console, buffered_file, respect_handler_level=True)
+    queue_handler.listener.start()
+    # atexit runs last-registered first: drain the queue, then flush the buffer
+    atexit.register(buffered_file.close)
+    atexit.register(queue_handler.listener.stop)
+    logger.addHandler(queue_handler)
 
     return logger
 
 
+@functools.cache
+def _message_box() -> Any:
+    """Return the QMessageBox class, importing PyQt6 on first use only.
+
+    Imported lazily to avoid circular imports at module level; cached so that a
+    burst of errors doesn't go through the import machinery every time.
+    """
+    from PyQt6.QtWidgets import QMessageBox
+
+    return QMessageBox
+
+
 def install_global_exception_handler() -> None:
     """Install sys.excepthook so unhandled exceptions show a dialog instead of silently crashing.
 
@@ -106,13 +167,17 @@ def install_global_exception_handler() -> None:
             exc_info=(exc_type, exc_value, exc_tb),
         )
 
-        # Show error dialog (import here to avoid circular imports at module level)
+        # Show error dialog
         try:
-            from PyQt6.QtWidgets import QMessageBox
-
-            tb_text = "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
-            dialog = QMessageBox()
-            dialog.setIcon(QMessageBox.Icon.Critical)
+            message_box = _message_box()
+            # lookup_lines=False leaves source lines to be read while formatting
+            tb_text = "".join(
+                traceback.TracebackException(
+                    exc_type, exc_value, exc_tb, capture_locals=False, lookup_lines=False
+                ).format()
+            )
+            dialog = message_box()
+            dialog.setIcon(message_box.Icon.Critical)
             dialog.setWindowTitle("PyLearn — Unexpected Error")
             dialog.setText(f"{exc_type.__name__}: {exc_value}")
             dialog.setDetailedText(tb_text)
@@ -131,20 +196,20 @@ def safe_slot[F: Callable[..., Any]](func: F) -> F:
     so that a bug in one handler doesn't silently kill the app.
     """
 
+    _logger = logging.getLogger("pylearn.ui")
+    name = func.__name__
+
     @functools.wraps(func)
     def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
         try:
             return func(self, *args, **kwargs)
         except Exception as exc:
-            _logger = logging.getLogger("pylearn.ui")
-            _logger.exception("Error in %s", func.__name__)
+            _logger.exception("Error in %s", name)
             try:
-                from PyQt6.QtWidgets import QMessageBox
-
-                QMessageBox.warning(
+                _message_box().warning(
                     self,
                     "Error",
-                    f"An error occurred in {func.__name__}:\n\n{type(exc).__name__}: {exc}",
+                    f"An error occurred in {name}:\n\n{type(exc).__name__}: {exc}",
                 )
             except Exception:
                 pass  # Last resort — already logged above
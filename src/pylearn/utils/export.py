@@ -3,11 +3,15 @@
 
 from __future__ import annotations
 
+import io
 from datetime import datetime
+from functools import lru_cache
+from typing import TextIO
 
 from pylearn.core.database import Database
 
 
+@lru_cache(maxsize=4096)
 def _fmt_timestamp(iso: str | None) -> str:
     """Format an ISO datetime string as 'YYYY-MM-DD at HH:MM'."""
     if not iso:
@@ -29,100 +33,113 @@ def export_to_markdown(db: Database, book_id: str | None = None) -> str | None:
     Returns:
         Formatted Markdown string, or None if there are no notes or bookmarks.
     """
+    buf = io.StringIO()
+    if not export_to_markdown_stream(db, buf, book_id):
+        return None
+    return buf.getvalue()
+
+
+def export_to_markdown_stream(db: Database, out: TextIO, book_id: str | None = None) -> bool:
+    """Write notes and/or bookmarks as Markdown to a text stream.
+
+    Produces the same document as export_to_markdown() without holding it in memory.
+
+    Args:
+        db: Database instance to query.
+        out: Writable text stream, e.g. a file opened with encoding="utf-8".
+        book_id: If given, export only this book. If None, export all books.
+
+    Returns:
+        True if anything was written, False if there are no notes or bookmarks.
+    """
     books = db.get_books()
     if book_id:
         books = [b for b in books if b["book_id"] == book_id]
 
     if not books:
-        return None
+        return False
 
     # Build a lookup: book_id → {chapter_num → title}
     book_titles: dict[str, str] = {b["book_id"]: b["title"] for b in books}
-    chapter_titles: dict[str, dict[int, str]] = {}
-    for b in books:
-        chapters = db.get_chapters(b["book_id"])
-        chapter_titles[b["book_id"]] = {c["chapter_num"]: c["title"] for c in chapters}
+    chapter_titles: dict[str, dict[int, str]] = {bid: {} for bid in book_titles}
+    for c in db.get_all_chapters(list(book_titles)):
+        chapter_titles[c["book_id"]][c["chapter_num"]] = c["title"]
 
-    multi_book = len(books) > 1
-    sections: list[str] = []
     today = datetime.now().strftime("%Y-%m-%d")
+    exported_line = f"*Exported from PyLearn on {today}*\n\n---\n"
+
+    # Every line is written with its trailing newline straight to the stream;
+    # books are separated by a blank line.
+    write = out.write
+    fmt_ts = _fmt_timestamp
+    wrote_book = False
 
     for b in books:
         bid = b["book_id"]
         title = book_titles[bid]
         ch_titles = chapter_titles.get(bid, {})
+        # Chapter heading lines, shared by the notes and bookmarks sections
+        ch_headers: dict[int, str] = {}
 
-        notes = db.get_notes(bid)
-        bookmarks = db.get_bookmarks(bid)
+        # Both come back sorted by chapter_num ASC, then created_at ASC
+        notes = db.get_notes_by_chapter(bid)
+        bookmarks = db.get_bookmarks_by_chapter(bid)
 
         if not notes and not bookmarks:
             continue
 
-        # Sort by chapter_num ASC, then created_at ASC
-        notes.sort(key=lambda n: (n["chapter_num"], n.get("created_at") or ""))
-        bookmarks.sort(key=lambda bm: (bm["chapter_num"], bm.get("created_at") or ""))
-
-        book_parts: list[str] = []
+        if wrote_book:
+            write("\n")
+        wrote_book = True
 
-        if multi_book:
-            book_parts.append(f"# {title} \u2014 Notes & Bookmarks")
-        else:
-            book_parts.append(f"# {title} \u2014 Notes & Bookmarks")
-        book_parts.append(f"*Exported from PyLearn on {today}*")
-        book_parts.append("")
-        book_parts.append("---")
+        write(f"# {title} \u2014 Notes & Bookmarks\n")
+        write(exported_line)
 
         # --- Notes section ---
         if notes:
-            book_parts.append("")
-            book_parts.append("## Notes")
+            write("\n## Notes\n")
 
             current_chapter: int | None = None
             for note in notes:
                 ch = note["chapter_num"]
                 if ch != current_chapter:
                     current_chapter = ch
-                    ch_title = ch_titles.get(ch, f"Chapter {ch}")
-                    book_parts.append("")
-                    book_parts.append(f"### Chapter {ch}: {ch_title}")
-
-                section = note.get("section_title") or f"Note {note['note_id']}"
-                ts = _fmt_timestamp(note.get("created_at"))
-                book_parts.append("")
-                book_parts.append(f"#### {section}")
+                    header = ch_headers.get(ch)
+                    if header is None:
+                        header = ch_headers[ch] = f"\n### Chapter {ch}: {ch_titles.get(ch, f'Chapter {ch}')}\n"
+                    write(header)
+
+                section = note["section_title"] or f"Note {note['note_id']}"
+                ts = fmt_ts(note["created_at"])
+                write(f"\n#### {section}\n")
                 if ts:
-                    book_parts.append(f"*Added {ts}*")
-                book_parts.append("")
-                book_parts.append(note["content"])
+                    write(f"*Added {ts}*\n")
+                write("\n")
+                write(note["content"])
+                write("\n")
 
-            book_parts.append("")
-            book_parts.append("---")
+            write("\n---\n")
 
         # --- Bookmarks section ---
         if bookmarks:
-            book_parts.append("")
-            book_parts.append("## Bookmarks")
+            write("\n## Bookmarks\n")
 
             current_chapter = None
             for bm in bookmarks:
                 ch = bm["chapter_num"]
                 if ch != current_chapter:
                     current_chapter = ch
-                    ch_title = ch_titles.get(ch, f"Chapter {ch}")
-                    book_parts.append("")
-                    book_parts.append(f"### Chapter {ch}: {ch_title}")
+                    header = ch_headers.get(ch)
+                    if header is None:
+                        header = ch_headers[ch] = f"\n### Chapter {ch}: {ch_titles.get(ch, f'Chapter {ch}')}\n"
+                    write(header)
 
                 label = bm["label"]
-                ts = _fmt_timestamp(bm.get("created_at"))
+                ts = fmt_ts(bm["created_at"])
                 ts_part = f" *(added {ts})*" if ts else ""
-                book_parts.append(f"- **{label}**{ts_part}")
+                write(f"- **{label}**{ts_part}\n")
 
-        sections.append("\n".join(book_parts))
-
-    if not sections:
-        return None
-
-    return "\n\n".join(sections) + "\n"
+    return wrote_book
 
 
 def export_progress_to_markdown(db: Database, book_id: str | None = None) -> str | None:
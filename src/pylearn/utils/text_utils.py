@@ -6,42 +6,42 @@ from __future__ import annotations
 import re
 import unicodedata
 
-# Single-character replacements handled via str.translate() for speed
-_SINGLE_CHAR_TABLE = str.maketrans(
-    {
-        "\ufb01": "fi",
-        "\ufb02": "fl",
-        "\u2018": "'",
-        "\u2019": "'",
-        "\u201c": '"',
-        "\u201d": '"',
-        "\u2013": "-",
-        "\u00a0": " ",
-    }
-)
-
-# Multi-character replacements that str.translate() cannot handle
-_MULTI_CHAR_REPLACEMENTS = {
+# Character replacements, applied in a single str.translate() pass (translation
+# tables may map one codepoint to a string of any length)
+_CHAR_REPLACEMENTS = {
+    "\ufb01": "fi",
+    "\ufb02": "fl",
     "\ufb03": "ffi",
     "\ufb04": "ffl",
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u2013": "-",
     "\u2014": "--",
     "\u2026": "...",
+    "\u00a0": " ",
 }
+_CHAR_TABLE = str.maketrans(_CHAR_REPLACEMENTS)
+
+# Any character the translation would touch
+_ALL_FIX_RE = re.compile("[" + "".join(_CHAR_REPLACEMENTS) + "]")
 
 
 def clean_text(text: str) -> str:
     """Clean text extracted from PDF, fixing common encoding issues."""
     if not text:
         return ""
-    # Normalize unicode and apply single-char translation table
-    text = unicodedata.normalize("NFKC", text).translate(_SINGLE_CHAR_TABLE)
-    # Apply multi-char replacements
-    for old, new in _MULTI_CHAR_REPLACEMENTS.items():
-        text = text.replace(old, new)
-    return text
+    # Pure ASCII is already NFKC-normal and contains none of the replaced characters
+    if text.isascii():
+        return text
+    text = unicodedata.normalize("NFKC", text)
+    # Skip the translation when there is nothing for it to do
+    if not _ALL_FIX_RE.search(text):
+        return text
+    return text.translate(_CHAR_TABLE)
 
 
-_LINE_NUMBER_RE = re.compile(r"^\d+$")
 _CHAPTER_HEADER_RE = re.compile(r"^Chapter \d+[:.]\s")
 
 
@@ -54,44 +54,48 @@ def clean_code_text(text: str) -> str:
     for line in lines:
         # Skip lines that look like page numbers
         stripped = line.strip()
-        if _LINE_NUMBER_RE.match(stripped) and len(stripped) <= 4:
+        # (isdecimal is exactly the regex \d class, without entering the regex engine)
+        if len(stripped) <= 4 and stripped.isdecimal():
             continue
-        # Skip lines that look like chapter headers in code
-        if _CHAPTER_HEADER_RE.match(stripped):
+        # Skip lines that look like chapter headers in code; the prefix test
+        # keeps ordinary code lines away from the regex
+        if stripped.startswith("Chapter ") and _CHAPTER_HEADER_RE.match(stripped):
             continue
         cleaned.append(line)
     return "\n".join(cleaned)
 
 
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
+
 def normalize_whitespace(text: str) -> str:
     """Collapse multiple spaces/newlines but preserve paragraph breaks."""
     # Collapse multiple spaces to single
-    text = re.sub(r" {2,}", " ", text)
+    text = _MULTI_SPACE_RE.sub(" ", text)
     # Collapse 3+ newlines to 2
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _MULTI_NEWLINE_RE.sub("\n\n", text)
     return text.strip()
 
 
+# Running header/footer lines, as one anchored alternation so each line is scanned once:
+# a bare page number, "Chapter N"/"Part N" on its own, a pipe-separated header
+# like "123 | Chapter 5: Title", or a URL. Book-specific titles aren't listed —
+# margin-based spatial filtering in PDFParser handles those.
+_HEADER_FOOTER_RE = re.compile(
+    r"\d{1,4}$"
+    r"|(?i:(?:Chapter|Part)\s+\w+)$"
+    r"|\d+\s*\|\s*(?:Chapter|Part)"
+    r"|(?i:www\.\S+\.\w+)"
+)
+
+
 def is_page_header_or_footer(text: str, page_num: int = 0) -> bool:
     """Detect common page header/footer patterns in O'Reilly books."""
     stripped = text.strip()
     if not stripped:
         return True
-    # Page number only
-    if re.match(r"^\d{1,4}$", stripped):
-        return True
-    # "Chapter N" or "Part N" standalone
-    if re.match(r"^(Chapter|Part)\s+\w+$", stripped, re.IGNORECASE):
-        return True
-    # Pipe-separated header: "123 | Chapter 5: Title"
-    if re.match(r"^\d+\s*\|\s*(Chapter|Part)", stripped):
-        return True
-    # Generic running header/footer patterns (book-specific titles removed —
-    # margin-based spatial filtering in PDFParser handles those)
-    header_patterns = [
-        r"www\.\S+\.\w+",  # URLs
-    ]
-    return any(re.match(pattern, stripped, re.IGNORECASE) for pattern in header_patterns)
+    return _HEADER_FOOTER_RE.match(stripped) is not None
 
 
 def detect_repl_code(text: str) -> bool:
@@ -100,8 +104,19 @@ def detect_repl_code(text: str) -> bool:
     if not stripped:
         return False
     lines = stripped.split("\n")
-    prompt_count = sum(1 for line in lines if line.startswith(">>> ") or line.startswith("... "))
-    return prompt_count >= 1 and prompt_count / len(lines) > 0.2
+    total = len(lines)
+    # REPL means more than 20% of lines carry a prompt; stop as soon as that
+    # is reached, or can no longer be reached with the lines that are left
+    needed = total // 5 + 1
+    prompt_count = 0
+    for i, line in enumerate(lines):
+        if line.startswith((">>> ", "... ")):
+            prompt_count += 1
+            if prompt_count >= needed:
+                return True
+        elif prompt_count + (total - i - 1) < needed:
+            return False
+    return False
 
 
 def strip_repl_prompts(text: str) -> str:
@@ -115,3 +130,26 @@ def strip_repl_prompts(text: str) -> str:
             code_lines.append(line[3:])
         # Skip output lines (lines that don't start with prompts in REPL blocks)
     return "\n".join(code_lines)
+
+
+def classify_and_strip_repl(text: str) -> tuple[bool, str]:
+    """Detect REPL code and strip its prompts in a single pass over the lines.
+
+    Equivalent to ``detect_repl_code`` followed by ``strip_repl_prompts``:
+    returns ``(True, runnable_code)`` for REPL text, else ``(False, text)``.
+    """
+    stripped = text.strip()
+    if not stripped:
+        return False, text
+    lines = stripped.split("\n")
+    prompt_count = 0
+    code_lines = []
+    for line in lines:
+        if line.startswith((">>> ", "... ")):
+            prompt_count += 1
+            code_lines.append(line[4:])
+        elif line.startswith((">>>", "...")):
+            code_lines.append(line[3:])
+    if prompt_count * 5 > len(lines):
+        return True, "\n".join(code_lines)
+    return False, text
@@ -79,7 +79,7 @@ def isolated_main_window(qtbot, tmp_path, monkeypatch, challenge_content):
 
     yield window
 
-    window._session.reset()
+    window._session.close()
 
 
 class TestChallengeTabExists:
@@ -118,7 +118,7 @@ class TestChallengePanelDirect:
             assert len(panel._challenges.challenges) == 2
             assert "Add Numbers" in panel._title_label.text() or "Chapter 1" in panel._title_label.text()
         finally:
-            session.reset()
+            session.close()
             db.close()
 
     def test_load_nonexistent(self, qtbot, tmp_path: Path, challenge_content: Path) -> None:
@@ -135,7 +135,7 @@ class TestChallengePanelDirect:
             qtbot.addWidget(panel)
             assert panel.load_challenges("test_book", 99) is False
         finally:
-            session.reset()
+            session.close()
             db.close()
 
     def test_navigation(self, qtbot, tmp_path: Path, challenge_content: Path) -> None:
@@ -165,7 +165,7 @@ class TestChallengePanelDirect:
             panel._prev_challenge()
             assert panel._current_index == 0
         finally:
-            session.reset()
+            session.close()
             db.close()
 
     def test_reset_code(self, qtbot, tmp_path: Path, challenge_content: Path) -> None:
@@ -187,7 +187,7 @@ class TestChallengePanelDirect:
             panel._reset_code()
             assert panel._editor.text() == original
         finally:
-            session.reset()
+            session.close()
             db.close()
 
     def test_hints(self, qtbot, tmp_path: Path, challenge_content: Path) -> None:
@@ -211,7 +211,7 @@ class TestChallengePanelDirect:
             panel._show_next_hint()
             assert "a + b" in panel._hint_label.text()
         finally:
-            session.reset()
+            session.close()
             db.close()
 
     @pytest.mark.parametrize("theme", ["light", "dark", "sepia"])
@@ -230,5 +230,5 @@ class TestChallengePanelDirect:
             panel.set_theme(theme)
             assert panel._theme == theme
         finally:
-            session.reset()
+            session.close()
             db.close()
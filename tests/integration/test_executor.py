@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from pylearn.executor.sandbox import ExecutionResult, Sandbox, check_dangerous_code
+from pylearn.executor.sandbox import ExecutionResult, Sandbox, _python_standby, check_dangerous_code
 from pylearn.executor.session import Session
 
 
@@ -18,7 +18,7 @@ class TestSessionLifecycle:
             assert result.stdout.strip() == "hello"
             assert result.return_code == 0
         finally:
-            session.reset()
+            session.close()
 
     def test_state_persists_across_runs(self) -> None:
         session = Session(timeout=10)
@@ -27,7 +27,7 @@ class TestSessionLifecycle:
             result = session.run("print(x)")
             assert "42" in result.stdout
         finally:
-            session.reset()
+            session.close()
 
     def test_import_persists(self) -> None:
         session = Session(timeout=10)
@@ -36,7 +36,7 @@ class TestSessionLifecycle:
             result = session.run("print(math.pi)")
             assert "3.14" in result.stdout
         finally:
-            session.reset()
+            session.close()
 
     def test_reset_clears_state(self) -> None:
         session = Session(timeout=10)
@@ -46,7 +46,7 @@ class TestSessionLifecycle:
             result = session.run("print(x)")
             assert result.stderr  # x should not be defined
         finally:
-            session.reset()
+            session.close()
 
     @pytest.mark.slow
     def test_timeout(self) -> None:
@@ -55,7 +55,7 @@ class TestSessionLifecycle:
             result = session.run("import time; time.sleep(10)")
             assert result.timed_out
         finally:
-            session.reset()
+            session.close()
 
     def test_syntax_error_recovery(self) -> None:
         session = Session(timeout=10)
@@ -68,7 +68,7 @@ class TestSessionLifecycle:
             result = session.run("print('recovered')")
             assert "recovered" in result.stdout
         finally:
-            session.reset()
+            session.close()
 
     def test_stop(self) -> None:
         session = Session(timeout=10)
@@ -80,7 +80,7 @@ class TestSessionLifecycle:
             assert stopped
             assert not session.is_running
         finally:
-            session.reset()
+            session.close()
 
     def test_history_is_empty(self) -> None:
         """History property returns empty list (persistent REPL handles state)."""
@@ -123,6 +123,43 @@ class TestSandbox:
         assert "1" in result.stdout
         assert "2" in result.stdout
 
+    def test_runs_do_not_share_state(self) -> None:
+        """Every run gets a fresh interpreter, standby or not."""
+        sandbox = Sandbox(timeout=10)
+        assert sandbox.run("x = 1").success
+        result = sandbox.run("print(x)")
+        assert "NameError" in result.stderr
+
+    def test_standby_started_for_next_run(self) -> None:
+        sandbox = Sandbox(timeout=10)
+        sandbox.run("pass")
+        standby = _python_standby._proc
+        assert standby is not None
+        result = sandbox.run("import sys; print(sys.argv, __name__)")
+        assert result.stdout.strip() == "['-c'] __main__"
+        assert standby.returncode == 0
+
+    def test_standby_discarded_when_env_changes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        sandbox = Sandbox(timeout=10)
+        sandbox.run("pass")
+        monkeypatch.setenv("PYLEARN_STANDBY_TEST", "1")
+        result = sandbox.run("import os; print(os.environ.get('PYLEARN_STANDBY_TEST'))")
+        assert result.stdout.strip() == "1"
+
+    def test_main_module_is_user_code(self) -> None:
+        """Classes defined by the code pickle on standby runs just as on a fresh -c run."""
+        sandbox = Sandbox(timeout=10)
+        code = "import pickle\nclass A:\n    pass\nprint(type(pickle.loads(pickle.dumps(A()))).__name__)"
+        for _ in range(2):
+            result = sandbox.run(code)
+            assert result.stdout.strip() == "A", result.stderr
+
+    def test_unicode_code(self) -> None:
+        sandbox = Sandbox(timeout=10)
+        sandbox.run("pass")
+        result = sandbox.run("print(len('h\u00e9llo \u2603'))")
+        assert result.stdout.strip() == "7"
+
     def test_execution_result_success_property(self) -> None:
         good = ExecutionResult(stdout="ok", return_code=0)
         assert good.success
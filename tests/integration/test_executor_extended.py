@@ -11,6 +11,8 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -18,6 +20,8 @@ import pytest
 from pylearn.executor.sandbox import (
     _SENSITIVE_ENV_VARS,
     ExecutionResult,
+    _child_env,
+    _descendant_pids,
     _kill_tree,
     check_dangerous_code,
     get_safe_env,
@@ -86,6 +90,45 @@ class TestGetSafeEnv:
         env["__PYLEARN_TEST_SENTINEL__"] = "1"
         assert "__PYLEARN_TEST_SENTINEL__" not in os.environ
 
+    def test_repeated_calls_return_fresh_copies(self) -> None:
+        first = get_safe_env()
+        first["__PYLEARN_TEST_SENTINEL__"] = "1"
+        second = get_safe_env()
+        assert "__PYLEARN_TEST_SENTINEL__" not in second
+        assert second is not first
+
+    def test_tracks_environment_changes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PYLEARN_ENV_TEST", "one")
+        assert get_safe_env()["PYLEARN_ENV_TEST"] == "one"
+        monkeypatch.setenv("PYLEARN_ENV_TEST", "two")
+        assert get_safe_env()["PYLEARN_ENV_TEST"] == "two"
+        monkeypatch.delenv("PYLEARN_ENV_TEST")
+        assert "PYLEARN_ENV_TEST" not in get_safe_env()
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp_late")
+        assert "GITHUB_TOKEN" not in get_safe_env()
+
+
+class TestChildEnv:
+    def test_inherits_when_nothing_sensitive(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        for var in _SENSITIVE_ENV_VARS:
+            monkeypatch.delenv(var, raising=False)
+        assert _child_env() is None
+
+    def test_strips_when_sensitive_present(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        env = _child_env()
+        assert env is not None
+        assert "OPENAI_API_KEY" not in env
+
+    def test_child_never_sees_secret(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("GH_TOKEN", "gho_secret")
+        session = Session(timeout=10)
+        try:
+            result = session.run("import os; print(os.environ.get('GH_TOKEN'))")
+            assert result.stdout.strip() == "None"
+        finally:
+            session.close()
+
 
 # ---------------------------------------------------------------------------
 # check_dangerous_code() — exhaustive pattern coverage
@@ -170,6 +213,20 @@ class TestCheckDangerousCodeExtended:
         warnings = check_dangerous_code("subprocess.Popen(['ls'])")
         assert any("subprocess" in w for w in warnings)
 
+    def test_overlapping_matches_all_reported(self) -> None:
+        """A pattern spanning other dangerous names doesn't hide them."""
+        warnings = check_dangerous_code("open(socket.gethostname() + eval('x'), 'w')")
+        assert warnings == ["file write via open()", "socket (network access)", "eval()"]
+
+    def test_large_script_danger_near_end(self) -> None:
+        clean = "def f(x):\n    return [i * i for i in range(x)]\n" * 2000
+        assert check_dangerous_code(clean) == []
+        assert check_dangerous_code(clean + "import ctypes\n") == ["ctypes (native code access)"]
+
+    def test_reported_once_in_pattern_order(self) -> None:
+        warnings = check_dangerous_code("exec(a)\neval(b)\nexec(c)\nos.system('x')")
+        assert warnings == ["os.system()", "eval()", "exec()"]
+
 
 # ---------------------------------------------------------------------------
 # Session language delegation
@@ -229,6 +286,19 @@ class TestSessionLanguageDelegation:
         )
         assert result.stdout == "Opened in browser"
 
+    @patch("pylearn.executor.sandbox.Sandbox")
+    def test_sandbox_reused_across_runs(self, MockSandbox: MagicMock) -> None:
+        MockSandbox.return_value.run.return_value = ExecutionResult(return_code=0)
+        session = Session(timeout=10)
+        session.run("int main() {}", language="cpp")
+        session.timeout = 20
+        session.run("<p></p>", language="html")
+
+        MockSandbox.assert_called_once_with(timeout=10)
+        assert MockSandbox.return_value.run.call_count == 2
+        # Later timeout changes still reach the shared sandbox
+        assert MockSandbox.return_value.timeout == 20
+
     def test_python_does_not_delegate(self) -> None:
         """Python code uses the persistent REPL, not Sandbox."""
         session = Session(timeout=10)
@@ -236,7 +306,7 @@ class TestSessionLanguageDelegation:
             result = session.run("print('repl')", language="python")
             assert "repl" in result.stdout
         finally:
-            session.reset()
+            session.close()
 
     @patch("pylearn.executor.sandbox.Sandbox")
     def test_session_default_language_delegates(self, MockSandbox: MagicMock) -> None:
@@ -278,7 +348,7 @@ class TestSessionEdgeCases:
             assert session.stop() is True
             assert not session.is_running
         finally:
-            session.reset()
+            session.close()
 
     def test_reset_kills_process(self) -> None:
         session = Session(timeout=10)
@@ -288,7 +358,7 @@ class TestSessionEdgeCases:
             session.reset()
             assert not session.is_running
         finally:
-            session.reset()
+            session.close()
 
     def test_reset_then_run_starts_new_process(self) -> None:
         session = Session(timeout=10)
@@ -299,25 +369,90 @@ class TestSessionEdgeCases:
             result = session.run("print(x)")
             assert result.stderr  # x should not be defined
         finally:
-            session.reset()
+            session.close()
 
     def test_run_empty_code(self) -> None:
         session = Session(timeout=10)
         try:
             result = session.run("")
-            # Empty code should succeed (the REPL just echoes sentinel)
+            # Empty code succeeds without ever starting the REPL
             assert result.return_code == 0
             assert result.stdout.strip() == ""
+            assert not session.is_running
         finally:
-            session.reset()
+            session.close()
 
     def test_run_whitespace_only_code(self) -> None:
         session = Session(timeout=10)
         try:
             result = session.run("   \n  \n")
             assert result.return_code == 0
+            assert result.success
         finally:
-            session.reset()
+            session.close()
+
+    def test_empty_code_keeps_state(self) -> None:
+        session = Session(timeout=10)
+        try:
+            session.run("x = 5")
+            assert session.run("\n").success
+            assert session.run("print(x)").stdout.strip() == "5"
+        finally:
+            session.close()
+
+    def test_process_exit_reported_then_restarted(self) -> None:
+        session = Session(timeout=10)
+        try:
+            result = session.run("import os; os._exit(3)")
+            assert result.return_code == 3
+            assert "exited unexpectedly" in result.stderr
+            # The next run gets a fresh process instead of waiting on the dead one
+            result = session.run("print('back')")
+            assert result.stdout.strip() == "back"
+        finally:
+            session.close()
+
+    def test_many_runs_reuse_reader_threads(self) -> None:
+        session = Session(timeout=10)
+        try:
+            session.run("x = 0")
+            threads = threading.active_count()
+            for _ in range(20):
+                session.run("x += 1")
+            assert threading.active_count() == threads
+            assert session.run("print(x)").stdout.strip() == "20"
+        finally:
+            session.close()
+
+    def test_windows_line_endings(self) -> None:
+        session = Session(timeout=10)
+        try:
+            result = session.run("a = 1\r\nb = 2\r\nprint(a + b)\r\n")
+            assert result.stdout.strip() == "3"
+            assert session.run("print(a)").stdout.strip() == "1"
+        finally:
+            session.close()
+
+    def test_large_code_block(self) -> None:
+        session = Session(timeout=10)
+        try:
+            code = "\n".join(f"v{i} = '\u00e9' * {i % 7}" for i in range(20000)) + "\nprint(len(v19999))"
+            result = session.run(code)
+            assert result.stdout.strip() == str(19999 % 7)
+            assert session.run("print('next')").stdout.strip() == "next"
+        finally:
+            session.close()
+
+    def test_non_utf8_child_stdin(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Frames are measured in bytes, so a non-UTF-8 child encoding can't split them."""
+        monkeypatch.setenv("PYTHONIOENCODING", "cp1252")
+        session = Session(timeout=10)
+        try:
+            result = session.run('x = "caf\u00e9"\nprint(len(x))')
+            assert result.stdout.strip() == "4", result.stderr
+            assert session.run("print(x.isascii())").stdout.strip() == "False"
+        finally:
+            session.close()
 
     def test_is_running_initially_false(self) -> None:
         session = Session(timeout=10)
@@ -329,7 +464,7 @@ class TestSessionEdgeCases:
             session.run("x = 1")
             assert session.history == []
         finally:
-            session.reset()
+            session.close()
 
     def test_multiple_resets_no_crash(self) -> None:
         session = Session(timeout=10)
@@ -337,6 +472,31 @@ class TestSessionEdgeCases:
         session.reset()
         session.reset()
         # Should not raise
+        session.close()
+
+    def test_reset_prestarts_next_process(self) -> None:
+        session = Session(timeout=10)
+        try:
+            session.run("x = 1")
+            session.reset()
+            assert session._standby is not None
+            standby = session._standby[0]
+            result = session.run("print('fresh' if 'x' not in globals() else 'stale')")
+            assert result.stdout.strip() == "fresh"
+            assert session._process is standby
+            assert session._standby is None
+        finally:
+            session.close()
+
+    def test_close_kills_standby(self) -> None:
+        session = Session(timeout=10)
+        session.reset()
+        assert session._standby is not None
+        standby = session._standby[0]
+        session.close()
+        assert session._standby is None
+        assert standby.poll() is not None
+        assert not session.is_running
 
 
 # ---------------------------------------------------------------------------
@@ -366,6 +526,41 @@ class TestKillTree:
 
         assert proc.poll() is not None  # process is dead
 
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="walks /proc")
+    def test_kill_tree_kills_grandchildren(self) -> None:
+        """A process started by the user's code dies with it."""
+        proc = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import subprocess, sys, time\n"
+                "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+                "print(child.pid, flush=True)\n"
+                "time.sleep(60)",
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        assert proc.stdout is not None
+        grandchild = int(proc.stdout.readline())
+        assert grandchild in _descendant_pids(proc.pid)
+
+        _kill_tree(proc)
+        proc.wait(timeout=5)
+        proc.stdout.close()
+
+        def alive(pid: int) -> bool:
+            try:
+                with open(f"/proc/{pid}/stat", "rb") as f:
+                    return f.read().rpartition(b")")[2].split()[0] != b"Z"
+            except OSError:
+                return False
+
+        deadline = time.monotonic() + 5
+        while alive(grandchild) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not alive(grandchild)
+
     def test_kill_tree_already_dead_no_error(self) -> None:
         """Calling _kill_tree on an already-dead process should not raise."""
         proc = subprocess.Popen(
@@ -66,7 +66,7 @@ def isolated_main_window(qtbot, tmp_path, monkeypatch):
     yield window
 
     # Cleanup: kill any lingering subprocess so the test can tear down cleanly.
-    window._session.reset()
+    window._session.close()
 
 
 # ---------------------------------------------------------------------------
@@ -163,6 +163,18 @@ class TestDialogHandlers:
         window = isolated_main_window
         window._show_search()
 
+    @patch("pylearn.ui.main_window.SearchDialog.exec", _noop_exec)
+    def test_show_search_deletes_dialog(self, isolated_main_window) -> None:
+        """The search dialog (and its index) doesn't outlive _show_search."""
+        from PyQt6.QtCore import QCoreApplication, QEvent
+
+        from pylearn.ui.search_dialog import SearchDialog
+
+        window = isolated_main_window
+        window._show_search()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        assert window.findChildren(SearchDialog) == []
+
     @patch("pylearn.ui.main_window.QMessageBox.information", _noop_messagebox)
     def test_show_shortcuts(self, isolated_main_window) -> None:
         """_show_shortcuts shows QMessageBox (patched to no-op)."""
@@ -334,6 +346,32 @@ class TestFileOperations:
         assert target.exists()
         assert "print('hello')" in target.read_text(encoding="utf-8")
 
+    @patch("pylearn.ui.main_window.QFileDialog.getSaveFileName")
+    def test_export_notes_bookmarks(self, mock_dialog, isolated_main_window, tmp_path) -> None:
+        """_export_notes_bookmarks streams the Markdown export to the chosen path."""
+        from pylearn.core.database import Database
+        from pylearn.utils.export import export_to_markdown
+
+        target = tmp_path / "notes.md"
+        mock_dialog.return_value = (str(target), "Markdown Files (*.md)")
+        window = isolated_main_window
+        window._db = Database(db_path=tmp_path / "export.db")
+        window._db.upsert_book("b1", "Book", "/b.pdf", 10, 1)
+        window._db.add_note("b1", 1, "", "Remember this")
+        window._export_notes_bookmarks()
+        assert target.read_text(encoding="utf-8") == export_to_markdown(window._db)
+
+    @patch("pylearn.ui.main_window.QMessageBox.information", _noop_messagebox)
+    @patch("pylearn.ui.main_window.QFileDialog.getSaveFileName")
+    def test_export_notes_bookmarks_nothing_to_export(self, mock_dialog, isolated_main_window, tmp_path) -> None:
+        """With no notes or bookmarks, no file is asked for."""
+        from pylearn.core.database import Database
+
+        window = isolated_main_window
+        window._db = Database(db_path=tmp_path / "export.db")
+        window._export_notes_bookmarks()
+        mock_dialog.assert_not_called()
+
     @patch("pylearn.ui.main_window.QFileDialog.getOpenFileName")
     def test_load_code_from_file(self, mock_dialog, isolated_main_window, tmp_path) -> None:
         """_load_code_from_file reads the chosen file into the editor."""
@@ -394,3 +432,31 @@ class TestCloseEvent:
         """Closing the window does not raise."""
         window = isolated_main_window
         window.close()
+
+    def test_wait_for_thread(self, qtbot) -> None:
+        """_wait_for_thread returns as soon as the thread finishes, or False on timeout."""
+        import time
+
+        from PyQt6.QtCore import QThread
+
+        from pylearn.ui.main_window import MainWindow
+
+        class Sleeper(QThread):
+            def __init__(self, seconds: float) -> None:
+                super().__init__()
+                self.seconds = seconds
+
+            def run(self) -> None:
+                time.sleep(self.seconds)
+
+        quick = Sleeper(0.1)
+        quick.start()
+        started = time.monotonic()
+        assert MainWindow._wait_for_thread(quick, 5000)
+        assert time.monotonic() - started < 2
+
+        slow = Sleeper(1.0)
+        slow.start()
+        assert not MainWindow._wait_for_thread(slow, 50)
+        slow.wait()
+        assert MainWindow._wait_for_thread(slow, 50)  # already finished
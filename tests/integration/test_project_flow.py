@@ -83,7 +83,7 @@ def isolated_main_window(qtbot, tmp_path, monkeypatch, project_content):
     window.show()
     qtbot.waitExposed(window)
     yield window
-    window._session.reset()
+    window._session.close()
 
 
 class TestProjectTabExists:
@@ -120,7 +120,7 @@ class TestProjectPanelDirect:
             assert len(panel._steps) == 2
             assert panel._step_list.count() == 2
         finally:
-            session.reset()
+            session.close()
             db.close()
 
     def test_load_nonexistent(self, qtbot, tmp_path: Path, project_content: Path) -> None:
@@ -137,7 +137,7 @@ class TestProjectPanelDirect:
             qtbot.addWidget(panel)
             assert panel.load_project("no_book") is False
         finally:
-            session.reset()
+            session.close()
             db.close()
 
     def test_step_navigation(self, qtbot, tmp_path: Path, project_content: Path) -> None:
@@ -165,7 +165,7 @@ class TestProjectPanelDirect:
             assert panel._current_step_index == 1
             assert "Double It" in panel._step_browser.toPlainText()
         finally:
-            session.reset()
+            session.close()
             db.close()
 
     def test_load_previous_code(self, qtbot, tmp_path: Path, project_content: Path) -> None:
@@ -196,7 +196,7 @@ class TestProjectPanelDirect:
             assert "x = 10" in panel._editor.text()
             assert "my solution" in panel._editor.text()
         finally:
-            session.reset()
+            session.close()
             db.close()
 
     def test_reset_code(self, qtbot, tmp_path: Path, project_content: Path) -> None:
@@ -218,7 +218,7 @@ class TestProjectPanelDirect:
             panel._reset_code()
             assert panel._editor.text() == original
         finally:
-            session.reset()
+            session.close()
             db.close()
 
     def test_hints(self, qtbot, tmp_path: Path, project_content: Path) -> None:
@@ -242,7 +242,7 @@ class TestProjectPanelDirect:
             panel._show_next_hint()
             assert "10" in panel._hint_label.text()
         finally:
-            session.reset()
+            session.close()
             db.close()
 
     @pytest.mark.parametrize("theme", ["light", "dark", "sepia"])
@@ -261,7 +261,7 @@ class TestProjectPanelDirect:
             panel.set_theme(theme)
             assert panel._theme == theme
         finally:
-            session.reset()
+            session.close()
             db.close()
 
 
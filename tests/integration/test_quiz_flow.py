@@ -86,7 +86,7 @@ def isolated_main_window(qtbot, tmp_path, monkeypatch, quiz_content):
 
     yield window
 
-    window._session.reset()
+    window._session.close()
 
 
 class TestQuizTabExists:
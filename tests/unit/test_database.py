@@ -1,5 +1,7 @@
 """Tests for database CRUD operations using in-memory SQLite."""
 
+import sqlite3
+
 import pytest
 
 from pylearn.core.database import Database
@@ -11,6 +13,30 @@ def db(tmp_path):
     return Database(db_path=tmp_path / "test.db")
 
 
+class TestConnection:
+    def test_cache_pragmas_applied(self, db):
+        conn = db._conn
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_superseded_indexes_dropped(self, tmp_path):
+        path = tmp_path / "old.db"
+        Database(db_path=path).close()
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE INDEX idx_notes_book ON notes(book_id, chapter_num)")
+        conn.execute("CREATE INDEX idx_bookmarks_book ON bookmarks(book_id)")
+        conn.commit()
+        conn.close()
+
+        db = Database(db_path=path)
+        names = {row[0] for row in db._conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        db.close()
+        assert "idx_notes_book_chapter_created" in names
+        assert "idx_bookmarks_book_chapter" in names
+        assert not names & {"idx_notes_book", "idx_bookmarks_book"}
+
+
 class TestBooks:
     def test_upsert_and_get(self, db):
         db.upsert_book("b1", "Book One", "/path/b1.pdf", 100, 10)
@@ -48,6 +74,15 @@ class TestChapters:
         assert chapters[0]["title"] == "New Title"
         assert chapters[0]["end_page"] == 60
 
+    def test_get_all_chapters(self, db):
+        for bid in ("b1", "b2", "b3"):
+            db.upsert_book(bid, "Book", "/b.pdf", 100, 2)
+            db.upsert_chapter(bid, 2, f"{bid} two", 51, 100)
+            db.upsert_chapter(bid, 1, f"{bid} one", 1, 50)
+        chapters = db.get_all_chapters(["b3", "b1"])
+        assert [(c["book_id"], c["chapter_num"]) for c in chapters] == [("b1", 1), ("b1", 2), ("b3", 1), ("b3", 2)]
+        assert db.get_all_chapters([]) == []
+
 
 class TestReadingProgress:
     def test_update_and_get(self, db):
@@ -128,6 +163,13 @@ class TestBookmarks:
         all_bm = db.get_bookmarks()
         assert len(all_bm) == 2
 
+    def test_get_bookmarks_by_chapter(self, db):
+        db.upsert_book("b1", "Book", "/b.pdf", 100, 1)
+        db.add_bookmark("b1", 3, 0, "C")
+        db.add_bookmark("b1", 1, 0, "A")
+        db.add_bookmark("b1", 1, 10, "B")
+        assert [bm["label"] for bm in db.get_bookmarks_by_chapter("b1")] == ["A", "B", "C"]
+
 
 class TestNotes:
     def test_add_and_get(self, db):
@@ -159,6 +201,44 @@ class TestNotes:
         notes = db.get_notes("b1")
         assert len(notes) == 2
 
+    def test_get_notes_by_chapter(self, db):
+        db.upsert_book("b1", "Book", "/b.pdf", 100, 1)
+        db.add_note("b1", 2, "", "late chapter")
+        db.add_note("b1", 1, "", "first")
+        db.add_note("b1", 1, "", "second")
+        notes = db.get_notes_by_chapter("b1")
+        assert [n["content"] for n in notes] == ["first", "second", "late chapter"]
+
+    def test_has_notes_or_bookmarks(self, db):
+        db.upsert_book("b1", "Book", "/b.pdf", 100, 1)
+        db.upsert_book("b2", "Other", "/o.pdf", 100, 1)
+        assert not db.has_notes_or_bookmarks()
+        db.add_bookmark("b2", 1, 0, "Mark")
+        assert db.has_notes_or_bookmarks()
+        assert db.has_notes_or_bookmarks("b2")
+        assert not db.has_notes_or_bookmarks("b1")
+        db.add_note("b1", 1, "", "Note")
+        assert db.has_notes_or_bookmarks("b1")
+
+    def test_get_notes_page(self, db):
+        db.upsert_book("b1", "Book", "/b.pdf", 100, 1)
+        for i in range(5):
+            db.add_note("b1", 1, "", f"Note {i}")
+        first = db.get_notes_page("b1", 1, 0, 2)
+        second = db.get_notes_page("b1", 1, 2, 2)
+        last = db.get_notes_page("b1", 1, 4, 2)
+        assert [len(first), len(second), len(last)] == [2, 2, 1]
+        ids = [n["note_id"] for n in first + second + last]
+        assert len(set(ids)) == 5
+
+    def test_get_notes_page_filters_like_get_notes(self, db):
+        db.upsert_book("b1", "Book", "/b.pdf", 100, 1)
+        db.add_note("b1", 1, "", "Ch 1")
+        db.add_note("b1", 2, "", "Ch 2")
+        assert [n["content"] for n in db.get_notes_page("b1", 2, 0, 10)] == ["Ch 2"]
+        assert len(db.get_notes_page("b1", None, 0, 10)) == 2
+        assert len(db.get_notes_page(None, None, 0, 10)) == 2
+
 
 class TestExercises:
     def test_upsert_and_get(self, db):
@@ -187,6 +267,19 @@ class TestExercises:
         assert progress["user_code"] == "my code"
         assert progress["attempts"] == 1
 
+    def test_completion_count(self, db):
+        db.upsert_book("b1", "Book", "/b.pdf", 100, 1)
+        db.upsert_exercise("ex1", "b1", 1, "Ex1", "Desc", "exercise")
+        db.upsert_exercise("ex2", "b1", 1, "Ex2", "Desc", "exercise")
+        db.upsert_exercise("ex3", "b1", 1, "Ex3", "Desc", "exercise")
+        db.update_exercise_progress("ex1", True)
+        db.update_exercise_progress("ex2", False)
+        assert db.get_exercise_completion_count("b1") == (1, 3)
+
+    def test_completion_count_no_exercises(self, db):
+        db.upsert_book("b1", "Book", "/b.pdf", 100, 1)
+        assert db.get_exercise_completion_count("b1") == (0, 0)
+
     def test_progress_increments_attempts(self, db):
         db.upsert_book("b1", "Book", "/b.pdf", 100, 1)
         db.upsert_exercise("ex1", "b1", 1, "Ex1", "Desc", "exercise")
@@ -3,8 +3,11 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import sys
+import traceback
+from logging.handlers import MemoryHandler, QueueHandler, RotatingFileHandler
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,11 +19,22 @@ from pylearn.utils.error_handler import (
     ExecutionTimeoutError,
     PDFParseError,
     PyLearnError,
+    _AmortizedRotatingFileHandler,
+    _message_box,
     install_global_exception_handler,
     safe_slot,
     setup_logging,
 )
 
+
+@pytest.fixture(autouse=True)
+def _fresh_message_box():
+    """Tests swap PyQt6.QtWidgets in sys.modules, so don't let a resolved QMessageBox leak between them."""
+    _message_box.cache_clear()
+    yield
+    _message_box.cache_clear()
+
+
 # ---------------------------------------------------------------------------
 # Custom exception hierarchy
 # ---------------------------------------------------------------------------
@@ -70,7 +84,26 @@ class TestSetupLogging:
         logger = logging.getLogger("pylearn")
         logger.handlers.clear()
         yield
+        for handler in logger.handlers:
+            listener = getattr(handler, "listener", None)
+            if listener is not None:
+                atexit.unregister(listener.stop)
+                if listener._thread is not None:
+                    listener.stop()
+                for target in listener.handlers:
+                    atexit.unregister(target.close)
+                    inner = getattr(target, "target", None)
+                    target.close()
+                    if inner is not None:
+                        inner.close()
         logger.handlers.clear()
+        logger.propagate = True
+
+    @staticmethod
+    def _output_handlers(logger: logging.Logger) -> tuple[logging.Handler, ...]:
+        (queue_handler,) = logger.handlers
+        assert isinstance(queue_handler, QueueHandler)
+        return queue_handler.listener.handlers
 
     def test_returns_logger_instance(self, tmp_path):
         with patch("pylearn.utils.error_handler.DATA_DIR", tmp_path):
@@ -95,11 +128,24 @@ class TestSetupLogging:
     def test_adds_console_and_file_handlers(self, tmp_path):
         with patch("pylearn.utils.error_handler.DATA_DIR", tmp_path):
             logger = setup_logging()
-        # Should have exactly 2 handlers: StreamHandler + RotatingFileHandler
-        assert len(logger.handlers) == 2
-        handler_types = {type(h).__name__ for h in logger.handlers}
-        assert "StreamHandler" in handler_types
-        assert "RotatingFileHandler" in handler_types
+        # Should have exactly 2 handlers behind the queue: StreamHandler + RotatingFileHandler
+        handlers = self._output_handlers(logger)
+        assert len(handlers) == 2
+        assert any(type(h) is logging.StreamHandler for h in handlers)
+        (buffered,) = (h for h in handlers if isinstance(h, MemoryHandler))
+        assert isinstance(buffered.target, RotatingFileHandler)
+
+    def test_console_shows_warnings_only_without_debug(self, tmp_path):
+        with patch("pylearn.utils.error_handler.DATA_DIR", tmp_path):
+            logger = setup_logging(debug=False)
+        console = next(h for h in self._output_handlers(logger) if type(h) is logging.StreamHandler)
+        assert console.level == logging.WARNING
+
+    def test_console_shows_debug_in_debug_mode(self, tmp_path):
+        with patch("pylearn.utils.error_handler.DATA_DIR", tmp_path):
+            logger = setup_logging(debug=True)
+        console = next(h for h in self._output_handlers(logger) if type(h) is logging.StreamHandler)
+        assert console.level == logging.DEBUG
 
     def test_duplicate_handler_guard(self, tmp_path):
         """Calling setup_logging twice should not duplicate handlers."""
@@ -110,6 +156,31 @@ class TestSetupLogging:
         assert logger1 is logger2
         assert len(logger2.handlers) == handler_count
 
+    def test_does_not_propagate_to_root(self, tmp_path):
+        with patch("pylearn.utils.error_handler.DATA_DIR", tmp_path):
+            logger = setup_logging()
+        assert logger.propagate is False
+
+    def test_records_reach_log_file_through_queue(self, tmp_path):
+        with patch("pylearn.utils.error_handler.DATA_DIR", tmp_path):
+            logger = setup_logging()
+        logger.info("hello %s", "queue")
+        listener = logger.handlers[0].listener
+        listener.stop()
+        log_file = tmp_path / "pylearn.log"
+        # INFO records wait in the memory buffer until it fills or is flushed
+        assert "hello queue" not in log_file.read_text(encoding="utf-8")
+        for handler in listener.handlers:
+            handler.flush()
+        assert "hello queue" in log_file.read_text(encoding="utf-8")
+
+    def test_errors_are_written_immediately(self, tmp_path):
+        with patch("pylearn.utils.error_handler.DATA_DIR", tmp_path):
+            logger = setup_logging()
+        logger.error("boom")
+        logger.handlers[0].listener.stop()
+        assert "boom" in (tmp_path / "pylearn.log").read_text(encoding="utf-8")
+
     def test_log_file_created(self, tmp_path):
         with patch("pylearn.utils.error_handler.DATA_DIR", tmp_path):
             setup_logging()
@@ -123,6 +194,23 @@ class TestSetupLogging:
         assert log_dir.exists()
 
 
+class TestAmortizedRotatingFileHandler:
+    def _emit(self, handler: logging.Handler, count: int) -> None:
+        for i in range(count):
+            handler.handle(logging.LogRecord("pylearn", logging.INFO, __file__, 0, "line %d", (i,), None))
+
+    def test_rolls_over_only_on_check(self, tmp_path):
+        handler = _AmortizedRotatingFileHandler(tmp_path / "app.log", maxBytes=10, backupCount=1, encoding="utf-8")
+        handler.check_every = 5
+        try:
+            self._emit(handler, 4)
+            assert not (tmp_path / "app.log.1").exists()
+            self._emit(handler, 1)
+            assert (tmp_path / "app.log.1").exists()
+        finally:
+            handler.close()
+
+
 # ---------------------------------------------------------------------------
 # install_global_exception_handler()
 # ---------------------------------------------------------------------------
@@ -197,6 +285,23 @@ class TestInstallGlobalExceptionHandler:
 
         mock_dialog.exec.assert_called_once()
 
+    def test_dialog_shows_full_traceback(self):
+        install_global_exception_handler()
+        mock_qmb = MagicMock()
+        mock_dialog = MagicMock()
+        mock_qmb.return_value = mock_dialog
+        mock_widgets = MagicMock()
+        mock_widgets.QMessageBox = mock_qmb
+        with patch.dict("sys.modules", {"PyQt6": MagicMock(), "PyQt6.QtWidgets": mock_widgets}):
+            try:
+                raise RuntimeError("crash")
+            except RuntimeError:
+                exc_type, exc_value, exc_tb = sys.exc_info()
+                sys.excepthook(exc_type, exc_value, exc_tb)
+
+        detail = mock_dialog.setDetailedText.call_args[0][0]
+        assert detail == "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
+
     def test_dialog_failure_falls_back_to_print(self):
         """If QMessageBox fails, the exception should be printed to stderr."""
         install_global_exception_handler()
@@ -204,8 +309,8 @@ class TestInstallGlobalExceptionHandler:
         mock_widgets.QMessageBox.side_effect = RuntimeError("no display")
         with patch.dict("sys.modules", {"PyQt6": MagicMock(), "PyQt6.QtWidgets": mock_widgets}):
             with patch("pylearn.utils.error_handler.traceback") as mock_tb:
-                # format_exception still needs to work for the handler's try block
-                mock_tb.format_exception.side_effect = RuntimeError("format fail too")
+                # Formatting the traceback fails too, inside the handler's try block
+                mock_tb.TracebackException.side_effect = RuntimeError("format fail too")
                 mock_tb.print_exception = MagicMock()
                 try:
                     raise TypeError("boom")
@@ -217,6 +322,16 @@ class TestInstallGlobalExceptionHandler:
             mock_tb.print_exception.assert_called_once_with(exc_type, exc_value, exc_tb)
 
 
+class TestMessageBox:
+    def test_resolved_once(self):
+        mock_widgets = MagicMock()
+        with patch.dict("sys.modules", {"PyQt6": MagicMock(), "PyQt6.QtWidgets": mock_widgets}):
+            first = _message_box()
+        assert first is mock_widgets.QMessageBox
+        # Still cached after the patched module is gone
+        assert _message_box() is first
+
+
 # ---------------------------------------------------------------------------
 # safe_slot()
 # ---------------------------------------------------------------------------
@@ -266,17 +381,28 @@ class TestSafeSlot:
             result = widget.failing_method()
         assert result is None
 
-    def test_exception_is_logged(self):
+    def test_exception_is_logged(self, caplog):
         widget = FakeWidget()
-        mock_logger = MagicMock()
         mock_widgets = MagicMock()
-        with patch("logging.getLogger", return_value=mock_logger):
+        with caplog.at_level(logging.ERROR, logger="pylearn.ui"):
             with patch.dict("sys.modules", {"PyQt6": MagicMock(), "PyQt6.QtWidgets": mock_widgets}):
                 widget.failing_method()
-        mock_logger.exception.assert_called_once()
-        # Check the log message contains the function name
-        log_args = mock_logger.exception.call_args
-        assert "failing_method" in str(log_args)
+        records = [r for r in caplog.records if r.name == "pylearn.ui"]
+        assert len(records) == 1
+        # Check the log message contains the function name and the traceback
+        assert "failing_method" in records[0].getMessage()
+        assert records[0].exc_info is not None
+
+    def test_logger_resolved_at_decoration_time(self):
+        def slot(self):
+            raise ValueError("boom")
+
+        wrapped = safe_slot(slot)
+        mock_widgets = MagicMock()
+        with patch("logging.getLogger") as mock_get_logger:
+            with patch.dict("sys.modules", {"PyQt6": MagicMock(), "PyQt6.QtWidgets": mock_widgets}):
+                wrapped(FakeWidget())
+        mock_get_logger.assert_not_called()
 
     def test_qmessagebox_warning_called_on_exception(self):
         widget = FakeWidget()
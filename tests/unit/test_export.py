@@ -7,12 +7,14 @@ database and verifies the exported Markdown content.
 
 from __future__ import annotations
 
+import io
+import re
 from pathlib import Path
 
 import pytest
 
 from pylearn.core.database import Database
-from pylearn.utils.export import _fmt_timestamp, export_to_markdown
+from pylearn.utils.export import _fmt_timestamp, export_to_markdown, export_to_markdown_stream
 
 
 @pytest.fixture()
@@ -38,6 +40,12 @@ class TestFmtTimestamp:
     def test_invalid(self) -> None:
         assert _fmt_timestamp("not-a-date") == "not-a-date"
 
+    def test_repeated_timestamps_are_cached(self) -> None:
+        _fmt_timestamp.cache_clear()
+        _fmt_timestamp("2026-02-23T14:32:00")
+        _fmt_timestamp("2026-02-23T14:32:00")
+        assert _fmt_timestamp.cache_info().hits == 1
+
 
 class TestExportToMarkdown:
     def test_notes_and_bookmarks(self, db: Database) -> None:
@@ -120,3 +128,67 @@ class TestExportToMarkdown:
         """Requesting export for a non-existent book returns None."""
         result = export_to_markdown(db, "nonexistent")
         assert result is None
+
+    def test_exact_layout(self, db: Database) -> None:
+        """Lines, blank-line spacing, and the separator between books are stable."""
+        _seed_book(db, "book1", "Learning Python")
+        _seed_book(db, "book2", "C++ Primer")
+        db.add_note("book1", 1, "Intro", "First line\nSecond line")
+        db.add_bookmark("book1", 2, 0, "Types")
+        db.add_bookmark("book2", 1, 0, "Hello")
+
+        result = export_to_markdown(db)
+        assert result is not None
+        result = re.sub(r"\d{4}-\d{2}-\d{2}( at \d{2}:\d{2})?", "DATE", result)
+        assert result == (
+            "# Learning Python — Notes & Bookmarks\n"
+            "*Exported from PyLearn on DATE*\n"
+            "\n"
+            "---\n"
+            "\n"
+            "## Notes\n"
+            "\n"
+            "### Chapter 1: Getting Started\n"
+            "\n"
+            "#### Intro\n"
+            "*Added DATE*\n"
+            "\n"
+            "First line\n"
+            "Second line\n"
+            "\n"
+            "---\n"
+            "\n"
+            "## Bookmarks\n"
+            "\n"
+            "### Chapter 2: Variables\n"
+            "- **Types** *(added DATE)*\n"
+            "\n"
+            "# C++ Primer — Notes & Bookmarks\n"
+            "*Exported from PyLearn on DATE*\n"
+            "\n"
+            "---\n"
+            "\n"
+            "## Bookmarks\n"
+            "\n"
+            "### Chapter 1: Getting Started\n"
+            "- **Hello** *(added DATE)*\n"
+        )
+
+
+class TestExportToMarkdownStream:
+    def test_writes_same_document_to_file(self, db: Database, tmp_path: Path) -> None:
+        _seed_book(db)
+        db.add_note("book1", 1, "Intro", "Streamed note")
+        db.add_bookmark("book1", 2, 0, "Types")
+
+        path = tmp_path / "out.md"
+        with path.open("w", encoding="utf-8") as f:
+            assert export_to_markdown_stream(db, f, "book1") is True
+        assert path.read_text(encoding="utf-8") == export_to_markdown(db, "book1")
+
+    def test_nothing_to_export_writes_nothing(self, db: Database) -> None:
+        _seed_book(db)
+        out = io.StringIO()
+        assert export_to_markdown_stream(db, out, "book1") is False
+        assert export_to_markdown_stream(db, out, "nonexistent") is False
+        assert out.getvalue() == ""
@@ -262,6 +262,23 @@ class TestOutputLimit:
 
         assert session_limit == 2 * 1024 * 1024
 
+    def test_session_reader_drops_lines_past_limit(self, monkeypatch):
+        """Output beyond the limit isn't queued, even when no run is collecting."""
+        import io
+        import queue
+
+        from pylearn.executor import session
+
+        monkeypatch.setattr(session, "_MAX_OUTPUT_CHARS", 10)
+        out: queue.SimpleQueue = queue.SimpleQueue()
+        stream = io.StringIO("12345\n" * 100 + "DONE\n" + "ab\n")
+        session._pump_lines(stream, out, "DONE")
+
+        items = []
+        while not out.empty():
+            items.append(out.get())
+        assert items == ["12345\n", "12345\n", None, "ab\n", session._EOF]
+
 
 # ---------------------------------------------------------------------------
 # D1 — Database connection timeout
@@ -1,5 +1,7 @@
 """Tests for data model serialization round-trips."""
 
+import pytest
+
 from pylearn.core.models import (
     BlockType,
     Book,
@@ -11,6 +13,12 @@ from pylearn.core.models import (
 
 
 class TestContentBlock:
+    def test_uses_slots(self):
+        block = ContentBlock(block_type=BlockType.BODY, text="x")
+        assert not hasattr(block, "__dict__")
+        with pytest.raises(AttributeError):
+            block.extra = 1  # type: ignore[attr-defined]
+
     def test_round_trip(self):
         block = ContentBlock(
             block_type=BlockType.CODE,
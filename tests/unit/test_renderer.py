@@ -54,14 +54,14 @@ def _make_block(
 class TestBodyRendering:
     def test_body_produces_paragraph(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.BODY, "Hello world")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<p>" in result
         assert "Hello world" in result
         assert "</p>" in result
 
     def test_body_escapes_html(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.BODY, "<b>bold</b>")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "&lt;b&gt;bold&lt;/b&gt;" in result
         assert "<b>bold</b>" not in result
 
@@ -69,7 +69,7 @@ class TestBodyRendering:
 class TestHeadingRendering:
     def test_heading1_has_h1_tag(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.HEADING1, "Chapter Title")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<h1>" in result
         assert "</h1>" in result
         assert "<hr>" in result
@@ -77,78 +77,84 @@ class TestHeadingRendering:
 
     def test_heading1_uses_theme_color(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.HEADING1, "Title")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert renderer.theme.h1_color in result
 
     def test_heading2_has_h2_tag(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.HEADING2, "Section Title")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<h2>" in result
         assert "</h2>" in result
         assert "Section Title" in result
 
     def test_heading2_uses_theme_color(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.HEADING2, "Title")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert renderer.theme.h2_color in result
 
     def test_heading3_has_h3_tag(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.HEADING3, "Subsection")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<h3>" in result
         assert "</h3>" in result
         assert "Subsection" in result
 
     def test_heading3_uses_theme_color(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.HEADING3, "Title")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert renderer.theme.h3_color in result
 
     def test_heading_with_block_id_has_anchor(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.HEADING1, "Title", block_id="ch1_s1")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert '<a name="ch1_s1">' in result
 
+    def test_heading_anchor_is_inside_heading(self, renderer: HTMLRenderer) -> None:
+        # QTextDocument drops empty anchors that precede the heading block
+        for block_type, tag in [(BlockType.HEADING1, "h1"), (BlockType.HEADING2, "h2"), (BlockType.HEADING3, "h3")]:
+            result = renderer.render_block(_make_block(block_type, "Title", block_id="s1"))
+            assert f'<{tag}><a name="s1"></a>' in result
+
     def test_heading_escapes_text(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.HEADING1, "A & B <C>")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "A &amp; B &lt;C&gt;" in result
 
 
 class TestCodeBlockRendering:
     def test_code_has_pre_and_table(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.CODE, "x = 1", block_id="code_0")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<pre>" in result
         assert "<table" in result
         assert renderer.theme.code_bg in result
 
     def test_code_has_copy_link(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.CODE, "x = 1", block_id="code_0")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert 'href="copy:code_0"' in result
         assert "Copy" in result
 
     def test_code_has_tryit_link(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.CODE, "x = 1", block_id="code_0")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert 'href="tryit:code_0"' in result
         assert "Try in Editor" in result
 
     def test_code_repl_renders_similarly(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.CODE_REPL, ">>> print(1)", block_id="repl_0")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<pre>" in result
         assert 'href="copy:repl_0"' in result
 
     def test_code_uses_theme_font(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.CODE, "pass", block_id="c1")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert renderer.theme.code_font in result
 
     def test_code_block_id_is_escaped(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.CODE, "pass", block_id='"><script>')
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert '"><script>' not in result
         assert html.escape('"><script>') in result
 
@@ -156,28 +162,28 @@ class TestCodeBlockRendering:
 class TestCalloutRendering:
     def test_note_has_label_and_bg(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.NOTE, "Remember this.")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<b>Note:</b>" in result
         assert renderer.theme.note_bg in result
         assert "Remember this." in result
 
     def test_warning_has_label_and_bg(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.WARNING, "Be careful.")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<b>Warning:</b>" in result
         assert renderer.theme.warning_bg in result
         assert "Be careful." in result
 
     def test_tip_has_label_and_bg(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.TIP, "Try this shortcut.")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<b>Tip:</b>" in result
         assert renderer.theme.tip_bg in result
         assert "Try this shortcut." in result
 
     def test_note_escapes_html(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.NOTE, "<script>alert('xss')</script>")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<script>" not in result
         assert "&lt;script&gt;" in result
 
@@ -185,21 +191,21 @@ class TestCalloutRendering:
 class TestExerciseRendering:
     def test_exercise_has_label_and_border(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.EXERCISE, "Write a function.")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "Exercise:" in result
         assert renderer.theme.tip_border in result
         assert "Write a function." in result
 
     def test_exercise_escapes_html(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.EXERCISE, "x < y && z > 0")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "x &lt; y &amp;&amp; z &gt; 0" in result
 
 
 class TestListItemRendering:
     def test_list_item_has_bullet(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.LIST_ITEM, "Item one")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "&bull;" in result
         assert "Item one" in result
         assert "<p>" in result
@@ -208,29 +214,29 @@ class TestListItemRendering:
 class TestFigureRendering:
     def test_figure_with_image_dir(self, renderer_with_images: HTMLRenderer) -> None:
         block = _make_block(BlockType.FIGURE, "diagram.png")
-        result = renderer_with_images._render_block(block)
+        result = renderer_with_images.render_block(block)
         assert "<img" in result
         assert "diagram.png" in result
         assert 'width="90%"' in result
 
     def test_figure_without_image_dir(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.FIGURE, "diagram.png")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert result == ""
 
     def test_figure_rejects_path_traversal_dotdot(self, renderer_with_images: HTMLRenderer) -> None:
         block = _make_block(BlockType.FIGURE, "../../etc/passwd")
-        result = renderer_with_images._render_block(block)
+        result = renderer_with_images.render_block(block)
         assert result == ""
 
     def test_figure_rejects_forward_slash(self, renderer_with_images: HTMLRenderer) -> None:
         block = _make_block(BlockType.FIGURE, "images/hidden.png")
-        result = renderer_with_images._render_block(block)
+        result = renderer_with_images.render_block(block)
         assert result == ""
 
     def test_figure_rejects_backslash(self, renderer_with_images: HTMLRenderer) -> None:
         block = _make_block(BlockType.FIGURE, r"images\hidden.png")
-        result = renderer_with_images._render_block(block)
+        result = renderer_with_images.render_block(block)
         assert result == ""
 
 
@@ -239,18 +245,18 @@ class TestDefaultFallback:
 
     def test_table_renders_as_body(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.TABLE, "col1 | col2")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<p>" in result
         assert "col1 | col2" in result
 
     def test_page_header_renders_as_body(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.PAGE_HEADER, "Page Header")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<p>" in result
 
     def test_page_footer_renders_as_body(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.PAGE_FOOTER, "Page Footer")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<p>" in result
 
 
@@ -262,28 +268,28 @@ class TestDefaultFallback:
 class TestHTMLEscaping:
     def test_script_tag_escaped_in_body(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.BODY, "<script>alert('xss')</script>")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<script>" not in result
         assert "&lt;script&gt;" in result
 
     def test_ampersand_escaped(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.BODY, "AT&T")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "AT&amp;T" in result
 
     def test_angle_brackets_escaped(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.BODY, "a < b > c")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "a &lt; b &gt; c" in result
 
     def test_script_in_heading_escaped(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.HEADING2, "<script>document.cookie</script>")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         assert "<script>" not in result
 
     def test_img_tag_in_note_escaped(self, renderer: HTMLRenderer) -> None:
         block = _make_block(BlockType.NOTE, "<img onerror=alert(1) src=x>")
-        result = renderer._render_block(block)
+        result = renderer.render_block(block)
         # The < and > must be escaped so the tag is not rendered as HTML
         assert "<img " not in result
         assert "&lt;img" in result
@@ -329,6 +335,29 @@ class TestRenderBlocks:
         assert "<style>" in result
         assert "font-family" in result
 
+    def test_render_blocks_matches_wrapped_fragments(self, renderer: HTMLRenderer) -> None:
+        blocks = [_make_block(BlockType.HEADING1, "Title"), _make_block(BlockType.BODY, "Text")]
+        expected = renderer.wrap_html("\n".join(renderer.render_block(b) for b in blocks))
+        assert renderer.render_blocks(blocks) == expected
+
+    def test_stylesheet_tracks_font_size(self, renderer: HTMLRenderer) -> None:
+        renderer.update_font_size(21)
+        css = renderer.get_stylesheet()
+        assert "font-size: 21px" in css
+        assert css in renderer.wrap_html("")
+
+    def test_wrap_body_has_no_style_block(self, renderer: HTMLRenderer) -> None:
+        result = renderer.wrap_body("<p>Hi</p>")
+        assert "<style>" not in result
+        assert "<body>\n<p>Hi</p>\n</body>" in result
+
+    def test_block_fragment_independent_of_font_size(self, renderer: HTMLRenderer) -> None:
+        """Block fragments are cacheable across font-size changes."""
+        block = _make_block(BlockType.CODE, "x = 1", block_id="code_0")
+        before = renderer.render_block(block)
+        renderer.update_font_size(22)
+        assert renderer.render_block(block) == before
+
 
 # ---------------------------------------------------------------------------
 # render_welcome
@@ -349,6 +378,19 @@ class TestRenderWelcome:
         assert "<!DOCTYPE html>" in result
         assert "<body>" in result
 
+    def test_wrap_welcome_is_cached_and_body_only(self, renderer: HTMLRenderer) -> None:
+        first = renderer.wrap_welcome()
+        assert "PyLearn" in first
+        assert "<style>" not in first
+        assert renderer.wrap_welcome() is first
+
+    def test_wrap_welcome_follows_theme(self, renderer: HTMLRenderer) -> None:
+        light = renderer.wrap_welcome()
+        renderer.update_theme("dark")
+        dark = renderer.wrap_welcome()
+        assert dark != light
+        assert renderer.theme.button_bg in dark
+
 
 # ---------------------------------------------------------------------------
 # update_font_size
@@ -380,6 +422,10 @@ class TestUpdateFontSize:
         renderer.update_font_size(18)
         assert renderer.theme.h3_font_size == 20  # 18 + 2
 
+    def test_font_sizes_follow_update(self, renderer: HTMLRenderer) -> None:
+        renderer.update_font_size(18)
+        assert renderer.font_sizes() == (18, 16, 30, 24, 20)
+
 
 # ---------------------------------------------------------------------------
 # Theme variations
@@ -409,14 +455,14 @@ class TestThemeVariations:
     def test_code_block_uses_theme_code_bg(self, theme_name: str) -> None:
         r = HTMLRenderer(theme=get_theme(theme_name))
         block = _make_block(BlockType.CODE, "pass", block_id="c1")
-        result = r._render_block(block)
+        result = r.render_block(block)
         assert r.theme.code_bg in result
 
     @pytest.mark.parametrize("theme_name", ["light", "dark", "sepia"])
     def test_note_uses_theme_colors(self, theme_name: str) -> None:
         r = HTMLRenderer(theme=get_theme(theme_name))
         block = _make_block(BlockType.NOTE, "themed note")
-        result = r._render_block(block)
+        result = r.render_block(block)
         assert r.theme.note_bg in result
 
     def test_update_theme_switches_colors(self) -> None:
@@ -13,7 +13,15 @@ import pytest
 from PyQt6.QtCore import Qt
 
 from pylearn.core.models import BlockType, Book, Chapter, ContentBlock
-from pylearn.ui.search_dialog import SearchDialog, SearchWorker, _block_type_label
+from pylearn.core.search_index import SearchIndex
+from pylearn.ui.search_dialog import (
+    _RESULT_BATCH_SIZE,
+    _SNIPPET_ROLE,
+    SearchDialog,
+    SearchWorker,
+    SnippetDelegate,
+    _block_type_label,
+)
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -94,6 +102,22 @@ def mock_cache(two_books):
     return cache
 
 
+@pytest.fixture
+def make_dialog(qtbot):
+    """Build SearchDialogs that are closed, stopping their book loader, after the test."""
+    dialogs: list[SearchDialog] = []
+
+    def make(*args, **kwargs) -> SearchDialog:
+        dialog = SearchDialog(*args, **kwargs)
+        qtbot.addWidget(dialog)
+        dialogs.append(dialog)
+        return dialog
+
+    yield make
+    for dialog in dialogs:
+        dialog.close()
+
+
 # ===========================================================================
 # _block_type_label tests
 # ===========================================================================
@@ -149,8 +173,8 @@ class TestSearchWorkerResults:
     def test_emits_block_id_and_type(self, two_books):
         """Results include the block_id and a human-readable type label."""
         results: list[tuple] = []
-        worker = SearchWorker("hello", [two_books[0]])
-        worker.result_found.connect(lambda *args: results.append(args))
+        worker = SearchWorker("hello", SearchIndex([two_books[0]]))
+        worker.results_batch.connect(results.extend)
         worker.run()  # run synchronously (not .start())
 
         assert len(results) == 1
@@ -164,8 +188,8 @@ class TestSearchWorkerResults:
     def test_case_insensitive_match(self, two_books):
         """Search should be case-insensitive."""
         results: list[tuple] = []
-        worker = SearchWorker("PYTHON", [two_books[0]])
-        worker.result_found.connect(lambda *args: results.append(args))
+        worker = SearchWorker("PYTHON", SearchIndex([two_books[0]]))
+        worker.results_batch.connect(results.extend)
         worker.run()
 
         # "Python" appears in body_0 (ch1), h1_1 (ch2), body_1 (ch2), note_0 (ch2)
@@ -174,14 +198,61 @@ class TestSearchWorkerResults:
     def test_snippet_context(self, two_books):
         """Snippet should contain text around the match."""
         results: list[tuple] = []
-        worker = SearchWorker("versatile", [two_books[0]])
-        worker.result_found.connect(lambda *args: results.append(args))
+        worker = SearchWorker("versatile", SearchIndex([two_books[0]]))
+        worker.results_batch.connect(results.extend)
         worker.run()
 
         assert len(results) == 1
         snippet = results[0][3]
         assert "versatile" in snippet
 
+    def test_snippet_ellipses(self):
+        """Ellipses mark only the sides where the block text was cut."""
+        text = "a" * 50 + " needle " + "b" * 50
+        blocks = [
+            ContentBlock(block_type=BlockType.BODY, text=text, block_id="long"),
+            ContentBlock(block_type=BlockType.BODY, text="short needle", block_id="short"),
+        ]
+        book = Book(
+            book_id="b",
+            title="B",
+            pdf_path="/tmp/b.pdf",
+            chapters=[Chapter(chapter_num=1, title="Ch", start_page=1, end_page=2, content_blocks=blocks)],
+        )
+        results: list[tuple] = []
+        worker = SearchWorker("needle", SearchIndex([book]))
+        worker.results_batch.connect(results.extend)
+        worker.run()
+
+        snippets = {r[4]: r[3] for r in results}
+        assert snippets["long"] == "..." + text[11:97] + "..."
+        assert snippets["short"] == "short needle"
+
+    def test_snippet_centered_after_casefold_expansion(self):
+        """A "ß" before the match doesn't shift the snippet window."""
+        text = "Straße " * 20 + "needle" + " tail" * 20
+        book = Book(
+            book_id="b",
+            title="B",
+            pdf_path="/tmp/b.pdf",
+            chapters=[
+                Chapter(
+                    chapter_num=1,
+                    title="Ch",
+                    start_page=1,
+                    end_page=2,
+                    content_blocks=[ContentBlock(block_type=BlockType.BODY, text=text, block_id="x")],
+                )
+            ],
+        )
+        results: list[tuple] = []
+        worker = SearchWorker("needle", SearchIndex([book]))
+        worker.results_batch.connect(results.extend)
+        worker.run()
+
+        at = text.index("needle")
+        assert results[0][3] == "..." + text[at - 40 : at + 46] + "..."
+
     def test_result_cap_at_200(self):
         """Worker should stop after 200 results."""
         # Create a book with 210 matching blocks
@@ -203,7 +274,7 @@ class TestSearchWorkerResults:
         book = _make_book("big", chapters=[chapter])
 
         finished_totals: list[int] = []
-        worker = SearchWorker("match", [book])
+        worker = SearchWorker("match", SearchIndex([book]))
         worker.finished.connect(lambda t: finished_totals.append(t))
         worker.run()
 
@@ -212,7 +283,7 @@ class TestSearchWorkerResults:
     def test_finished_signal_emitted(self, two_books):
         """finished signal should emit total result count."""
         totals: list[int] = []
-        worker = SearchWorker("hello", [two_books[0]])
+        worker = SearchWorker("hello", SearchIndex([two_books[0]]))
         worker.finished.connect(lambda t: totals.append(t))
         worker.run()
 
@@ -222,26 +293,39 @@ class TestSearchWorkerResults:
     def test_no_results(self, two_books):
         """No results emitted for a non-matching query."""
         results: list[tuple] = []
-        worker = SearchWorker("xyznonexistent", [two_books[0]])
-        worker.result_found.connect(lambda *args: results.append(args))
+        worker = SearchWorker("xyznonexistent", SearchIndex([two_books[0]]))
+        worker.results_batch.connect(results.extend)
         worker.run()
 
         assert len(results) == 0
 
-    def test_stop_halts_search(self, two_books):
+    def test_stop_halts_search(self):
         """Calling stop() prevents further results."""
+        blocks = [ContentBlock(block_type=BlockType.BODY, text="python", block_id=f"b_{i}") for i in range(50)]
+        chapter = Chapter(chapter_num=1, title="Ch", start_page=1, end_page=2, content_blocks=blocks)
         results: list[tuple] = []
-        worker = SearchWorker("python", two_books)
+        worker = SearchWorker("python", SearchIndex([_make_book("big", chapters=[chapter])]))
 
-        def capture_and_stop(*args: object) -> None:
-            results.append(args)
+        def capture_and_stop(batch: list[tuple]) -> None:
+            results.extend(batch)
             worker.stop()
 
-        worker.result_found.connect(capture_and_stop)
+        worker.results_batch.connect(capture_and_stop)
         worker.run()
 
-        # Should have stopped after the first result
-        assert len(results) == 1
+        # Should have stopped after the first batch
+        assert len(results) == _RESULT_BATCH_SIZE
+
+    def test_results_arrive_in_batches(self):
+        """Results are emitted in lists of at most _RESULT_BATCH_SIZE."""
+        blocks = [ContentBlock(block_type=BlockType.BODY, text="match", block_id=f"b_{i}") for i in range(45)]
+        chapter = Chapter(chapter_num=1, title="Ch", start_page=1, end_page=2, content_blocks=blocks)
+        sizes: list[int] = []
+        worker = SearchWorker("match", SearchIndex([_make_book("big", chapters=[chapter])]))
+        worker.results_batch.connect(lambda batch: sizes.append(len(batch)))
+        worker.run()
+
+        assert sizes == [_RESULT_BATCH_SIZE, _RESULT_BATCH_SIZE, 5]
 
 
 # ===========================================================================
@@ -252,40 +336,66 @@ class TestSearchWorkerResults:
 class TestSearchDialogConstruction:
     """SearchDialog constructs correctly with various parameters."""
 
-    def test_basic_construction(self, qtbot, mock_cache):
-        dialog = SearchDialog(mock_cache, ["book1", "book2"])
-        qtbot.addWidget(dialog)
+    def test_basic_construction(self, qtbot, make_dialog, mock_cache):
+        dialog = make_dialog(mock_cache, ["book1", "book2"])
         assert dialog.windowTitle() == "Search Books"
 
-    def test_has_search_input(self, qtbot, mock_cache):
-        dialog = SearchDialog(mock_cache, ["book1", "book2"])
-        qtbot.addWidget(dialog)
+    def test_has_search_input(self, qtbot, make_dialog, mock_cache):
+        dialog = make_dialog(mock_cache, ["book1", "book2"])
         assert dialog._input is not None
         assert dialog._input.placeholderText() == "Search book content..."
 
-    def test_has_results_tree(self, qtbot, mock_cache):
-        dialog = SearchDialog(mock_cache, ["book1", "book2"])
-        qtbot.addWidget(dialog)
+    def test_has_results_tree(self, qtbot, make_dialog, mock_cache):
+        dialog = make_dialog(mock_cache, ["book1", "book2"])
         assert dialog._results is not None
-        assert dialog._results.headerItem().text(0) == "Location"
-        assert dialog._results.headerItem().text(1) == "Type"
-        assert dialog._results.headerItem().text(2) == "Match"
-
-    def test_scope_shows_current_book_when_set(self, qtbot, mock_cache):
+        assert dialog._model.headerData(0, Qt.Orientation.Horizontal) == "Location"
+        assert dialog._model.headerData(1, Qt.Orientation.Horizontal) == "Type"
+        assert dialog._model.headerData(2, Qt.Orientation.Horizontal) == "Match"
+
+    def test_typing_debounces_search(self, qtbot, make_dialog, mock_cache):
+        """Typing schedules a search instead of running one per keystroke."""
+        dialog = make_dialog(mock_cache, ["book1", "book2"])
+
+        dialog._input.setText("py")
+        dialog._input.setText("python")
+        assert dialog._worker is None
+        assert dialog._search_timer.isActive()
+
+        qtbot.waitUntil(lambda: dialog._worker is not None)
+        assert dialog._query == "python"
+
+    def test_books_load_in_background(self, qtbot, make_dialog, mock_cache):
+        """Search stays disabled until the loader thread has indexed the books."""
+        dialog = make_dialog(mock_cache, ["book1", "book2"])
+        assert dialog._index is None
+        assert not dialog._search_btn.isEnabled()
+
+        qtbot.waitUntil(lambda: dialog._index is not None)
+        assert dialog._search_btn.isEnabled()
+        assert list(dict.fromkeys(dialog._index.book_ids)) == ["book1", "book2"]
+        assert dialog._progress.isHidden()
+
+    def test_reject_stops_loader(self, qtbot, make_dialog, mock_cache):
+        """Esc (reject) stops the loader thread even though no closeEvent is sent."""
+        dialog = make_dialog(mock_cache, ["book1", "book2"])
+        dialog.show()
+        dialog.reject()
+        assert dialog._loader._stop
+        assert not dialog._loader.isRunning()
+
+    def test_scope_shows_current_book_when_set(self, qtbot, make_dialog, mock_cache):
         """When current_book_id is provided, scope combo has 'Current Book' option."""
-        dialog = SearchDialog(
+        dialog = make_dialog(
             mock_cache,
             ["book1", "book2"],
             current_book_id="book1",
         )
-        qtbot.addWidget(dialog)
         assert dialog._scope.count() == 2
         assert dialog._scope.currentText() == "Current Book"
 
-    def test_scope_all_books_only_when_no_current(self, qtbot, mock_cache):
+    def test_scope_all_books_only_when_no_current(self, qtbot, make_dialog, mock_cache):
         """When no current_book_id, scope only has 'All Books'."""
-        dialog = SearchDialog(mock_cache, ["book1", "book2"])
-        qtbot.addWidget(dialog)
+        dialog = make_dialog(mock_cache, ["book1", "book2"])
         assert dialog._scope.count() == 1
         assert dialog._scope.currentText() == "All Books"
 
@@ -298,92 +408,120 @@ class TestSearchDialogConstruction:
 class TestSearchDialogGrouping:
     """Results are grouped hierarchically by chapter."""
 
-    def test_chapter_parent_items_created(self, qtbot, mock_cache):
+    def test_chapter_parent_items_created(self, qtbot, make_dialog, mock_cache):
         """Each chapter with results gets a bold parent item."""
-        dialog = SearchDialog(
+        dialog = make_dialog(
             mock_cache,
             ["book1"],
             current_book_id="book1",
         )
-        qtbot.addWidget(dialog)
 
         # Simulate adding results from two chapters
         dialog._query = "python"
-        dialog._add_result("book1", 1, "Getting Started", "...Python is...", "body_0", "Body")
-        dialog._add_result("book1", 2, "Variables", "...Python is...", "body_1", "Body")
+        dialog._add_result_batch(
+            [
+                ("book1", 1, "Getting Started", "...Python is...", "body_0", "Body"),
+                ("book1", 2, "Variables", "...Python is...", "body_1", "Body"),
+            ]
+        )
 
         # Two top-level chapter items
-        assert dialog._results.topLevelItemCount() == 2
+        model = dialog._model
+        assert model.rowCount() == 2
 
         # Chapter items are bold
-        ch1 = dialog._results.topLevelItem(0)
-        assert ch1.font(0).bold()
+        ch1 = model.index(0, 0)
+        assert ch1.data() == "[book1] Ch 1: Getting Started"
+        assert ch1.data(Qt.ItemDataRole.FontRole).bold()
+        assert dialog._results.isExpanded(ch1)
 
-    def test_matches_nested_under_chapter(self, qtbot, mock_cache):
+    def test_matches_nested_under_chapter(self, qtbot, make_dialog, mock_cache):
         """Individual matches are children of their chapter item."""
-        dialog = SearchDialog(
+        dialog = make_dialog(
             mock_cache,
             ["book1"],
             current_book_id="book1",
         )
-        qtbot.addWidget(dialog)
 
         dialog._query = "test"
-        dialog._add_result("book1", 1, "Getting Started", "test snippet", "code_0", "Code")
-        dialog._add_result("book1", 1, "Getting Started", "another test", "body_0", "Body")
+        dialog._add_result_batch([("book1", 1, "Getting Started", "test snippet", "code_0", "Code")])
+        dialog._add_result_batch([("book1", 1, "Getting Started", "another test", "body_0", "Body")])
 
         # One chapter parent with two children
-        assert dialog._results.topLevelItemCount() == 1
-        parent = dialog._results.topLevelItem(0)
-        assert parent.childCount() == 2
-
-    def test_child_items_store_user_role_data(self, qtbot, mock_cache):
+        model = dialog._model
+        assert model.rowCount() == 1
+        parent = model.index(0, 0)
+        assert model.rowCount(parent) == 2
+        child = model.index(1, 0, parent)
+        assert model.parent(child) == parent
+        assert model.rowCount(child) == 0
+        # Without an index, parent() isn't answered as if for the root
+        with pytest.raises(TypeError):
+            model.parent()
+
+    def test_child_items_store_user_role_data(self, qtbot, make_dialog, mock_cache):
         """Child items store (book_id, chapter_num, block_id) in UserRole."""
-        dialog = SearchDialog(
+        dialog = make_dialog(
             mock_cache,
             ["book1"],
             current_book_id="book1",
         )
-        qtbot.addWidget(dialog)
 
         dialog._query = "test"
-        dialog._add_result("book1", 1, "Getting Started", "test snippet", "code_0", "Code")
+        dialog._add_result_batch([("book1", 1, "Getting Started", "test snippet", "code_0", "Code")])
 
-        parent = dialog._results.topLevelItem(0)
-        child = parent.child(0)
-        data = child.data(0, Qt.ItemDataRole.UserRole)
+        model = dialog._model
+        child = model.index(0, 0, model.index(0, 0))
+        data = child.data(Qt.ItemDataRole.UserRole)
         assert data == ("book1", 1, "code_0")
 
-    def test_chapter_parent_has_no_user_role(self, qtbot, mock_cache):
+    def test_chapter_parent_has_no_user_role(self, qtbot, make_dialog, mock_cache):
         """Chapter parent items should not have UserRole data (not clickable)."""
-        dialog = SearchDialog(
+        dialog = make_dialog(
             mock_cache,
             ["book1"],
             current_book_id="book1",
         )
-        qtbot.addWidget(dialog)
 
         dialog._query = "test"
-        dialog._add_result("book1", 1, "Getting Started", "test snippet", "code_0", "Code")
+        dialog._add_result_batch([("book1", 1, "Getting Started", "test snippet", "code_0", "Code")])
+
+        parent = dialog._model.index(0, 0)
+        assert parent.data(Qt.ItemDataRole.UserRole) is None
+
+    def test_snippet_painted_by_delegate(self, qtbot, make_dialog, mock_cache):
+        """Snippets are item data drawn by a delegate, not a widget per row."""
+        dialog = make_dialog(mock_cache, ["book1"], current_book_id="book1")
+        dialog._query = "test"
+        dialog._add_result_batch([("book1", 1, "Getting Started", "a test snippet", "code_0", "Code")])
 
-        parent = dialog._results.topLevelItem(0)
-        assert parent.data(0, Qt.ItemDataRole.UserRole) is None
+        model = dialog._model
+        snippet = model.index(0, 2, model.index(0, 0))
+        assert dialog._results.indexWidget(snippet) is None
+        assert "<b" in snippet.data(_SNIPPET_ROLE)
+        assert isinstance(dialog._results.itemDelegateForColumn(2), SnippetDelegate)
+        dialog.show()
+        dialog._results.viewport().grab()  # exercises SnippetDelegate.paint
 
-    def test_block_type_shown_in_type_column(self, qtbot, mock_cache):
+    def test_block_type_shown_in_type_column(self, qtbot, make_dialog, mock_cache):
         """The type column shows the block type label."""
-        dialog = SearchDialog(
+        dialog = make_dialog(
             mock_cache,
             ["book1"],
             current_book_id="book1",
         )
-        qtbot.addWidget(dialog)
 
         dialog._query = "test"
-        dialog._add_result("book1", 1, "Getting Started", "test snippet", "code_0", "Code")
+        dialog._add_result_batch([("book1", 1, "Getting Started", "test snippet", "code_0", "Code")])
+
+        model = dialog._model
+        assert model.index(0, 1, model.index(0, 0)).data() == "Code"
 
-        parent = dialog._results.topLevelItem(0)
-        child = parent.child(0)
-        assert child.text(1) == "Code"
+    def test_new_search_clears_results(self, qtbot, make_dialog, mock_cache):
+        dialog = make_dialog(mock_cache, ["book1"])
+        dialog._add_result_batch([("book1", 1, "Getting Started", "test snippet", "code_0", "Code")])
+        dialog._model.clear()
+        assert dialog._model.rowCount() == 0
 
 
 # ===========================================================================
@@ -391,43 +529,54 @@ class TestSearchDialogGrouping:
 # ===========================================================================
 
 
+def _scoped_hit_books(dialog) -> set[str]:
+    """Books with a "python" hit in the dialog's index, under its current scope."""
+    index = dialog._index
+    return {index.book_ids[i] for i, _ in index.scan("python", dialog._get_scoped_book_id())}
+
+
 class TestSearchDialogScope:
-    """Scope toggle filters books correctly."""
+    """Scope toggle restricts the search to the right books."""
 
-    def test_current_book_scope_filters(self, qtbot, mock_cache):
-        """'Current Book' scope only returns the current book."""
-        dialog = SearchDialog(
+    def test_current_book_scope_filters(self, qtbot, make_dialog, mock_cache):
+        """'Current Book' scope only searches the current book."""
+        dialog = make_dialog(
             mock_cache,
             ["book1", "book2"],
             current_book_id="book1",
         )
-        qtbot.addWidget(dialog)
 
+        qtbot.waitUntil(lambda: dialog._index is not None)
         dialog._scope.setCurrentText("Current Book")
-        scoped = dialog._get_scoped_books()
-        assert len(scoped) == 1
-        assert scoped[0].book_id == "book1"
+        assert _scoped_hit_books(dialog) == {"book1"}
 
-    def test_all_books_scope_returns_all(self, qtbot, mock_cache):
-        """'All Books' scope returns all loaded books."""
-        dialog = SearchDialog(
+    def test_all_books_scope_returns_all(self, qtbot, make_dialog, mock_cache):
+        """'All Books' scope searches all loaded books."""
+        dialog = make_dialog(
             mock_cache,
             ["book1", "book2"],
             current_book_id="book1",
         )
-        qtbot.addWidget(dialog)
 
+        qtbot.waitUntil(lambda: dialog._index is not None)
         dialog._scope.setCurrentText("All Books")
-        scoped = dialog._get_scoped_books()
-        assert len(scoped) == 2
+        assert _scoped_hit_books(dialog) == {"book1", "book2"}
 
-    def test_all_books_default_when_no_current(self, qtbot, mock_cache):
+    def test_all_books_default_when_no_current(self, qtbot, make_dialog, mock_cache):
         """Without current_book_id, scope defaults to all books."""
-        dialog = SearchDialog(mock_cache, ["book1", "book2"])
-        qtbot.addWidget(dialog)
+        dialog = make_dialog(mock_cache, ["book1", "book2"])
+
+        qtbot.waitUntil(lambda: dialog._index is not None)
+        assert _scoped_hit_books(dialog) == {"book1", "book2"}
 
-        scoped = dialog._get_scoped_books()
-        assert len(scoped) == 2
+    def test_current_book_scope_restricts_search(self, qtbot, make_dialog, mock_cache):
+        """'Current Book' scope restricts the search to that book."""
+        dialog = make_dialog(mock_cache, ["book1", "book2"], current_book_id="book1")
+
+        dialog._scope.setCurrentText("Current Book")
+        assert dialog._get_scoped_book_id() == "book1"
+        dialog._scope.setCurrentText("All Books")
+        assert dialog._get_scoped_book_id() is None
 
 
 # ===========================================================================
@@ -438,66 +587,60 @@ class TestSearchDialogScope:
 class TestSearchDialogNavigation:
     """Double-click behavior and navigate_requested signal."""
 
-    def test_double_click_child_emits_signal(self, qtbot, mock_cache):
+    def test_double_click_child_emits_signal(self, qtbot, make_dialog, mock_cache):
         """Double-clicking a match item emits navigate_requested with block_id."""
-        dialog = SearchDialog(
+        dialog = make_dialog(
             mock_cache,
             ["book1"],
             current_book_id="book1",
         )
-        qtbot.addWidget(dialog)
 
         signals: list[tuple] = []
         dialog.navigate_requested.connect(lambda *args: signals.append(args))
 
         dialog._query = "test"
-        dialog._add_result("book1", 1, "Getting Started", "test snippet", "code_0", "Code")
+        dialog._add_result_batch([("book1", 1, "Getting Started", "test snippet", "code_0", "Code")])
 
-        parent = dialog._results.topLevelItem(0)
-        child = parent.child(0)
-        dialog._on_result_clicked(child, 0)
+        model = dialog._model
+        dialog._on_result_clicked(model.index(0, 2, model.index(0, 0)))
 
         assert len(signals) == 1
         assert signals[0] == ("book1", 1, "code_0")
 
-    def test_double_click_chapter_header_no_signal(self, qtbot, mock_cache):
+    def test_double_click_chapter_header_no_signal(self, qtbot, make_dialog, mock_cache):
         """Double-clicking a chapter header does not emit a signal."""
-        dialog = SearchDialog(
+        dialog = make_dialog(
             mock_cache,
             ["book1"],
             current_book_id="book1",
         )
-        qtbot.addWidget(dialog)
 
         signals: list[tuple] = []
         dialog.navigate_requested.connect(lambda *args: signals.append(args))
 
         dialog._query = "test"
-        dialog._add_result("book1", 1, "Getting Started", "test snippet", "code_0", "Code")
+        dialog._add_result_batch([("book1", 1, "Getting Started", "test snippet", "code_0", "Code")])
 
-        parent = dialog._results.topLevelItem(0)
-        dialog._on_result_clicked(parent, 0)
+        dialog._on_result_clicked(dialog._model.index(0, 0))
 
         assert len(signals) == 0
 
-    def test_navigate_signal_has_three_args(self, qtbot, mock_cache):
+    def test_navigate_signal_has_three_args(self, qtbot, make_dialog, mock_cache):
         """navigate_requested emits (book_id, chapter_num, block_id)."""
-        dialog = SearchDialog(
+        dialog = make_dialog(
             mock_cache,
             ["book1"],
             current_book_id="book1",
         )
-        qtbot.addWidget(dialog)
 
         signals: list[tuple] = []
         dialog.navigate_requested.connect(lambda *args: signals.append(args))
 
         dialog._query = "test"
-        dialog._add_result("book1", 2, "Variables", "test data", "note_0", "Note")
+        dialog._add_result_batch([("book1", 2, "Variables", "test data", "note_0", "Note")])
 
-        parent = dialog._results.topLevelItem(0)
-        child = parent.child(0)
-        dialog._on_result_clicked(child, 0)
+        model = dialog._model
+        dialog._on_result_clicked(model.index(0, 0, model.index(0, 0)))
 
         assert signals[0] == ("book1", 2, "note_0")
 
@@ -0,0 +1,105 @@
+"""Tests for the in-memory SearchIndex."""
+
+from __future__ import annotations
+
+from pylearn.core.models import BlockType, Book, Chapter, ContentBlock
+from pylearn.core.search_index import SearchIndex
+
+
+def _book(book_id: str, *chapters: list[str]) -> Book:
+    return Book(
+        book_id=book_id,
+        title=book_id,
+        pdf_path=f"/tmp/{book_id}.pdf",
+        chapters=[
+            Chapter(
+                chapter_num=n,
+                title=f"Chapter {n}",
+                start_page=1,
+                end_page=2,
+                content_blocks=[
+                    ContentBlock(block_type=BlockType.BODY, text=t, block_id=f"{book_id}_{n}_{i}")
+                    for i, t in enumerate(texts)
+                ],
+            )
+            for n, texts in enumerate(chapters, start=1)
+        ],
+    )
+
+
+def _hits(index: SearchIndex, query: str, book_id: str | None = None) -> list[tuple[str, int]]:
+    return [(index.block_ids[i], idx) for i, idx in index.scan(query, book_id)]
+
+
+class TestSearchIndex:
+    def test_case_insensitive_match_positions(self):
+        index = SearchIndex([_book("b", ["Hello World", "say hello"])])
+        assert _hits(index, "HELLO") == [("b_1_0", 0), ("b_1_1", 4)]
+
+    def test_casefold_match(self):
+        index = SearchIndex([_book("b", ["Die Straße", "strasse"])])
+        assert [h[0] for h in _hits(index, "STRASSE")] == ["b_1_0", "b_1_1"]
+
+    def test_offsets_index_original_text(self):
+        text = "Straße " * 20 + "needle"
+        index = SearchIndex([_book("b", [text, "ßx"])])
+        assert _hits(index, "needle") == [("b_1_0", text.index("needle"))]
+        # A match starting inside an expansion points at the expanded character
+        assert _hits(index, "sx") == [("b_1_1", 0)]
+
+    def test_one_hit_per_block(self):
+        index = SearchIndex([_book("b", ["ab ab ab", "xx ab"])])
+        assert _hits(index, "ab") == [("b_1_0", 0), ("b_1_1", 3)]
+
+    def test_match_never_spans_blocks(self):
+        index = SearchIndex([_book("b", ["foo", "bar"])])
+        assert _hits(index, "foobar") == []
+        assert _hits(index, "obar") == []
+
+    def test_order_follows_books_and_chapters(self):
+        index = SearchIndex([_book("a", ["x1"], ["x2"]), _book("b", ["x3"])])
+        assert [h[0] for h in _hits(index, "x")] == ["a_1_0", "a_2_0", "b_1_0"]
+
+    def test_book_filter(self):
+        index = SearchIndex([_book("a", ["python"]), _book("b", ["python", "more python"])])
+        assert [h[0] for h in _hits(index, "python", "b")] == ["b_1_0", "b_1_1"]
+        assert _hits(index, "python", "missing") == []
+
+    def test_empty_blocks_and_last_block(self):
+        index = SearchIndex([_book("b", ["", "", "tail"])])
+        assert _hits(index, "tail") == [("b_1_2", 0)]
+
+    def test_empty_query_and_empty_index(self):
+        assert _hits(SearchIndex([_book("b", ["text"])]), "") == []
+        assert _hits(SearchIndex([]), "text") == []
+        assert len(SearchIndex([])) == 0
+
+    def test_limit(self):
+        index = SearchIndex([_book("b", ["x", "x", "x"])])
+        assert len(index.scan("x", limit=2)) == 2
+        assert index.scan("x", limit=0) == []
+        assert len(index.scan("x")) == 3
+
+    def test_books_ruled_out_by_char_mask_are_skipped(self, monkeypatch):
+        index = SearchIndex([_book("a", ["plain text"]), _book("b", ["x + y"]), _book("c", ["x + z"])])
+        scanned = []
+        scan_corpus = index._scan_corpus
+
+        def spy(query, pos, end, limit):
+            scanned.append((pos, end))
+            return scan_corpus(query, pos, end, limit)
+
+        monkeypatch.setattr(index, "_scan_corpus", spy)
+        assert [h[0] for h in _hits(index, "+")] == ["b_1_0", "c_1_0"]
+        assert scanned == [index._book_spans["b"], index._book_spans["c"]]
+        assert _hits(index, "+", "a") == []
+        assert index.scan("+", limit=1) == index.scan("+")[:1]
+
+    def test_parallel_arrays(self):
+        index = SearchIndex([_book("a", ["One"], ["Two"])])
+        assert len(index) == 2
+        assert index.book_ids == ["a", "a"]
+        assert list(index.chapter_nums) == [1, 2]
+        assert index.chapter_titles == ["Chapter 1", "Chapter 2"]
+        assert index.texts == ["One", "Two"]
+        assert index.block_types == [BlockType.BODY, BlockType.BODY]
@@ -6,8 +6,12 @@ from __future__ import annotations
 import os
 from unittest.mock import patch
 
+import pytest
+
 from pylearn.executor.sandbox import (
+    _DANGER_PATTERNS,
     _SENSITIVE_ENV_VARS,
+    _leading_literal,
     check_dangerous_code,
     get_safe_env,
 )
@@ -197,6 +201,28 @@ class TestGetSafeEnv:
 # ---------------------------------------------------------------------------
 
 
+# One trigger per alternative of each _DANGER_PATTERNS entry, keyed by its warning
+_DANGER_SAMPLES = {
+    "os.system()": ["os.system('ls')"],
+    "os.remove()/unlink()": ["os.remove(p)", "os.unlink(p)"],
+    "shutil.rmtree()": ["shutil.rmtree(d)"],
+    "subprocess execution": ["subprocess.call(c)", "subprocess.run(c)", "subprocess.Popen(c)"],
+    "__import__()": ["__import__('os')"],
+    "os.rmdir()": ["os.rmdir(d)"],
+    "os.rename()": ["os.rename(a, b)"],
+    "file write via open()": ["open(p, 'w')"],
+    "Path.unlink()": ["pathlib.Path(p).unlink()", "Path(p).unlink()"],
+    "socket (network access)": ["import socket"],
+    "HTTP network access": ["import http.client", "import urllib.request"],
+    "eval()": ["eval(s)"],
+    "exec()": ["exec(s)"],
+    "ctypes (native code access)": ["import ctypes"],
+    "importlib (dynamic import)": ["import importlib"],
+    "getattr() (attribute access bypass)": ["getattr(o, n)"],
+    "__builtins__ (builtin access)": ["__builtins__"],
+}
+
+
 class TestCheckDangerousCode:
     """Test the advisory danger-pattern scanner."""
 
@@ -321,6 +347,23 @@ class TestCheckDangerousCode:
         warnings = check_dangerous_code("os.rename('/a', '/b')")
         assert any("rename" in w for w in warnings)
 
+    # --- Every pattern ---
+
+    def test_every_pattern_has_samples(self):
+        assert sorted(_DANGER_SAMPLES) == sorted(desc for _pat, desc in _DANGER_PATTERNS)
+
+    @pytest.mark.parametrize(("desc", "code"), [(d, c) for d, codes in _DANGER_SAMPLES.items() for c in codes])
+    def test_each_pattern_reported(self, desc, code):
+        """Each trigger gets past the literal prefilter and the first-character class."""
+        assert desc in check_dangerous_code(code)
+        assert desc in check_dangerous_code(f"x = 1\n{code}  # at the end of longer code")
+
+    def test_pattern_without_leading_literal_rejected(self):
+        assert _leading_literal(r"\bos\.system\b") == "os.system"
+        assert _leading_literal("colou?r") == "colo"
+        with pytest.raises(ValueError):
+            _leading_literal(r"\s*eval")
+
     # --- Multiple patterns ---
 
     def test_multiple_dangerous_patterns(self):
@@ -1,6 +1,7 @@
 """Tests for text utility functions."""
 
 from pylearn.utils.text_utils import (
+    classify_and_strip_repl,
     clean_code_text,
     clean_text,
     detect_repl_code,
@@ -37,6 +38,16 @@ class TestCleanText:
     def test_passthrough(self):
         assert clean_text("normal text") == "normal text"
 
+    def test_ascii_returned_as_is(self):
+        text = "def f(x):\n    return x  # done"
+        assert clean_text(text) is text
+
+    def test_non_ascii_without_fixes_unchanged(self):
+        assert clean_text("café → naïve") == "café → naïve"
+
+    def test_mixed_fixes_after_normalization(self):
+        assert clean_text("caf\u00e9 \u201cq\u201d\u2014x") == 'café "q"--x'
+
 
 class TestCleanCodeText:
     def test_strips_page_numbers(self):
@@ -89,6 +100,12 @@ class TestIsPageHeaderOrFooter:
 
     def test_url(self):
         assert is_page_header_or_footer("www.oreilly.com") is True
+        assert is_page_header_or_footer("WWW.OReilly.com") is True
+
+    def test_case_sensitivity_per_pattern(self):
+        assert is_page_header_or_footer("chapter five") is True
+        # The pipe-separated form only matches a capitalised Chapter/Part
+        assert is_page_header_or_footer("123 | chapter 5: Functions") is False
 
     def test_normal_text(self):
         assert is_page_header_or_footer("Python is a programming language") is False
@@ -137,3 +154,29 @@ class TestStripReplPrompts:
         result = strip_repl_prompts(code)
         # No prompt lines → no code lines in output
         assert result == ""
+
+
+class TestClassifyAndStripRepl:
+    def test_repl_is_stripped(self):
+        code = ">>> for i in range(3):\n...     print(i)\n0\n1\n2"
+        assert classify_and_strip_repl(code) == (True, "for i in range(3):\n    print(i)")
+
+    def test_plain_code_returned_unchanged(self):
+        code = "x = 1\nprint(x)\n"
+        assert classify_and_strip_repl(code) == (False, code)
+
+    def test_empty(self):
+        assert classify_and_strip_repl("  ") == (False, "  ")
+
+    def test_matches_separate_calls(self):
+        samples = [
+            ">>> x = 1\n>>> print(x)\n1",
+            ">>>\n>>> x = 1",
+            ">>> a\nb\nc\nd\ne",
+            ">>> a\nb\nc\nd\ne\nf",
+            "x = 1",
+        ]
+        for code in samples:
+            is_repl = detect_repl_code(code)
+            expected = strip_repl_prompts(code) if is_repl else code
+            assert classify_and_strip_repl(code) == (is_repl, expected)
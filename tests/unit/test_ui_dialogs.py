@@ -11,7 +11,7 @@ from __future__ import annotations
 from unittest.mock import patch
 
 import pytest
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QObject, Qt
 from PyQt6.QtWidgets import QMessageBox
 
 from pylearn.core.database import Database
@@ -79,20 +79,29 @@ class TestNotesDialogConstruction:
         dialog = NotesDialog(db)
         qtbot.addWidget(dialog)
         assert dialog.windowTitle() == "Notes"
-        assert dialog._tree.topLevelItemCount() == 0
+        assert dialog._model.rowCount() == 0
+
+    def test_model_parent_needs_an_index(self, qtbot, db):
+        """NotesModel.parent() doesn't silently stand in for QObject.parent()."""
+        dialog = NotesDialog(db)
+        qtbot.addWidget(dialog)
+        assert not dialog._model.parent(dialog._model.index(0, 0)).isValid()
+        assert QObject.parent(dialog._model) is dialog
+        with pytest.raises(TypeError):
+            dialog._model.parent()
 
     def test_construct_with_book_filter(self, qtbot, seeded_db):
         """Dialog filtered to a single book should only show that book's notes."""
         dialog = NotesDialog(seeded_db, book_id="b1")
         qtbot.addWidget(dialog)
         # b1 has 3 notes total (ch1: 2, ch2: 1)
-        assert dialog._tree.topLevelItemCount() == 3
+        assert dialog._model.rowCount() == 3
 
     def test_construct_with_book_and_chapter_filter(self, qtbot, seeded_db):
         """Dialog filtered to book + chapter should show only that chapter's notes."""
         dialog = NotesDialog(seeded_db, book_id="b1", chapter_num=1)
         qtbot.addWidget(dialog)
-        assert dialog._tree.topLevelItemCount() == 2
+        assert dialog._model.rowCount() == 2
 
     def test_construct_with_section_title(self, qtbot, seeded_db):
         """Section title is stored for use when creating new notes."""
@@ -109,7 +118,7 @@ class TestNotesDialogConstruction:
 
 
 class TestNotesDialogDataLoading:
-    """Test that notes data loads correctly into the tree widget."""
+    """Test that notes data loads correctly into the notes model."""
 
     def test_note_tree_shows_section_titles(self, qtbot, seeded_db):
         """Tree items should display section titles in column 0."""
@@ -117,9 +126,9 @@ class TestNotesDialogDataLoading:
         qtbot.addWidget(dialog)
 
         sections = set()
-        for i in range(dialog._tree.topLevelItemCount()):
-            item = dialog._tree.topLevelItem(i)
-            sections.add(item.text(0))
+        for i in range(dialog._model.rowCount()):
+            item = dialog._model.index(i, 0)
+            sections.add(item.data())
         assert "Installation" in sections
         assert "Setup" in sections
 
@@ -129,9 +138,9 @@ class TestNotesDialogDataLoading:
         qtbot.addWidget(dialog)
 
         previews = []
-        for i in range(dialog._tree.topLevelItemCount()):
-            item = dialog._tree.topLevelItem(i)
-            previews.append(item.text(1))
+        for i in range(dialog._model.rowCount()):
+            item = dialog._model.index(i, 0)
+            previews.append(item.siblingAtColumn(1).data())
         # At least one preview should contain text from the note content
         assert any("Install" in p or "Create" in p or "virtual" in p for p in previews)
 
@@ -140,8 +149,8 @@ class TestNotesDialogDataLoading:
         dialog = NotesDialog(seeded_db, book_id="b1", chapter_num=1)
         qtbot.addWidget(dialog)
 
-        item = dialog._tree.topLevelItem(0)
-        note_data = item.data(0, Qt.ItemDataRole.UserRole)
+        item = dialog._model.index(0, 0)
+        note_data = item.data(Qt.ItemDataRole.UserRole)
         assert isinstance(note_data, dict)
         assert "note_id" in note_data
         assert "content" in note_data
@@ -156,8 +165,8 @@ class TestNotesDialogDataLoading:
         dialog = NotesDialog(db, book_id="b1", chapter_num=1)
         qtbot.addWidget(dialog)
 
-        item = dialog._tree.topLevelItem(0)
-        preview = item.text(1)
+        item = dialog._model.index(0, 0)
+        preview = item.siblingAtColumn(1).data()
         assert len(preview) == 50
 
     def test_preview_replaces_newlines(self, qtbot, db):
@@ -168,11 +177,54 @@ class TestNotesDialogDataLoading:
         dialog = NotesDialog(db, book_id="b1", chapter_num=1)
         qtbot.addWidget(dialog)
 
-        item = dialog._tree.topLevelItem(0)
-        preview = item.text(1)
+        item = dialog._model.index(0, 0)
+        preview = item.siblingAtColumn(1).data()
         assert "\n" not in preview
         assert "Line one Line two" in preview
 
+    def test_preview_replaces_tabs_and_carriage_returns(self, qtbot, db):
+        """Tabs and carriage returns are flattened to spaces in the preview."""
+        db.upsert_book("b1", "Book", "/b.pdf", 100, 1)
+        db.add_note("b1", 1, "Mixed", "a\tb\r\nc")
+
+        dialog = NotesDialog(db, book_id="b1", chapter_num=1)
+        qtbot.addWidget(dialog)
+
+        assert dialog._model.index(0, 1).data() == "a b  c"
+
+    def test_section_titles_shared_and_defaulted(self, qtbot, db):
+        """Repeated section titles share one string; empty ones show "General"."""
+        db.upsert_book("b1", "Book", "/b.pdf", 100, 1)
+        db.add_note("b1", 1, "Intro", "one")
+        db.add_note("b1", 1, "Intro", "two")
+        db.add_note("b1", 1, "", "three")
+
+        dialog = NotesDialog(db, book_id="b1", chapter_num=1)
+        qtbot.addWidget(dialog)
+
+        titles = [dialog._model.index(i, 0).data() for i in range(dialog._model.rowCount())]
+        assert sorted(titles) == ["General", "Intro", "Intro"]
+        # Compare the stored dicts: Qt hands back a fresh str from data()
+        notes = [dialog._model.note(i) for i in range(dialog._model.rowCount())]
+        intro = [n["section_title"] for n in notes if n["section_title"] == "Intro"]
+        assert intro[0] is intro[1]
+
+    def test_notes_load_in_pages(self, qtbot, db):
+        """Only the first page is loaded up front; the rest load on demand."""
+        from pylearn.ui.notes_dialog import _NOTES_PAGE_SIZE
+
+        db.upsert_book("b1", "Book", "/b.pdf", 100, 1)
+        for i in range(_NOTES_PAGE_SIZE + 5):
+            db.add_note("b1", 1, "S", f"Note {i}")
+
+        dialog = NotesDialog(db, book_id="b1", chapter_num=1)
+        qtbot.addWidget(dialog)
+        assert dialog._model.rowCount() == _NOTES_PAGE_SIZE
+
+        dialog._model.fetchMore()
+        assert dialog._model.rowCount() == _NOTES_PAGE_SIZE + 5
+        assert not dialog._model.canFetchMore()
+
 
 class TestNotesDialogNoteSelection:
     """Test clicking a note in the tree loads it into the editor."""
@@ -182,11 +234,11 @@ class TestNotesDialogNoteSelection:
         dialog = NotesDialog(seeded_db, book_id="b1", chapter_num=1)
         qtbot.addWidget(dialog)
 
-        item = dialog._tree.topLevelItem(0)
-        note_data = item.data(0, Qt.ItemDataRole.UserRole)
+        item = dialog._model.index(0, 0)
+        note_data = item.data(Qt.ItemDataRole.UserRole)
 
         # Simulate the click handler directly
-        dialog._on_note_selected(item, 0)
+        dialog._on_note_selected(item)
 
         assert dialog._current_note_id == note_data["note_id"]
         assert dialog._editor.toPlainText() == note_data["content"]
@@ -216,8 +268,8 @@ class TestNotesDialogSave:
         qtbot.addWidget(dialog)
 
         # Select the first note
-        item = dialog._tree.topLevelItem(0)
-        dialog._on_note_selected(item, 0)
+        item = dialog._model.index(0, 0)
+        dialog._on_note_selected(item)
         note_id = dialog._current_note_id
 
         # Modify and save
@@ -248,13 +300,13 @@ class TestNotesDialogSave:
         """After saving, the tree should reload and reflect the new data."""
         dialog = NotesDialog(seeded_db, book_id="b1", chapter_num=1)
         qtbot.addWidget(dialog)
-        initial_count = dialog._tree.topLevelItemCount()
+        initial_count = dialog._model.rowCount()
 
         dialog._new_note()
         dialog._editor.setText("Another note for testing")
         dialog._save_note()
 
-        assert dialog._tree.topLevelItemCount() == initial_count + 1
+        assert dialog._model.rowCount() == initial_count + 1
 
     def test_save_without_book_id_does_nothing(self, qtbot, db):
         """When book_id is None, saving a new note should not crash."""
@@ -278,8 +330,8 @@ class TestNotesDialogNewNote:
         qtbot.addWidget(dialog)
 
         # First select a note
-        item = dialog._tree.topLevelItem(0)
-        dialog._on_note_selected(item, 0)
+        item = dialog._model.index(0, 0)
+        dialog._on_note_selected(item)
         assert dialog._current_note_id is not None
 
         # Now create a new note
@@ -304,11 +356,11 @@ class TestNotesDialogDelete:
         """Confirming delete should remove the note from the database."""
         dialog = NotesDialog(seeded_db, book_id="b1", chapter_num=1)
         qtbot.addWidget(dialog)
-        initial_count = dialog._tree.topLevelItemCount()
+        initial_count = dialog._model.rowCount()
 
         # Select first note
-        item = dialog._tree.topLevelItem(0)
-        dialog._on_note_selected(item, 0)
+        item = dialog._model.index(0, 0)
+        dialog._on_note_selected(item)
         deleted_id = dialog._current_note_id
 
         # Delete it
@@ -317,7 +369,7 @@ class TestNotesDialogDelete:
         # Verify removal
         assert dialog._current_note_id is None
         assert dialog._editor.toPlainText() == ""
-        assert dialog._tree.topLevelItemCount() == initial_count - 1
+        assert dialog._model.rowCount() == initial_count - 1
 
         # Verify in database
         notes = seeded_db.get_notes("b1", 1)
@@ -328,15 +380,15 @@ class TestNotesDialogDelete:
         """Cancelling delete should keep the note in the database."""
         dialog = NotesDialog(seeded_db, book_id="b1", chapter_num=1)
         qtbot.addWidget(dialog)
-        initial_count = dialog._tree.topLevelItemCount()
+        initial_count = dialog._model.rowCount()
 
-        item = dialog._tree.topLevelItem(0)
-        dialog._on_note_selected(item, 0)
+        item = dialog._model.index(0, 0)
+        dialog._on_note_selected(item)
 
         dialog._delete_note()
 
         # Nothing changed
-        assert dialog._tree.topLevelItemCount() == initial_count
+        assert dialog._model.rowCount() == initial_count
 
 
 # ===========================================================================
@@ -603,107 +655,106 @@ class TestProgressDialogContent:
                     break
         assert found_placeholder
 
-    def test_books_create_group_boxes(self, qtbot, seeded_db):
-        """Each registered book should produce a QGroupBox in the layout."""
+    def test_books_create_model_rows(self, qtbot, seeded_db):
+        """Each registered book should produce one row in the progress model."""
         dialog = ProgressDialog(seeded_db)
         qtbot.addWidget(dialog)
 
-        from PyQt6.QtWidgets import QGroupBox
-
-        group_boxes = dialog.findChildren(QGroupBox)
         # seeded_db has 2 books
-        assert len(group_boxes) == 2
+        assert dialog._model.rowCount() == 2
 
-    def test_group_box_titles_match_books(self, qtbot, seeded_db):
-        """Group box titles should match the book titles from the database."""
+    def test_row_titles_match_books(self, qtbot, seeded_db):
+        """Row titles should match the book titles from the database."""
         dialog = ProgressDialog(seeded_db)
         qtbot.addWidget(dialog)
 
-        from PyQt6.QtWidgets import QGroupBox
-
-        group_boxes = dialog.findChildren(QGroupBox)
-        titles = {gb.title() for gb in group_boxes}
+        titles = {dialog._model.index(i).data() for i in range(dialog._model.rowCount())}
         assert "Learning Python" in titles
         assert "Fluent Python" in titles
 
-    def test_progress_bars_exist(self, qtbot, seeded_db):
-        """Each book group should contain a progress bar."""
+    def test_no_per_book_widgets(self, qtbot, seeded_db):
+        """Book rows are painted by the delegate, not built from child widgets."""
         dialog = ProgressDialog(seeded_db)
         qtbot.addWidget(dialog)
 
-        from PyQt6.QtWidgets import QProgressBar
+        from PyQt6.QtWidgets import QGroupBox, QProgressBar
 
-        progress_bars = dialog.findChildren(QProgressBar)
-        assert len(progress_bars) == 2
+        assert dialog.findChildren(QGroupBox) == []
+        assert dialog.findChildren(QProgressBar) == []
 
-    def test_progress_bar_value_reflects_completion(self, qtbot, seeded_db):
-        """Progress bar values should match the completion stats from the database."""
+    def test_grade_reflects_completion(self, qtbot, seeded_db):
+        """Row grades should match the completion stats from the database."""
         dialog = ProgressDialog(seeded_db)
         qtbot.addWidget(dialog)
 
-        from PyQt6.QtWidgets import QProgressBar
-
-        progress_bars = dialog.findChildren(QProgressBar)
-        values = {pb.value() for pb in progress_bars}
+        grades = {row["title"]: row["grade"] for row in _progress_rows(dialog)}
 
         # b1: 1 of 3 completed = 33%, b2: 0 of 2 completed = 0%
-        assert 33 in values
-        assert 0 in values
+        assert grades["Learning Python"] == 33
+        assert grades["Fluent Python"] == 0
 
-    def test_completion_labels_present(self, qtbot, seeded_db):
-        """Labels showing chapter completion info should exist."""
+    def test_completion_lines_present(self, qtbot, seeded_db):
+        """Lines showing chapter completion info should exist."""
         dialog = ProgressDialog(seeded_db)
         qtbot.addWidget(dialog)
 
-        from PyQt6.QtWidgets import QLabel
-
-        labels = dialog.findChildren(QLabel)
-        label_texts = [lbl.text() for lbl in labels]
+        texts = _progress_line_texts(dialog)
 
         # b1 has 1 completed, 1 in progress — shown in "Chapters: X done, Y in progress" format
-        assert any("1 done" in t for t in label_texts)
+        assert any("1 done" in t for t in texts)
         # b2 has 0 completed, 0 in progress
-        assert any("0 done" in t for t in label_texts)
+        assert any("0 done" in t for t in texts)
 
-    def test_in_progress_label_present(self, qtbot, seeded_db):
+    def test_in_progress_line_present(self, qtbot, seeded_db):
         """In Progress count should be shown."""
         dialog = ProgressDialog(seeded_db)
         qtbot.addWidget(dialog)
 
-        from PyQt6.QtWidgets import QLabel
-
-        labels = dialog.findChildren(QLabel)
-        label_texts = [lbl.text() for lbl in labels]
-
         # b1 has 1 in_progress chapter — shown in "Chapters: X done, Y in progress" format
-        assert any("1 in progress" in t for t in label_texts)
+        assert any("1 in progress" in t for t in _progress_line_texts(dialog))
 
     def test_exercise_stats_shown(self, qtbot, seeded_db):
         """Exercise completion stats should be displayed for books with exercises."""
         dialog = ProgressDialog(seeded_db)
         qtbot.addWidget(dialog)
 
-        from PyQt6.QtWidgets import QLabel
-
-        labels = dialog.findChildren(QLabel)
-        label_texts = [lbl.text() for lbl in labels]
-
         # b1 has 3 exercises, 1 completed
-        assert any("1 / 3" in t and "Exercises" in t for t in label_texts)
+        assert any("1 / 3" in t and "Exercises" in t for t in _progress_line_texts(dialog))
 
     def test_no_exercise_stats_when_none_exist(self, qtbot, db):
-        """Books with no exercises should not show exercise labels."""
+        """Books with no exercises should not show exercise lines."""
         db.upsert_book("b1", "Book", "/b.pdf", 100, 1)
         db.upsert_chapter("b1", 1, "Ch1", 1, 100)
 
         dialog = ProgressDialog(db)
         qtbot.addWidget(dialog)
 
-        from PyQt6.QtWidgets import QLabel
+        assert not any("Exercises" in t for t in _progress_line_texts(dialog))
+
+    def test_row_size_hint_grows_with_lines(self, qtbot, seeded_db):
+        """Rows with more stat lines should be taller."""
+        dialog = ProgressDialog(seeded_db)
+        qtbot.addWidget(dialog)
+
+        from PyQt6.QtWidgets import QStyleOptionViewItem
+
+        option = QStyleOptionViewItem()
+        option.initFrom(dialog._view)
+        delegate = dialog._view.itemDelegate()
+        rows = _progress_rows(dialog)
+        heights = {
+            len(row["lines"]): delegate.sizeHint(option, dialog._model.index(i)).height() for i, row in enumerate(rows)
+        }
+        assert heights[max(heights)] >= heights[min(heights)]
+
+
+def _progress_rows(dialog: ProgressDialog) -> list[dict]:
+    model = dialog._model
+    return [model.index(i).data(Qt.ItemDataRole.UserRole) for i in range(model.rowCount())]
+
 
-        labels = dialog.findChildren(QLabel)
-        label_texts = [lbl.text() for lbl in labels]
-        assert not any("Exercises" in t for t in label_texts)
+def _progress_line_texts(dialog: ProgressDialog) -> list[str]:
+    return [text for row in _progress_rows(dialog) for text, _ in row["lines"]]
 
 
 # ===========================================================================
@@ -0,0 +1,245 @@
+"""Tests for ReaderPanel — chapter display and find-in-chapter."""
+
+from __future__ import annotations
+
+from pylearn.core.models import BlockType, ContentBlock
+
+
+def _panel(qtbot, *texts: str):
+    from pylearn.ui.reader_panel import ReaderPanel
+
+    panel = ReaderPanel()
+    qtbot.addWidget(panel)
+    panel.display_blocks([ContentBlock(block_type=BlockType.BODY, text=t) for t in texts])
+    return panel
+
+
+def _selection(panel) -> tuple[int, str]:
+    cursor = panel._browser.textCursor()
+    return cursor.selectionStart(), cursor.selectedText()
+
+
+class TestFindInChapter:
+    def test_next_steps_through_matches_and_wraps(self, qtbot):
+        panel = _panel(qtbot, "spam eggs", "more Spam", "spam")
+        starts = []
+        for _ in range(4):
+            panel._find_next("spam", False)
+            starts.append(_selection(panel))
+        assert [text for _, text in starts] == ["spam", "Spam", "spam", "spam"]
+        assert starts[3][0] == starts[0][0]  # wrapped to the first match
+        assert panel._find_bar._status.text() == "1 / 3"
+
+    def test_prev_wraps_to_last_match(self, qtbot):
+        panel = _panel(qtbot, "one x", "two x", "three x")
+        panel._find_prev("x", False)
+        last = _selection(panel)[0]
+        panel._find_prev("x", False)
+        assert _selection(panel)[0] < last
+        panel._find_next("x", False)
+        assert _selection(panel)[0] == last
+
+    def test_status_counts_matches(self, qtbot):
+        panel = _panel(qtbot, "x", "x", "x")
+        panel._find_next("x", False)
+        panel._find_next("x", False)
+        assert panel._find_bar._status.text() == "2 / 3"
+        panel._find_prev("x", False)
+        panel._find_prev("x", False)
+        assert panel._find_bar._status.text() == "3 / 3"
+
+    def test_next_follows_cursor_moved_by_user(self, qtbot):
+        panel = _panel(qtbot, "x one", "x two", "x three")
+        panel._find_next("x", False)
+        cursor = panel._browser.textCursor()
+        cursor.setPosition(panel._find_matches[1] + 1)
+        panel._browser.setTextCursor(cursor)
+        panel._find_next("x", False)
+        assert _selection(panel)[0] == panel._find_matches[2]
+
+    def test_case_sensitive(self, qtbot):
+        panel = _panel(qtbot, "Spam spam")
+        panel._find_next("spam", True)
+        assert _selection(panel)[1] == "spam"
+        assert _selection(panel)[0] > 0
+
+    def test_not_found(self, qtbot):
+        panel = _panel(qtbot, "nothing here")
+        panel._find_next("missing", False)
+        assert panel._find_bar._status.text() == "Not found"
+        assert _selection(panel)[1] == ""
+
+    def test_extended_query_keeps_current_match(self, qtbot):
+        panel = _panel(qtbot, "print(x)", "prints")
+        panel._find_next("pri", False)
+        first = _selection(panel)[0]
+        panel._find_next("prin", False)
+        assert _selection(panel) == (first, "prin")
+
+    def test_positions_reused_until_document_changes(self, qtbot):
+        panel = _panel(qtbot, "a b a")
+        panel._find_next("a", False)
+        matches = panel._find_matches
+        panel._find_next("a", False)
+        assert panel._find_matches is matches
+        panel.display_blocks([ContentBlock(block_type=BlockType.BODY, text="new a")])
+        assert panel._find_key is None
+        panel._find_next("a", False)
+        assert panel._find_matches is not matches
+
+    def test_document_text_shared_across_queries(self, qtbot):
+        panel = _panel(qtbot, "spam and eggs")
+        panel._find_next("sp", False)
+        haystack = panel._find_haystacks[False]
+        panel._find_next("spa", False)
+        assert panel._find_haystacks[False] is haystack
+        panel.display_blocks([ContentBlock(block_type=BlockType.BODY, text="ham")])
+        assert panel._find_haystacks == {}
+        panel._find_next("ham", False)
+        assert _selection(panel)[1] == "ham"
+
+
+class TestFindBarThrottle:
+    def test_burst_of_keystrokes_searches_latest_text(self, qtbot):
+        from pylearn.ui.reader_panel import FindBar
+
+        bar = FindBar()
+        qtbot.addWidget(bar)
+        searches = []
+        bar.find_next.connect(lambda text, _case: searches.append(text))
+
+        for text in ("p", "py", "pyt"):
+            bar._input.setText(text)
+        assert searches == []
+        assert bar._find_timer.isActive()
+
+        bar._fire_find()
+        assert searches == ["pyt"]
+        bar._input.setText("pyth")
+        assert bar._find_timer.isActive()  # still ticking; no restart per keystroke
+        bar._fire_find()
+        assert searches == ["pyt", "pyth"]
+
+        bar._fire_find()  # no new text since the last tick
+        assert searches == ["pyt", "pyth"]
+        assert not bar._find_timer.isActive()
+
+    def test_enter_cancels_pending_search(self, qtbot):
+        from pylearn.ui.reader_panel import FindBar
+
+        bar = FindBar()
+        qtbot.addWidget(bar)
+        searches = []
+        bar.find_next.connect(lambda text, _case: searches.append(text))
+
+        bar._input.setText("spam")
+        bar._on_next()
+        assert searches == ["spam"]
+        assert not bar._find_timer.isActive()
+        bar._fire_find()
+        assert searches == ["spam"]
+
+
+def _pixel_sizes(panel) -> list[tuple[str, int]]:
+    from PyQt6.QtGui import QTextFormat
+
+    sizes = []
+    block = panel._browser.document().begin()
+    while block.isValid():
+        it = block.begin()
+        while not it.atEnd():
+            fragment = it.fragment()
+            sizes.append((fragment.text(), fragment.charFormat().intProperty(QTextFormat.Property.FontPixelSize)))
+            it += 1
+        block = block.next()
+    return sizes
+
+
+_MIXED_BLOCKS = (
+    ContentBlock(block_type=BlockType.HEADING1, text="Title", block_id="h1_0"),
+    ContentBlock(block_type=BlockType.BODY, text="Body text"),
+    ContentBlock(block_type=BlockType.CODE, text="print(1)", block_id="code_0"),
+    ContentBlock(block_type=BlockType.HEADING2, text="Section", block_id="h2_0"),
+)
+
+
+class TestFontSize:
+    def test_resize_matches_fresh_display(self, qtbot):
+        from pylearn.ui.reader_panel import ReaderPanel
+
+        panel = ReaderPanel()
+        qtbot.addWidget(panel)
+        panel.set_font_size(16)
+        panel.display_blocks(list(_MIXED_BLOCKS))
+        panel.set_font_size(20)
+
+        fresh = ReaderPanel()
+        qtbot.addWidget(fresh)
+        fresh.set_font_size(20)
+        fresh.display_blocks(list(_MIXED_BLOCKS))
+        assert _pixel_sizes(panel) == _pixel_sizes(fresh)
+
+    def test_resize_does_not_reparse(self, qtbot, monkeypatch):
+        from pylearn.ui.reader_panel import ReaderPanel
+
+        panel = ReaderPanel()
+        qtbot.addWidget(panel)
+        panel.set_font_size(16)
+        panel.display_blocks(list(_MIXED_BLOCKS))
+        calls = []
+        monkeypatch.setattr(panel._browser, "setHtml", calls.append)
+        panel.set_font_size(18)
+        assert calls == []
+
+
+class TestVisibleHeading:
+    def _panel(self, qtbot, heading_y: list[float]):
+        panel = _panel(qtbot, "text")
+        panel._heading_y = heading_y
+        panel._heading_block_idx = [i * 2 for i in range(len(heading_y))]
+        return panel
+
+    def test_emits_last_heading_above_viewport_top(self, qtbot):
+        panel = self._panel(qtbot, [0.0, 20.0, 400.0])
+        with qtbot.waitSignal(panel.visible_heading_changed) as blocker:
+            panel._update_visible_heading()
+        assert blocker.args == [2]  # heading at y=20 is within the 30px offset
+
+    def test_nothing_emitted_above_first_heading(self, qtbot):
+        panel = self._panel(qtbot, [200.0, 400.0])
+        with qtbot.assertNotEmitted(panel.visible_heading_changed):
+            panel._update_visible_heading()
+
+    def test_same_heading_not_reemitted(self, qtbot):
+        panel = self._panel(qtbot, [0.0, 400.0])
+        panel._update_visible_heading()
+        with qtbot.assertNotEmitted(panel.visible_heading_changed):
+            panel._update_visible_heading()
+
+
+class TestScrollRestore:
+    def test_theme_change_returns_to_visible_heading(self, qtbot, monkeypatch):
+        from pylearn.ui.reader_panel import ReaderPanel
+
+        panel = ReaderPanel()
+        qtbot.addWidget(panel)
+        panel.set_theme("light")
+        panel.display_blocks(list(_MIXED_BLOCKS))
+        panel._last_heading_index = 3  # "Section" is at the top of the viewport
+        anchors = []
+        monkeypatch.setattr(panel._browser, "scrollToAnchor", anchors.append)
+        panel.set_theme("dark")
+        assert anchors == ["h2_0"]
+
+    def test_font_resize_returns_to_visible_heading(self, qtbot, monkeypatch):
+        from pylearn.ui.reader_panel import ReaderPanel
+
+        panel = ReaderPanel()
+        qtbot.addWidget(panel)
+        panel.set_font_size(16)
+        panel.display_blocks(list(_MIXED_BLOCKS))
+        panel._last_heading_index = 0
+        anchors = []
+        monkeypatch.setattr(panel._browser, "scrollToAnchor", anchors.append)
+        panel.set_font_size(20)
+        assert anchors == ["h1_0"]
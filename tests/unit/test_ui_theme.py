@@ -6,6 +6,9 @@ QSS generation tests verify correct color substitution.
 
 from __future__ import annotations
 
+import re
+import sys
+
 import pytest
 
 from pylearn.ui.styles import _generate_qss, get_stylesheet
@@ -37,6 +40,8 @@ class TestThemePalette:
         required = [
             "bg",
             "bg_alt",
+            "bar_bg",
+            "input_bg",
             "text",
             "text_muted",
             "border",
@@ -53,6 +58,10 @@ class TestThemePalette:
                 val = getattr(palette, field)
                 assert val, f"{name}.{field} is empty"
 
+    def test_palette_colors_are_interned(self):
+        assert LIGHT.bg is sys.intern("#ffffff")
+        assert DARK.code_border is DARK.border
+
     def test_palettes_dict_complete(self):
         assert set(PALETTES.keys()) == {"light", "dark", "sepia"}
 
@@ -113,13 +122,27 @@ class TestQSSGeneration:
         qss = get_stylesheet("unknown")
         assert LIGHT.bg in qss
 
+    def test_themes_differ_only_in_color_values(self):
+        def skeleton(qss: str) -> str:
+            return re.sub(r"#[0-9a-fA-F]{6}", "#", qss)
+
+        assert (
+            skeleton(get_stylesheet("light")) == skeleton(get_stylesheet("dark")) == skeleton(get_stylesheet("sepia"))
+        )
+
+    def test_get_stylesheet_reuses_generated_string(self):
+        assert get_stylesheet("dark") is get_stylesheet("dark")
+
     def test_light_menu_uses_bg(self):
-        """Light theme menubar uses bg (not bg_alt) — special case in code."""
+        """Light theme bars use bg (not bg_alt)."""
+        assert LIGHT.bar_bg == LIGHT.bg
+        assert LIGHT.input_bg == LIGHT.bg
         qss = _generate_qss(LIGHT)
         # The menubar background line should contain LIGHT.bg
         assert f"background-color: {LIGHT.bg}" in qss
 
     def test_dark_menu_uses_bg_alt(self):
-        """Dark theme menubar uses bg_alt — special case in code."""
+        """Dark theme bars use bg_alt."""
+        assert DARK.bar_bg == DARK.bg_alt
         qss = _generate_qss(DARK)
         assert f"background-color: {DARK.bg_alt}" in qss
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from pylearn.core.constants import STATUS_COMPLETED, STATUS_IN_PROGRESS, STATUS_NOT_STARTED
 from pylearn.core.models import Chapter, Section
 
@@ -97,6 +99,39 @@ class TestTOCPanel:
         section_item = item.child(0)
         assert section_item.childCount() == 1
 
+    def test_nested_sections_keep_order(self, qtbot):
+        from pylearn.ui.toc_panel import TOCPanel
+
+        panel = TOCPanel()
+        qtbot.addWidget(panel)
+        chapters = [
+            Chapter(
+                chapter_num=1,
+                title="Intro",
+                start_page=1,
+                end_page=20,
+                sections=[
+                    Section(
+                        title="A",
+                        level=2,
+                        page_num=1,
+                        block_index=0,
+                        children=[
+                            Section(title="A.1", level=3, page_num=1, block_index=1),
+                            Section(title="A.2", level=3, page_num=2, block_index=2),
+                        ],
+                    ),
+                    Section(title="B", level=2, page_num=3, block_index=3),
+                ],
+            ),
+        ]
+        panel.load_chapters(chapters)
+        item = panel.topLevelItem(0)
+        assert [item.child(i).text(0) for i in range(item.childCount())] == ["A", "B"]
+        section_a = item.child(0)
+        assert [section_a.child(i).text(0) for i in range(section_a.childCount())] == ["A.1", "A.2"]
+        assert panel._item_payload[id(section_a.child(1))] == ("section", 1, 2)
+
     def test_update_chapter_status(self, qtbot):
         from pylearn.ui.toc_panel import TOCPanel
 
@@ -109,6 +144,17 @@ class TestTOCPanel:
         item = panel.topLevelItem(0)
         assert "[done]" in item.text(0)
 
+    def test_update_with_same_status_leaves_item_untouched(self, qtbot, monkeypatch):
+        from pylearn.ui.toc_panel import TOCPanel
+
+        panel = TOCPanel()
+        qtbot.addWidget(panel)
+        panel.load_chapters([Chapter(chapter_num=1, title="Intro", start_page=1, end_page=20)], {1: STATUS_COMPLETED})
+
+        item = panel.topLevelItem(0)
+        monkeypatch.setattr(item, "setText", lambda *args: pytest.fail("setText called"))
+        panel.update_chapter_status(1, STATUS_COMPLETED)
+
     def test_update_nonexistent_chapter_is_noop(self, qtbot):
         from pylearn.ui.toc_panel import TOCPanel
 
@@ -144,6 +190,22 @@ class TestTOCPanel:
         panel._on_item_clicked(item, 0)
         assert signals == [1]
 
+    def test_mouse_click_navigates(self, qtbot):
+        from PyQt6.QtCore import Qt
+
+        from pylearn.ui.toc_panel import TOCPanel
+
+        panel = TOCPanel()
+        qtbot.addWidget(panel)
+        panel.show()
+        panel.load_chapters([Chapter(chapter_num=3, title="Intro", start_page=1, end_page=20)])
+
+        signals = []
+        panel.chapter_selected.connect(signals.append)
+        rect = panel.visualItemRect(panel.topLevelItem(0))
+        qtbot.mouseClick(panel.viewport(), Qt.MouseButton.LeftButton, pos=rect.center())
+        assert signals == [3]
+
     def test_section_selected_signal(self, qtbot):
         from pylearn.ui.toc_panel import TOCPanel
 
@@ -209,6 +271,16 @@ class TestTOCPanel:
         panel.load_chapters(chapters2)
         assert panel.topLevelItemCount() == 2
 
+    def test_load_chapters_restores_updates_and_signals(self, qtbot):
+        from pylearn.ui.toc_panel import TOCPanel
+
+        panel = TOCPanel()
+        qtbot.addWidget(panel)
+        panel.load_chapters([Chapter(chapter_num=1, title="Intro", start_page=1, end_page=20)])
+        assert panel.updatesEnabled()
+        assert not panel.signalsBlocked()
+        assert panel._chapter_items[1] is panel.topLevelItem(0)
+
     def test_in_progress_chapter_is_bold(self, qtbot):
         from pylearn.ui.toc_panel import TOCPanel
 
@@ -220,6 +292,9 @@ class TestTOCPanel:
         item = panel.topLevelItem(0)
         assert item.font(0).bold() is True
 
+        panel.update_chapter_status(1, STATUS_COMPLETED)
+        assert item.font(0).bold() is False
+
     def test_highlight_section(self, qtbot):
         from pylearn.ui.toc_panel import TOCPanel
 
@@ -243,3 +318,63 @@ class TestTOCPanel:
         current = panel.currentItem()
         assert current is not None
         assert current.text(0) == "A"
+
+    def test_highlight_section_nested_and_before_first(self, qtbot):
+        from pylearn.ui.toc_panel import TOCPanel
+
+        panel = TOCPanel()
+        qtbot.addWidget(panel)
+        chapters = [
+            Chapter(
+                chapter_num=1,
+                title="Intro",
+                start_page=1,
+                end_page=20,
+                sections=[
+                    Section(
+                        title="A",
+                        level=2,
+                        page_num=1,
+                        block_index=2,
+                        children=[Section(title="A.1", level=3, page_num=1, block_index=4)],
+                    ),
+                    Section(title="B", level=2, page_num=2, block_index=10),
+                ],
+            ),
+        ]
+        panel.load_chapters(chapters)
+
+        panel.highlight_section(1, 0)
+        assert panel.currentItem() is panel.topLevelItem(0)
+        panel.highlight_section(1, 6)
+        assert panel.currentItem().text(0) == "A.1"
+        panel.highlight_section(1, 10)
+        assert panel.currentItem().text(0) == "B"
+
+    def test_highlight_section_skips_scroll_for_visible_item(self, qtbot, monkeypatch):
+        from pylearn.ui.toc_panel import TOCPanel
+
+        panel = TOCPanel()
+        qtbot.addWidget(panel)
+        panel.resize(300, 400)
+        panel.show()
+        chapters = [
+            Chapter(
+                chapter_num=1,
+                title="Intro",
+                start_page=1,
+                end_page=20,
+                sections=[
+                    Section(title="A", level=2, page_num=1, block_index=0),
+                    Section(title="B", level=2, page_num=2, block_index=10),
+                ],
+            ),
+        ]
+        panel.load_chapters(chapters)
+        panel.topLevelItem(0).setExpanded(True)
+
+        scrolled = []
+        monkeypatch.setattr(panel, "scrollToItem", lambda item, *args: scrolled.append(item))
+        panel.highlight_section(1, 10)
+        assert panel.currentItem().text(0) == "B"
+        assert scrolled == []